@@ -0,0 +1,91 @@
+from harness import Bench, benchmark
+
+from restiny.entities import Environment, Request
+from restiny.enums import AuthMode, BodyMode, BodyRawLanguage
+
+
+def _request(fields: int, body: Request.RawBody | None = None) -> Request:
+    return Request(
+        folder_id=1,
+        name='request',
+        method='POST',
+        url='{{base_url}}/items/{{item_id}}',
+        headers=[
+            Request.Header(
+                enabled=True, key=f'X-Header-{index}', value='{{token}}'
+            )
+            for index in range(fields)
+        ],
+        params=[
+            Request.Param(enabled=True, key=f'param{index}', value='{{page}}')
+            for index in range(fields)
+        ],
+        body_enabled=body is not None,
+        body=body,
+        auth_enabled=True,
+        auth_mode=AuthMode.BEARER,
+        auth=Request.BearerAuth(token='{{token}}'),
+    )
+
+
+def _variables(count: int) -> list[Environment.Variable]:
+    variables = [
+        Environment.Variable(enabled=True, key=f'var{index}', value=str(index))
+        for index in range(count)
+    ]
+    variables += [
+        Environment.Variable(
+            enabled=True, key='base_url', value='http://localhost'
+        ),
+        Environment.Variable(enabled=True, key='item_id', value='42'),
+        Environment.Variable(enabled=True, key='token', value='secret'),
+        Environment.Variable(enabled=True, key='page', value='1'),
+    ]
+    return variables
+
+
+@benchmark(rounds=10)
+def bench_resolve_variables(bench: Bench) -> None:
+    request = _request(fields=100)
+    variables = _variables(count=500)
+    bench.run(lambda: request.resolve_variables(variables))
+
+
+@benchmark(rounds=10)
+def bench_resolve_variables_large_body(bench: Bench) -> None:
+    request = _request(
+        fields=10,
+        body=Request.RawBody(
+            language=BodyRawLanguage.JSON,
+            value='{"token": "{{token}}", "page": {{page}}}\n' * 20_000,
+        ),
+    )
+    variables = _variables(count=100)
+    bench.run(lambda: request.resolve_variables(variables))
+
+
+@benchmark(rounds=20)
+def bench_to_httpx_req_raw(bench: Bench) -> None:
+    request = _request(
+        fields=100,
+        body=Request.RawBody(
+            language=BodyRawLanguage.JSON, value='{"a": 1}' * 100_000
+        ),
+    ).resolve_variables(_variables(count=0))
+    bench.run(request.to_httpx_req)
+
+
+@benchmark(rounds=20)
+def bench_to_httpx_req_urlencoded(bench: Bench) -> None:
+    request = _request(fields=10).resolve_variables(_variables(count=0))
+    request.body_enabled = True
+    request.body_mode = BodyMode.FORM_URLENCODED
+    request.body = Request.UrlEncodedFormBody(
+        fields=[
+            Request.UrlEncodedFormBody.Field(
+                enabled=True, key=f'field{index}', value=str(index)
+            )
+            for index in range(5_000)
+        ]
+    )
+    bench.run(request.to_httpx_req)
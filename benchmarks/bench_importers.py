@@ -0,0 +1,206 @@
+import json
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from harness import Bench, benchmark, make_app
+
+# Size of the synthetic inputs
+FOLDERS = 50
+REQUESTS_PER_FOLDER = 40
+
+
+def _postman_collection(name: str) -> dict:
+    return {
+        'info': {
+            'name': name,
+            'schema': 'https://schema.getpostman.com/json/collection/v2.1.0/collection.json',
+        },
+        'item': [
+            {
+                'name': f'folder {folder_index}',
+                'item': [
+                    {
+                        'name': f'request {request_index}',
+                        'request': {
+                            'method': 'POST',
+                            'url': {
+                                'raw': 'https://example.com/items',
+                                'query': [
+                                    {'key': 'page', 'value': '1'},
+                                    {'key': 'size', 'value': '20'},
+                                ],
+                            },
+                            'header': [
+                                {'key': 'Accept', 'value': 'application/json'},
+                                {'key': 'X-Trace', 'value': 'abc'},
+                            ],
+                            'body': {
+                                'mode': 'raw',
+                                'raw': json.dumps({'id': request_index}),
+                                'options': {'raw': {'language': 'json'}},
+                            },
+                            'auth': {
+                                'type': 'bearer',
+                                'bearer': [{'key': 'token', 'value': 'x'}],
+                            },
+                        },
+                    }
+                    for request_index in range(REQUESTS_PER_FOLDER)
+                ],
+            }
+            for folder_index in range(FOLDERS)
+        ],
+    }
+
+
+def _openapi_spec(title: str) -> dict:
+    item_schema = {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'name': {'type': 'string'},
+            'tags': {'type': 'array', 'items': {'type': 'string'}},
+            # Dumped unquoted to YAML (`example: 2024-01-01`), which YAML
+            # loaders parse as a date by default
+            'created': {
+                'type': 'string',
+                'format': 'date',
+                'example': date(2024, 1, 1),
+            },
+        },
+    }
+    paths = {}
+    for folder_index in range(FOLDERS):
+        for request_index in range(REQUESTS_PER_FOLDER // 2):
+            path = f'/tag{folder_index}/items{request_index}/{{id}}'
+            paths[path] = {
+                'get': {
+                    'tags': [f'tag{folder_index}'],
+                    'operationId': f'get_{folder_index}_{request_index}',
+                    'parameters': [
+                        {'name': 'X-Trace', 'in': 'header'},
+                        {'name': 'page', 'in': 'query'},
+                    ],
+                },
+                'post': {
+                    'tags': [f'tag{folder_index}'],
+                    'operationId': f'post_{folder_index}_{request_index}',
+                    'requestBody': {
+                        'content': {
+                            'application/json': {
+                                'schema': {'$ref': '#/components/schemas/Item'}
+                            }
+                        }
+                    },
+                },
+            }
+
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': title, 'version': '1.0'},
+        'servers': [{'url': 'https://example.com'}],
+        'tags': [{'name': f'tag{index}'} for index in range(FOLDERS)],
+        'paths': paths,
+        'components': {'schemas': {'Item': item_schema}},
+    }
+
+
+@benchmark(rounds=5)
+async def bench_postman_collection(bench: Bench) -> None:
+    from restiny.ui.screens import PostmanCollectionImportScreen
+
+    app = make_app()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Each round imports a collection of its own, as the root folders
+        # must have unique names
+        collection_files = []
+        for index in range(bench.rounds):
+            collection_file = Path(tmp_dir) / f'collection{index}.json'
+            collection_file.write_text(
+                json.dumps(_postman_collection(name=f'Benchmark {index}'))
+            )
+            collection_files.append(collection_file)
+        collection_files = iter(collection_files)
+
+        async with app.run_test() as pilot:
+            screen = PostmanCollectionImportScreen()
+            await app.push_screen(screen)
+            await pilot.pause()
+
+            def import_collection() -> None:
+                screen.collection_file_chooser.path = next(collection_files)
+                screen._import()
+
+            bench.run(import_collection)
+
+
+@benchmark(rounds=5)
+async def bench_openapi_spec(bench: Bench) -> None:
+    from restiny.ui.screens import OpenapiSpecImportScreen
+
+    app = make_app()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Each round imports a spec of its own (so it is never cached), as
+        # the root folders must have unique names
+        spec_files = []
+        for index in range(bench.rounds):
+            spec_file = Path(tmp_dir) / f'spec{index}.json'
+            spec_file.write_text(
+                json.dumps(
+                    _openapi_spec(title=f'Benchmark {index}'), default=str
+                )
+            )
+            spec_files.append(spec_file)
+        spec_files = iter(spec_files)
+
+        async with app.run_test() as pilot:
+            screen = OpenapiSpecImportScreen()
+            await app.push_screen(screen)
+            await pilot.pause()
+
+            async def import_spec() -> None:
+                screen.openapi_spec_file_chooser.path = next(spec_files)
+                await screen._import()
+
+            await bench.run_async(import_spec)
+
+
+@benchmark(rounds=5)
+async def bench_openapi_spec_yaml(bench: Bench) -> None:
+    import yaml
+
+    from restiny.ui.screens import OpenapiSpecImportScreen
+
+    app = make_app()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The unquoted date examples are imported into JSON bodies
+        spec_files = []
+        for index in range(bench.rounds):
+            spec_file = Path(tmp_dir) / f'spec{index}.yaml'
+            spec_file.write_text(
+                yaml.safe_dump(_openapi_spec(title=f'Benchmark {index}'))
+            )
+            spec_files.append(spec_file)
+        spec_files = iter(spec_files)
+
+        async with app.run_test() as pilot:
+            screen = OpenapiSpecImportScreen()
+            await app.push_screen(screen)
+            await pilot.pause()
+
+            async def import_spec() -> None:
+                screen.openapi_spec_file_chooser.path = next(spec_files)
+                await screen._import()
+
+            await bench.run_async(import_spec)
+
+
+@benchmark(rounds=5)
+async def bench_openapi_spec_parse_yaml(bench: Bench) -> None:
+    import yaml
+
+    from restiny.openapi import parse_spec
+
+    raw_text = yaml.safe_dump(_openapi_spec(title='Benchmark'))
+    bench.run(lambda: parse_spec(raw_text=raw_text, suffix='.yaml'))
@@ -0,0 +1,123 @@
+from harness import Bench, benchmark, make_app, seed_tree
+
+from restiny.entities import Environment, Folder, Request, Settings
+
+# Number of entities created, read, updated and deleted per round
+CRUD_SIZE = 200
+
+
+@benchmark(rounds=5)
+def bench_folders_crud(bench: Bench) -> None:
+    app = make_app()
+    repo = app.folders_repo
+
+    def crud() -> None:
+        folders = [
+            repo.create(folder=Folder(name=f'folder {index}')).data
+            for index in range(CRUD_SIZE)
+        ]
+        for folder in folders:
+            folder = repo.get_by_id(id=folder.id).data
+            folder.name = f'{folder.name} (renamed)'
+            repo.update(folder=folder)
+        repo.get_roots()
+        for folder in folders:
+            repo.delete_by_id(id=folder.id)
+
+    bench.run(crud)
+
+
+@benchmark(rounds=5)
+def bench_requests_crud(bench: Bench) -> None:
+    app = make_app()
+    repo = app.requests_repo
+    [folder_id] = seed_tree(app, folders=1, requests_per_folder=0)
+
+    def crud() -> None:
+        requests = [
+            repo.create(
+                request=Request(
+                    folder_id=folder_id,
+                    name=f'request {index}',
+                    url='https://example.com',
+                    headers=[
+                        Request.Header(enabled=True, key='Accept', value='*/*')
+                    ],
+                )
+            ).data
+            for index in range(CRUD_SIZE)
+        ]
+        for request in requests:
+            request = repo.get_by_id(id=request.id).data
+            request.url = f'{request.url}/v2'
+            repo.update(request=request)
+        repo.get_by_folder_id(folder_id=folder_id)
+        for request in requests:
+            repo.delete_by_id(id=request.id)
+
+    bench.run(crud)
+
+
+@benchmark(rounds=5)
+def bench_environments_crud(bench: Bench) -> None:
+    app = make_app()
+    repo = app.environments_repo
+    variables = [
+        Environment.Variable(enabled=True, key=f'var{index}', value='value')
+        for index in range(50)
+    ]
+
+    def crud() -> None:
+        environments = [
+            repo.create(
+                environment=Environment(
+                    name=f'environment {index}', variables=variables
+                )
+            ).data
+            for index in range(CRUD_SIZE)
+        ]
+        for environment in environments:
+            environment = repo.get_by_id(id=environment.id).data
+            environment.variables = environment.variables[:-1]
+            repo.update(environment=environment)
+        repo.get_all()
+        for environment in environments:
+            repo.delete_by_id(id=environment.id)
+
+    bench.run(crud)
+
+
+@benchmark(rounds=5)
+def bench_settings_get_set(bench: Bench) -> None:
+    app = make_app()
+    repo = app.settings_repo
+
+    def get_set() -> None:
+        for index in range(CRUD_SIZE):
+            settings = repo.get().data or Settings()
+            settings.editor_indent = index % 8
+            repo.set(settings=settings)
+
+    bench.run(get_set)
+
+
+@benchmark(rounds=10)
+def bench_requests_get_by_folder_id_large(bench: Bench) -> None:
+    app = make_app()
+    [folder_id] = seed_tree(app, folders=1, requests_per_folder=10_000)
+    bench.run(lambda: app.requests_repo.get_by_folder_id(folder_id=folder_id))
+
+
+@benchmark(rounds=20)
+def bench_requests_search_large(bench: Bench) -> None:
+    app = make_app()
+    seed_tree(app, folders=50, requests_per_folder=200)
+    bench.run(lambda: app.requests_repo.search(query='request 1'))
+
+
+@benchmark(rounds=20)
+def bench_requests_search_fuzzy_large(bench: Bench) -> None:
+    app = make_app()
+    seed_tree(app, folders=50, requests_per_folder=200)
+    # A typo, so no request matches by prefix
+    bench.run(lambda: app.requests_repo.search(query='reqest'))
@@ -0,0 +1,22 @@
+import tempfile
+
+from harness import Bench, benchmark
+from startup import measure_first_paint, measure_import
+
+
+@benchmark(rounds=5)
+def bench_import(bench: Bench) -> None:
+    with tempfile.TemporaryDirectory() as home_dir:
+        measure_first_paint(home_dir)
+        for _ in range(bench.rounds):
+            module_to_us = measure_import(home_dir)
+            bench.add_sample(module_to_us['restiny.ui.app'] / 1000)
+
+
+@benchmark(rounds=5)
+def bench_first_paint(bench: Bench) -> None:
+    with tempfile.TemporaryDirectory() as home_dir:
+        # Warm up: creates the database (migrations) and the bytecode cache
+        measure_first_paint(home_dir)
+        for _ in range(bench.rounds):
+            bench.add_sample(measure_first_paint(home_dir))
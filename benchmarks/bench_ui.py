@@ -0,0 +1,153 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+from harness import Bench, benchmark, make_app, seed_tree
+from http_server import json_items, serve
+
+# Size of the tree: folders in the root, requests in the expanded folder
+ROOT_FOLDERS = 2_000
+FOLDER_REQUESTS = 5_000
+
+
+@benchmark(rounds=5)
+async def bench_populate_children(bench: Bench) -> None:
+    app = make_app()
+    seed_tree(app, folders=ROOT_FOLDERS, requests_per_folder=0)
+    [folder_id] = seed_tree(
+        app, folders=1, requests_per_folder=FOLDER_REQUESTS, name='big'
+    )
+
+    async with app.run_test() as pilot:
+        collections_area = app.collections_area
+        collections_tree = collections_area.collections_tree
+
+        def populate() -> None:
+            collections_tree.release_children(collections_tree.root)
+            collections_area.populate_children(collections_tree.root)
+            folder_node = collections_tree.folder_node_by_id[folder_id]
+            collections_area.populate_children(folder_node)
+
+        bench.run(populate)
+        await pilot.pause()
+
+
+@benchmark(rounds=5)
+async def bench_populate_children_unchanged(bench: Bench) -> None:
+    app = make_app()
+    seed_tree(app, folders=ROOT_FOLDERS, requests_per_folder=0)
+    [folder_id] = seed_tree(
+        app, folders=1, requests_per_folder=FOLDER_REQUESTS, name='big'
+    )
+
+    async with app.run_test() as pilot:
+        collections_area = app.collections_area
+        collections_tree = collections_area.collections_tree
+        folder_node = collections_tree.folder_node_by_id[folder_id]
+        collections_area.populate_children(folder_node)
+        await pilot.pause()
+
+        def populate() -> None:
+            collections_area.populate_children(collections_tree.root)
+            collections_area.populate_children(folder_node)
+
+        bench.run(populate)
+
+
+@benchmark(rounds=5)
+async def bench_display_response_large_json(bench: Bench) -> None:
+    import httpx
+
+    content = json_items(count=5_000)
+    app = make_app()
+
+    async with app.run_test() as pilot:
+
+        async def display() -> None:
+            response = httpx.Response(
+                status_code=200,
+                headers={'Content-Type': 'application/json'},
+                content=content,
+                request=httpx.Request('GET', 'http://localhost/json'),
+            )
+            response.elapsed = timedelta(milliseconds=1)
+            app._display_response(response=response)
+            await pilot.pause()
+
+        await bench.run_async(display)
+
+
+@benchmark(rounds=10)
+async def bench_send_request(bench: Bench) -> None:
+    from restiny.entities import Request
+
+    app = make_app()
+    [folder_id] = seed_tree(app, folders=1, requests_per_folder=0)
+
+    with serve() as base_url:
+        request = app.requests_repo.create(
+            request=Request(
+                folder_id=folder_id,
+                name='items',
+                url=f'{base_url}/json?items=1000',
+            )
+        ).data
+
+        async with app.run_test() as pilot:
+            app.selected_request = request
+            app.set_request(request=request)
+            await pilot.pause()
+
+            async def send() -> None:
+                await app._send_request()
+                await pilot.pause()
+
+            await bench.run_async(send)
+
+
+@benchmark(rounds=10)
+async def bench_send_request_replayed(bench: Bench) -> None:
+    """
+    Like `bench_send_request`, but offline: the response is recorded once
+    and replayed from a cassette with no latency, so only the client and
+    the rendering are measured.
+    """
+    from restiny import http_client
+    from restiny.cassettes import Cassette, CassetteRecorder
+    from restiny.entities import Request
+
+    app = make_app()
+    [folder_id] = seed_tree(app, folders=1, requests_per_folder=0)
+
+    with tempfile.TemporaryDirectory() as cassettes_dir:
+        recorder = CassetteRecorder(path=Path(cassettes_dir) / 'items.jsonl')
+
+        async with app.run_test() as pilot:
+            with serve() as base_url:
+                request = app.requests_repo.create(
+                    request=Request(
+                        folder_id=folder_id,
+                        name='items',
+                        url=f'{base_url}/json?items=1000',
+                    )
+                ).data
+                app.selected_request = request
+                app.set_request(request=request)
+                await pilot.pause()
+
+                http_client.start_recording(recorder)
+                await app._send_request()
+                http_client.stop_recording()
+
+            await http_client.start_replaying(
+                cassette=Cassette.load(recorder.path), latency_seconds=0
+            )
+
+            async def send() -> None:
+                await app._send_request()
+                await pilot.pause()
+
+            try:
+                await bench.run_async(send)
+            finally:
+                await http_client.stop_replaying()
@@ -0,0 +1,141 @@
+"""
+Building blocks of the benchmark suite: the `@benchmark` registry, the
+`Bench` timer and helpers to build an app over an in-memory database.
+"""
+
+import gc
+import inspect
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+BENCHMARKS: dict[str, 'Benchmark'] = {}
+
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[['Bench'], None | Awaitable[None]]
+    rounds: int
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.func)
+
+
+@dataclass
+class Bench:
+    """
+    Collects the samples (ms) of a benchmark; the setup done before calling
+    `run`/`run_async` is not measured.
+    """
+
+    rounds: int
+    samples_ms: list[float] = field(default_factory=list)
+
+    def run(self, func: Callable[[], object]) -> None:
+        for _ in range(self.rounds):
+            gc.collect()
+            started_at = time.perf_counter()
+            func()
+            self.add_sample((time.perf_counter() - started_at) * 1000)
+
+    async def run_async(self, func: Callable[[], Awaitable[object]]) -> None:
+        for _ in range(self.rounds):
+            gc.collect()
+            started_at = time.perf_counter()
+            await func()
+            self.add_sample((time.perf_counter() - started_at) * 1000)
+
+    def add_sample(self, ms: float) -> None:
+        self.samples_ms.append(ms)
+
+    def summary(self) -> dict[str, float | int]:
+        return {
+            'rounds': len(self.samples_ms),
+            'min_ms': min(self.samples_ms),
+            'median_ms': statistics.median(self.samples_ms),
+            'mean_ms': statistics.fmean(self.samples_ms),
+            'max_ms': max(self.samples_ms),
+            'stdev_ms': (
+                statistics.stdev(self.samples_ms)
+                if len(self.samples_ms) > 1
+                else 0.0
+            ),
+        }
+
+
+def benchmark(rounds: int = 5):
+    """
+    Register the decorated function as a benchmark named
+    `<module>.<function>` (without the `bench_` prefixes).
+    """
+
+    def decorator(func):
+        module = func.__module__.removeprefix('bench_')
+        name = f'{module}.{func.__name__.removeprefix("bench_")}'
+        BENCHMARKS[name] = Benchmark(name=name, func=func, rounds=rounds)
+        return func
+
+    return decorator
+
+
+def make_app():
+    from restiny.data.db import DBManager
+    from restiny.data.repos import (
+        CookiesSQLRepo,
+        EnvironmentsSQLRepo,
+        FoldersSQLRepo,
+        RequestsSQLRepo,
+        SettingsSQLRepo,
+    )
+    from restiny.ui.app import RESTinyApp
+
+    db_manager = DBManager(in_memory=True)
+    db_manager.run_migrations()
+    return RESTinyApp(
+        db_manager=db_manager,
+        folders_repo=FoldersSQLRepo(db_manager=db_manager),
+        requests_repo=RequestsSQLRepo(db_manager=db_manager),
+        settings_repo=SettingsSQLRepo(db_manager=db_manager),
+        environments_repo=EnvironmentsSQLRepo(db_manager=db_manager),
+        cookies_repo=CookiesSQLRepo(db_manager=db_manager),
+    )
+
+
+def seed_tree(
+    app,
+    folders: int,
+    requests_per_folder: int,
+    parent_id: int | None = None,
+    name: str = 'folder',
+) -> list[int]:
+    """
+    Create `folders` folders (`<name> <index>`) under `parent_id`, each one
+    with `requests_per_folder` requests, in a single transaction.
+    """
+    from restiny.entities import Folder, Request
+
+    methods = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
+    folder_ids = []
+    with app.db_manager.session_scope() as session:
+        for folder_index in range(folders):
+            folder = app.folders_repo.create(
+                folder=Folder(
+                    parent_id=parent_id, name=f'{name} {folder_index}'
+                ),
+                session=session,
+            ).data
+            folder_ids.append(folder.id)
+            for request_index in range(requests_per_folder):
+                app.requests_repo.create(
+                    request=Request(
+                        folder_id=folder.id,
+                        name=f'request {request_index}',
+                        method=methods[request_index % len(methods)],
+                        url=f'https://example.com/items/{request_index}',
+                    ),
+                    session=session,
+                )
+    return folder_ids
@@ -0,0 +1,76 @@
+"""
+Local stand-in HTTP server, so the benchmarks never hit the network.
+
+Routes:
+- `GET /json?items=N`: JSON array of N objects;
+- any other path: echoes the request method and path as JSON.
+"""
+
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+@cache
+def json_items(count: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                'id': index,
+                'name': f'item {index}',
+                'active': index % 2 == 0,
+                'tags': ['alpha', 'beta', 'gamma'],
+                'owner': {'id': index % 100, 'email': f'user{index}@x.io'},
+            }
+            for index in range(count)
+        ]
+    ).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == '/json':
+            items = int(parse_qs(url.query).get('items', ['100'])[0])
+            body = json_items(items)
+        else:
+            body = json.dumps(
+                {'method': self.command, 'path': url.path}
+            ).encode()
+
+        content_length = int(self.headers.get('Content-Length', 0))
+        if content_length:
+            self.rfile.read(content_length)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@contextmanager
+def serve() -> Iterator[str]:
+    """
+    Run the server on a free local port, yielding its base URL.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address
+        yield f'http://{host}:{port}'
+    finally:
+        server.shutdown()
+        server.server_close()
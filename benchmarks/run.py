@@ -0,0 +1,149 @@
+"""
+Benchmark suite of RESTiny.
+
+Runs the benchmarks of `benchmarks/bench_*.py` offline (HTTP requests go
+to a local stand-in server) with a temporary home directory, and writes
+the results to JSON so runs of different versions can be compared.
+
+Usage:
+    python benchmarks/run.py [-k NAME] [--output results.json]
+    python benchmarks/run.py --compare base.json new.json [--threshold 10]
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = BENCHMARKS_DIR.parent
+
+
+def run(name_filters: list[str]) -> dict:
+    # Must happen before importing restiny, which creates its directories
+    # inside the home directory on import
+    home_dir = tempfile.mkdtemp(prefix='restiny-bench-')
+    os.environ['HOME'] = home_dir
+    os.environ['USERPROFILE'] = home_dir
+    sys.path[:0] = [str(ROOT_DIR), str(BENCHMARKS_DIR)]
+
+    from harness import BENCHMARKS, Bench
+
+    from restiny.__about__ import __version__
+
+    for bench_file in sorted(BENCHMARKS_DIR.glob('bench_*.py')):
+        importlib.import_module(bench_file.stem)
+
+    results = {}
+    for name, benchmark in BENCHMARKS.items():
+        if name_filters and not any(
+            name_filter in name for name_filter in name_filters
+        ):
+            continue
+
+        bench = Bench(rounds=benchmark.rounds)
+        if benchmark.is_async:
+            asyncio.run(benchmark.func(bench))
+        else:
+            benchmark.func(bench)
+
+        results[name] = bench.summary()
+        print(
+            f'{name:<50} {results[name]["median_ms"]:10.2f} ms (median of '
+            f'{results[name]["rounds"]})'
+        )
+
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': datetime.now(UTC).isoformat(timespec='seconds'),
+        'results': results,
+    }
+
+
+def compare(base: dict, new: dict, threshold: float) -> list[str]:
+    """
+    Print the change of the median of each benchmark found in both runs and
+    return the names of the ones that got slower than `threshold` percent.
+    """
+    print(
+        f'{"benchmark":<50} {base["version"]:>12} {new["version"]:>12} '
+        f'{"change":>9}'
+    )
+    regressions = []
+    for name, new_result in new['results'].items():
+        base_result = base['results'].get(name)
+        if base_result is None:
+            continue
+
+        base_ms = base_result['median_ms']
+        new_ms = new_result['median_ms']
+        change = (new_ms - base_ms) / base_ms * 100
+        is_regression = change > threshold
+        if is_regression:
+            regressions.append(name)
+        print(
+            f'{name:<50} {base_ms:9.2f} ms {new_ms:9.2f} ms {change:+8.1f}%'
+            f'{"  <- regression" if is_regression else ""}'
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '-k',
+        dest='name_filters',
+        action='append',
+        default=[],
+        help='Only run the benchmarks whose name contains it (repeatable)',
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=None,
+        help='File to write the results to',
+    )
+    parser.add_argument(
+        '--compare',
+        nargs=2,
+        type=Path,
+        metavar=('BASE', 'NEW'),
+        default=None,
+        help='Compare two results files instead of running the benchmarks',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=10.0,
+        help='Slowdown (%%) of the median taken as a regression',
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        base_file, new_file = args.compare
+        regressions = compare(
+            base=json.loads(base_file.read_text()),
+            new=json.loads(new_file.read_text()),
+            threshold=args.threshold,
+        )
+        if regressions:
+            print(f'\n{len(regressions)} regression(s) over {args.threshold}%')
+            sys.exit(1)
+        return
+
+    result = run(name_filters=args.name_filters)
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f'\nResults written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Cold start benchmark of RESTiny.
+
+Each sample runs the app in a fresh interpreter (so nothing is cached in
+`sys.modules`) with a temporary home directory, and measures:
+
+- import time: the time to import `restiny.ui.app`, from `-X importtime`;
+- time to first paint: from the interpreter start until the first screen
+  of the app is rendered (headless).
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--budget-ms 1500] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Runs inside the child interpreter; prints the time to first paint (ms)
+_FIRST_PAINT_SCRIPT = """
+import time
+
+started_at = time.perf_counter()
+
+from restiny.__main__ import build_app
+
+
+async def auto_pilot(pilot):
+    await pilot.pause()
+    print(f'first_paint_ms={(time.perf_counter() - started_at) * 1000:.1f}')
+    pilot.app.exit()
+
+
+build_app().run(headless=True, auto_pilot=auto_pilot)
+"""
+
+
+def _run_child(args: list[str], home_dir: str) -> subprocess.CompletedProcess:
+    env = {
+        **os.environ,
+        'HOME': home_dir,
+        'USERPROFILE': home_dir,
+        'PYTHONPATH': str(ROOT_DIR),
+    }
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env,
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """
+    Parse the `-X importtime` output into {module: cumulative µs}.
+    """
+    module_to_cumulative_us = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, module = line.removeprefix('import time:').split('|')
+        module_to_cumulative_us[module.strip()] = int(cumulative_us)
+    return module_to_cumulative_us
+
+
+def measure_import(home_dir: str) -> dict[str, int]:
+    result = _run_child(
+        ['-X', 'importtime', '-c', 'import restiny.ui.app'], home_dir
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_first_paint(home_dir: str) -> float:
+    result = _run_child(['-c', _FIRST_PAINT_SCRIPT], home_dir)
+    for line in result.stdout.splitlines():
+        if line.startswith('first_paint_ms='):
+            return float(line.split('=', 1)[1])
+    raise RuntimeError(f'First paint not reported:\n{result.stdout}')
+
+
+def measure_startup(runs: int = 5) -> dict:
+    with tempfile.TemporaryDirectory() as home_dir:
+        # Warm up: creates the database (migrations) and the bytecode cache
+        measure_first_paint(home_dir)
+
+        imports = [measure_import(home_dir) for _ in range(runs)]
+        first_paints = [measure_first_paint(home_dir) for _ in range(runs)]
+
+    import_ms = [
+        module_to_us['restiny.ui.app'] / 1000 for module_to_us in imports
+    ]
+    return {
+        'runs': runs,
+        'import_ms': statistics.median(import_ms),
+        'first_paint_ms': statistics.median(first_paints),
+        'modules_ms': {
+            module: us / 1000 for module, us in imports[-1].items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument(
+        '--budget-ms',
+        type=float,
+        default=None,
+        help='Fail if the median time to first paint exceeds it',
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=15,
+        help='Number of slowest imports to show',
+    )
+    args = parser.parse_args()
+
+    result = measure_startup(runs=args.runs)
+
+    print(f'Import of restiny.ui.app: {result["import_ms"]:.1f} ms (median)')
+    print(f'Time to first paint: {result["first_paint_ms"]:.1f} ms (median)')
+    print('\nSlowest imports (cumulative, last run):')
+    slowest = sorted(
+        result['modules_ms'].items(), key=lambda item: item[1], reverse=True
+    )
+    for module, ms in slowest[: args.top]:
+        print(f'{ms:10.1f} ms  {module}')
+
+    if (
+        args.budget_ms is not None
+        and result['first_paint_ms'] > args.budget_ms
+    ):
+        print(
+            f'\nOver budget: {result["first_paint_ms"]:.1f} ms > '
+            f'{args.budget_ms:.1f} ms'
+        )
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
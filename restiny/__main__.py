@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -11,17 +12,29 @@ def prepare_textual_dev_run() -> None:
         sys.path.append(str(MODULE_PARENT_DIR))
 
 
-def run_app() -> None:
+def build_app():
     from restiny.data.db import DBManager
     from restiny.data.repos import (
+        CookiesSQLRepo,
         EnvironmentsSQLRepo,
         FoldersSQLRepo,
         RequestsSQLRepo,
         SettingsSQLRepo,
     )
+    from restiny.logger import get_logger
     from restiny.ui.app import RESTinyApp
 
-    db_manager = DBManager()
+    # e.g. `RESTINY_SLOW_QUERY_MS=20 restiny` logs the queries slower than 20ms
+    raw_slow_query_ms = os.environ.get('RESTINY_SLOW_QUERY_MS')
+    try:
+        slow_query_ms = float(raw_slow_query_ms) if raw_slow_query_ms else None
+    except ValueError:
+        get_logger().warning(
+            f'Ignoring RESTINY_SLOW_QUERY_MS={raw_slow_query_ms!r}; '
+            'expected a number of milliseconds'
+        )
+        slow_query_ms = None
+    db_manager = DBManager(slow_query_ms=slow_query_ms)
     db_manager.run_migrations()
     app = RESTinyApp(
         db_manager=db_manager,
@@ -29,7 +42,13 @@ def run_app() -> None:
         requests_repo=RequestsSQLRepo(db_manager=db_manager),
         settings_repo=SettingsSQLRepo(db_manager=db_manager),
         environments_repo=EnvironmentsSQLRepo(db_manager=db_manager),
+        cookies_repo=CookiesSQLRepo(db_manager=db_manager),
     )
+    return app
+
+
+def run_app() -> None:
+    app = build_app()
     app.run()
 
 
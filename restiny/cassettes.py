@@ -0,0 +1,204 @@
+"""
+Cassettes: responses recorded from real sends and replayed later through an
+`httpx.MockTransport`, with no network and deterministic latencies.
+
+A cassette is a JSON Lines file with one request/response interaction per
+line; the bodies are zlib compressed and base64 encoded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import zlib
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+CASSETTE_VERSION = 1
+
+# The recorded bodies are decoded, so these don't apply to them anymore
+_BODY_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+class CassetteMissError(httpx.TransportError):
+    """
+    The request being replayed isn't in the cassette.
+    """
+
+
+def _encode_body(content: bytes) -> str:
+    return base64.b64encode(zlib.compress(content)).decode()
+
+
+def _decode_body(encoded: str) -> bytes:
+    return zlib.decompress(base64.b64decode(encoded))
+
+
+def _request_body_digest(request: httpx.Request) -> str | None:
+    try:
+        content = request.content
+    except httpx.RequestNotRead:
+        # Streamed bodies (e.g. compressed files) can't be read again
+        return None
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class Interaction:
+    method: str
+    url: str
+    body_digest: str | None
+    status_code: int
+    http_version: str
+    headers: list[tuple[str, str]]
+    body: bytes
+    elapsed_seconds: float
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                'version': CASSETTE_VERSION,
+                'request': {
+                    'method': self.method,
+                    'url': self.url,
+                    'body_digest': self.body_digest,
+                },
+                'response': {
+                    'status_code': self.status_code,
+                    'http_version': self.http_version,
+                    'headers': self.headers,
+                    'body': _encode_body(self.body),
+                    'elapsed_seconds': self.elapsed_seconds,
+                },
+                'recorded_at': datetime.now(UTC).isoformat(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> Interaction:
+        interaction = json.loads(line)
+        request = interaction['request']
+        response = interaction['response']
+        return cls(
+            method=request['method'],
+            url=request['url'],
+            body_digest=request['body_digest'],
+            status_code=response['status_code'],
+            http_version=response['http_version'],
+            headers=[tuple(header) for header in response['headers']],
+            body=_decode_body(response['body']),
+            elapsed_seconds=response['elapsed_seconds'],
+        )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> Interaction:
+        # Recorded under the request that was sent, not the redirected one
+        request = (
+            response.history[0].request
+            if response.history
+            else response.request
+        )
+        return cls(
+            method=request.method,
+            url=str(request.url),
+            body_digest=_request_body_digest(request),
+            status_code=response.status_code,
+            http_version=response.http_version,
+            headers=[
+                (key, value)
+                for key, value in response.headers.multi_items()
+                if key.lower() not in _BODY_HEADERS
+            ],
+            body=response.content,
+            elapsed_seconds=response.elapsed.total_seconds(),
+        )
+
+
+class CassetteRecorder:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.interactions_count = 0
+
+    def record(self, response: httpx.Response) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('a') as file:
+            file.write(Interaction.from_response(response).to_json() + '\n')
+        self.interactions_count += 1
+
+
+class Cassette:
+    """
+    The interactions of a cassette file, matched by method, URL and request
+    body (or by method and URL alone when no body matches).
+
+    The interactions of the same request are replayed in the recorded
+    order; once they run out, the last one is repeated.
+    """
+
+    def __init__(self, interactions: list[Interaction]) -> None:
+        self.interactions = interactions
+        self._by_key: dict[tuple, deque[Interaction]] = defaultdict(deque)
+        for interaction in interactions:
+            self._by_key[
+                (interaction.method, interaction.url, interaction.body_digest)
+            ].append(interaction)
+            if interaction.body_digest is not None:
+                self._by_key[
+                    (interaction.method, interaction.url, None)
+                ].append(interaction)
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        with path.open() as file:
+            return cls(
+                [Interaction.from_json(line) for line in file if line.strip()]
+            )
+
+    def match(self, request: httpx.Request) -> Interaction | None:
+        for body_digest in (_request_body_digest(request), None):
+            interactions = self._by_key.get(
+                (request.method, str(request.url), body_digest)
+            )
+            if interactions:
+                if len(interactions) > 1:
+                    return interactions.popleft()
+                return interactions[0]
+        return None
+
+    def make_transport(
+        self, latency_seconds: float | None = None
+    ) -> httpx.MockTransport:
+        """
+        A transport answering from the cassette, after the recorded latency
+        of each response or, if given, after a fixed `latency_seconds`.
+        """
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            interaction = self.match(request)
+            if interaction is None:
+                raise CassetteMissError(
+                    f'No recorded response to {request.method} {request.url}',
+                    request=request,
+                )
+
+            await asyncio.sleep(
+                interaction.elapsed_seconds
+                if latency_seconds is None
+                else latency_seconds
+            )
+            # As a stream rather than `content`, for the client to close it
+            # once read and time it, like a response off the network
+            return httpx.Response(
+                status_code=interaction.status_code,
+                headers=interaction.headers,
+                stream=httpx.ByteStream(interaction.body),
+                extensions={'http_version': interaction.http_version.encode()},
+            )
+
+        return httpx.MockTransport(handler)
@@ -0,0 +1,135 @@
+"""
+Compression of request bodies (`Content-Encoding`).
+
+gzip and deflate come with the standard library; brotli and zstd need the
+optional `brotli` (or `brotlicffi`) and `zstandard` packages
+(`pip install restiny[compression]`), which `httpx` also uses to decode
+responses in those encodings.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from restiny.enums import ContentEncoding
+
+# Read size of the file bodies, compressed and sent one chunk at a time
+FILE_CHUNK_SIZE = 64 * 1024
+
+# Key of the `httpx.Request.extensions` with the `CompressionInfo` of the body
+COMPRESSION_INFO_EXTENSION = 'restiny.compression'
+
+
+@dataclass
+class CompressionInfo:
+    encoding: ContentEncoding
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.raw_bytes:
+            return None
+        return self.compressed_bytes / self.raw_bytes
+
+
+class _Compressor:
+    def __init__(
+        self,
+        compress: Callable[[bytes], bytes],
+        flush: Callable[[], bytes],
+    ) -> None:
+        self.compress = compress
+        self.flush = flush
+
+
+def _brotli_module():
+    try:
+        import brotli
+    except ImportError:
+        import brotlicffi as brotli
+
+    return brotli
+
+
+def is_encoding_available(encoding: ContentEncoding) -> bool:
+    try:
+        if encoding == ContentEncoding.BROTLI:
+            _brotli_module()
+        elif encoding == ContentEncoding.ZSTD:
+            import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _make_compressor(encoding: ContentEncoding) -> _Compressor:
+    if encoding == ContentEncoding.GZIP:
+        compressobj = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        return _Compressor(compressobj.compress, compressobj.flush)
+    elif encoding == ContentEncoding.DEFLATE:
+        # HTTP "deflate" is the zlib format (RFC 9110), not raw deflate
+        compressobj = zlib.compressobj()
+        return _Compressor(compressobj.compress, compressobj.flush)
+    elif encoding == ContentEncoding.BROTLI:
+        compressor = _brotli_module().Compressor()
+        return _Compressor(compressor.process, compressor.finish)
+    elif encoding == ContentEncoding.ZSTD:
+        import zstandard
+
+        compressobj = zstandard.ZstdCompressor().compressobj()
+        return _Compressor(compressobj.compress, compressobj.flush)
+
+    raise ValueError(f'Unsupported content encoding: {encoding}')
+
+
+def compress(data: bytes, encoding: ContentEncoding) -> bytes:
+    compressor = _make_compressor(encoding)
+    return compressor.compress(data) + compressor.flush()
+
+
+async def compress_file(
+    file: Path, encoding: ContentEncoding, info: CompressionInfo
+) -> AsyncIterator[bytes]:
+    """
+    Stream `file` compressed, one chunk at a time, so it's never fully held
+    in memory; `info` is updated as the chunks are sent.
+    """
+    compressor = _make_compressor(encoding)
+    with file.open('rb') as stream:
+        while chunk := stream.read(FILE_CHUNK_SIZE):
+            info.raw_bytes += len(chunk)
+            compressed_chunk = compressor.compress(chunk)
+            if compressed_chunk:
+                info.compressed_bytes += len(compressed_chunk)
+                yield compressed_chunk
+
+    last_chunk = compressor.flush()
+    info.compressed_bytes += len(last_chunk)
+    yield last_chunk
+
+
+class CompressedFileContent:
+    """
+    A file body compressed as it's sent. Unlike the generator of
+    `compress_file`, it can be iterated again, so the request can be re-sent
+    (e.g. answering an auth challenge or following a 307/308 redirect); each
+    send reopens the file and counts its bytes again in `info`.
+    """
+
+    def __init__(
+        self, file: Path, encoding: ContentEncoding, info: CompressionInfo
+    ) -> None:
+        self.file = file
+        self.encoding = encoding
+        self.info = info
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        self.info.raw_bytes = 0
+        self.info.compressed_bytes = 0
+        return compress_file(
+            file=self.file, encoding=self.encoding, info=self.info
+        )
@@ -15,7 +15,14 @@ CONF_DIR.mkdir(parents=True, exist_ok=True)
 DB_FILE = CONF_DIR / 'restiny.sqlite3'
 LOG_FILE = CONF_DIR / 'restiny.log'
 
+CACHE_DIR = CONF_DIR / 'cache'
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+PROFILES_DIR = CONF_DIR / 'profiles'
+
+CASSETTES_DIR = CONF_DIR / 'cassettes'
+
 DOWNLOADS_DIR = HOME_DIR / 'Downloads'
 if not DOWNLOADS_DIR.exists():
     DOWNLOADS_DIR = CONF_DIR / 'downloads'
-    DOWNLOADS_DIR.mkdir()
+    DOWNLOADS_DIR.mkdir(exist_ok=True)
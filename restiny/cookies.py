@@ -0,0 +1,145 @@
+"""
+Cookie jars persisted per environment, so sessions survive restarts and the
+cookies of an environment (e.g. staging) are never sent to another one
+(e.g. prod).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from http.cookiejar import Cookie as JarCookie
+from typing import TYPE_CHECKING
+
+from restiny.entities import Cookie
+from restiny.logger import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+    from restiny.data.repos import CookiesSQLRepo
+
+
+logger = get_logger()
+
+
+def _from_jar_cookie(jar_cookie: JarCookie, environment_id: int) -> Cookie:
+    return Cookie(
+        environment_id=environment_id,
+        name=jar_cookie.name,
+        value=jar_cookie.value or '',
+        domain=jar_cookie.domain,
+        path=jar_cookie.path,
+        expires_at=datetime.fromtimestamp(jar_cookie.expires, UTC)
+        if jar_cookie.expires is not None
+        else None,
+        secure=jar_cookie.secure,
+        http_only=jar_cookie.has_nonstandard_attr('HttpOnly'),
+    )
+
+
+def _to_jar_cookie(cookie: Cookie) -> JarCookie:
+    return JarCookie(
+        version=0,
+        name=cookie.name,
+        value=cookie.value,
+        port=None,
+        port_specified=False,
+        domain=cookie.domain,
+        # Cookies set with a `Domain` attribute are stored with a leading
+        # dot and also match the subdomains
+        domain_specified=cookie.domain.startswith('.'),
+        domain_initial_dot=cookie.domain.startswith('.'),
+        path=cookie.path,
+        path_specified=True,
+        secure=cookie.secure,
+        expires=int(cookie.expires_at.timestamp())
+        if cookie.expires_at
+        else None,
+        discard=cookie.expires_at is None,
+        comment=None,
+        comment_url=None,
+        rest={'HttpOnly': None} if cookie.http_only else {},
+    )
+
+
+def _snapshot(cookies: httpx.Cookies) -> frozenset[tuple]:
+    return frozenset(
+        (
+            jar_cookie.domain,
+            jar_cookie.path,
+            jar_cookie.name,
+            jar_cookie.value,
+            jar_cookie.expires,
+        )
+        for jar_cookie in cookies.jar
+    )
+
+
+class CookieJars:
+    """
+    One jar per environment, loaded from the database on first use and
+    saved back only when its cookies changed.
+    """
+
+    def __init__(self, cookies_repo: CookiesSQLRepo) -> None:
+        self.cookies_repo = cookies_repo
+        self._jar_by_environment_id: dict[int, httpx.Cookies] = {}
+        self._saved_snapshot_by_environment_id: dict[int, frozenset] = {}
+        self._pruned = False
+
+    def get(self, environment_id: int) -> httpx.Cookies:
+        import httpx
+
+        cookies = self._jar_by_environment_id.get(environment_id)
+        if cookies is not None:
+            return cookies
+
+        if not self._pruned:
+            self._pruned = True
+            self.cookies_repo.delete_expired()
+
+        cookies = httpx.Cookies()
+        resp = self.cookies_repo.get_by_environment_id(
+            environment_id=environment_id
+        )
+        if resp.ok:
+            for cookie in resp.data:
+                cookies.jar.set_cookie(_to_jar_cookie(cookie))
+        else:
+            logger.error(
+                f'Failed to load the cookies of environment {environment_id}'
+            )
+
+        self._jar_by_environment_id[environment_id] = cookies
+        self._saved_snapshot_by_environment_id[environment_id] = _snapshot(
+            cookies
+        )
+        return cookies
+
+    def save(self, environment_id: int) -> None:
+        cookies = self._jar_by_environment_id.get(environment_id)
+        if cookies is None:
+            return
+
+        cookies.jar.clear_expired_cookies()
+        snapshot = _snapshot(cookies)
+        if snapshot == self._saved_snapshot_by_environment_id.get(
+            environment_id
+        ):
+            return
+
+        resp = self.cookies_repo.replace_by_environment_id(
+            environment_id=environment_id,
+            cookies=[
+                _from_jar_cookie(
+                    jar_cookie=jar_cookie, environment_id=environment_id
+                )
+                for jar_cookie in cookies.jar
+            ],
+        )
+        if resp.ok:
+            self._saved_snapshot_by_environment_id[environment_id] = snapshot
+        else:
+            logger.error(
+                f'Failed to save the cookies of environment {environment_id}'
+            )
@@ -4,11 +4,14 @@ from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 from restiny.consts import DB_FILE
+from restiny.data.instrumentation import QueryInstrumentation
 from restiny.data.sql import SQL_DIR
 
 
 class DBManager:
-    def __init__(self, in_memory: bool = False) -> None:
+    def __init__(
+        self, in_memory: bool = False, slow_query_ms: float | None = None
+    ) -> None:
         self.in_memory = in_memory
 
         if self.in_memory:
@@ -27,6 +30,13 @@ class DBManager:
             cursor.execute('PRAGMA foreign_keys=ON')
             cursor.close()
 
+        # Opt-in: only runs when logging slow queries or while profiling
+        self.query_instrumentation = QueryInstrumentation(
+            engine=self.engine, slow_query_ms=slow_query_ms
+        )
+        if slow_query_ms is not None:
+            self.query_instrumentation.start()
+
     @contextmanager
     def session_scope(self):
         session = self.SessionMaker()
@@ -40,8 +50,6 @@ class DBManager:
             session.close()
 
     def run_migrations(self) -> None:
-        version_in_db = self._get_version()
-
         sql_scripts = sorted(
             SQL_DIR.glob('[0-9]*_*.sql'),
             key=lambda path: int(path.stem.split('_', 1)[0]),
@@ -51,6 +59,13 @@ class DBManager:
                 f'No SQL files found in {SQL_DIR} - database cannot be initialized'
             )
 
+        # Usual case on startup: the database is up to date, so nothing but
+        # the `user_version` pragma is read
+        version_in_db = self._get_version()
+        latest_version = int(sql_scripts[-1].stem.split('_', 1)[0])
+        if version_in_db >= latest_version:
+            return
+
         for sql_script in sql_scripts:
             version_in_script = int(sql_script.stem.split('_', 1)[0])
             if version_in_script <= version_in_db:
@@ -68,6 +83,6 @@ class DBManager:
             raw.execute(f'PRAGMA user_version = {new_version}')
 
     def _get_version(self) -> int:
-        with self.session_scope() as session:
-            result = session.execute(text('PRAGMA user_version'))
+        with self.engine.connect() as connection:
+            result = connection.execute(text('PRAGMA user_version'))
             return int(result.scalar_one()) or 0
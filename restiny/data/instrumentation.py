@@ -0,0 +1,123 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from restiny.logger import get_logger
+
+logger = get_logger()
+
+
+@dataclass
+class StatementStats:
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count
+
+
+class QueryInstrumentation:
+    """
+    Opt-in instrumentation of the SQL statements run by an engine: counts
+    and latency per statement, and a log of the ones slower than
+    `slow_query_ms`.
+
+    The event listeners are only attached while it is running, so it costs
+    nothing when stopped.
+    """
+
+    def __init__(self, engine: Engine, slow_query_ms: float | None = None):
+        self.engine = engine
+        self.slow_query_ms = slow_query_ms
+        self.queries_count = 0
+        self._stats_by_statement: dict[str, StatementStats] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return event.contains(
+            self.engine, 'before_cursor_execute', self._before_cursor_execute
+        )
+
+    @property
+    def statements(self) -> list[StatementStats]:
+        return sorted(
+            self._stats_by_statement.values(),
+            key=lambda stats: stats.total_ms,
+            reverse=True,
+        )
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+
+        event.listen(
+            self.engine, 'before_cursor_execute', self._before_cursor_execute
+        )
+        event.listen(
+            self.engine, 'after_cursor_execute', self._after_cursor_execute
+        )
+
+    def stop(self) -> None:
+        if not self.is_running:
+            return
+
+        event.remove(
+            self.engine, 'before_cursor_execute', self._before_cursor_execute
+        )
+        event.remove(
+            self.engine, 'after_cursor_execute', self._after_cursor_execute
+        )
+
+    def reset(self) -> None:
+        self.queries_count = 0
+        self._stats_by_statement = {}
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        conn.info.setdefault('query_started_at', []).append(
+            time.perf_counter()
+        )
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        started_at_stack = conn.info.get('query_started_at')
+        if not started_at_stack:
+            # Started before the listeners were attached
+            return
+
+        elapsed_ms = (time.perf_counter() - started_at_stack.pop()) * 1000
+
+        self.queries_count += 1
+        stats = self._stats_by_statement.get(statement)
+        if stats is None:
+            stats = self._stats_by_statement[statement] = StatementStats(
+                statement=statement
+            )
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+        if self.slow_query_ms is not None and elapsed_ms > self.slow_query_ms:
+            # Without the parameters, as they hold secrets (e.g. tokens)
+            logger.warning(
+                f'Slow query ({elapsed_ms:.1f} ms): '
+                f'{" ".join(statement.split())}'
+            )
+
+
+def format_statements(statements: list[StatementStats]) -> str:
+    lines = [f'{"count":>7} {"total ms":>10} {"mean ms":>10} {"max ms":>10}']
+    for stats in statements:
+        lines.append(
+            f'{stats.count:>7} {stats.total_ms:>10.1f} '
+            f'{stats.mean_ms:>10.1f} {stats.max_ms:>10.1f}  '
+            f'{" ".join(stats.statement.split())}'
+        )
+    return '\n'.join(lines) + '\n'
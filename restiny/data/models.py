@@ -57,6 +57,13 @@ class SQLRequest(SQLModelBase):
     option_follow_redirects: Mapped[bool] = mapped_column(nullable=False)
     option_verify_ssl: Mapped[bool] = mapped_column(nullable=False)
     option_attach_cookies: Mapped[bool] = mapped_column(nullable=False)
+    option_http2: Mapped[bool] = mapped_column(nullable=False)
+    option_http_cache: Mapped[bool] = mapped_column(nullable=False)
+    option_compress_body: Mapped[str] = mapped_column(nullable=False)
+    option_retry: Mapped[str | None] = mapped_column(nullable=True)
+
+    import_fingerprint: Mapped[str | None] = mapped_column(nullable=True)
+    import_checksum: Mapped[str | None] = mapped_column(nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(),
@@ -79,6 +86,9 @@ class SQLSettings(SQLModelBase):
     theme: Mapped[str] = mapped_column(nullable=False)
     editor_theme: Mapped[str] = mapped_column(nullable=False)
     editor_indent: Mapped[int] = mapped_column(nullable=False)
+    host_max_in_flight: Mapped[int] = mapped_column(nullable=False)
+    host_rate_limit: Mapped[float] = mapped_column(nullable=False)
+    host_rate_burst: Mapped[int] = mapped_column(nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(),
@@ -112,3 +122,34 @@ class SQLEnvironment(SQLModelBase):
         onupdate=func.current_timestamp(),
         nullable=False,
     )
+
+
+class SQLCookie(SQLModelBase):
+    __tablename__ = 'cookies'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    environment_id: Mapped[int] = mapped_column(
+        ForeignKey('environments.id'), nullable=False
+    )
+
+    name: Mapped[str] = mapped_column(nullable=False)
+    value: Mapped[str] = mapped_column(nullable=False)
+    domain: Mapped[str] = mapped_column(nullable=False)
+    path: Mapped[str] = mapped_column(nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(), nullable=True
+    )
+    secure: Mapped[bool] = mapped_column(nullable=False)
+    http_only: Mapped[bool] = mapped_column(nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=func.current_timestamp(),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+        nullable=False,
+    )
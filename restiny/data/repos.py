@@ -1,29 +1,72 @@
 import json
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
-from datetime import UTC
+from datetime import UTC, datetime
+from difflib import SequenceMatcher
 from enum import StrEnum
 from functools import wraps
 from typing import Generic, TypeVar
 
-from sqlalchemy import case, select
+from sqlalchemy import case, delete, func, or_, select, text, tuple_
 from sqlalchemy.exc import IntegrityError, InterfaceError, OperationalError
 from sqlalchemy.orm import Session
 
 from restiny.data.db import DBManager
 from restiny.data.models import (
+    SQLCookie,
     SQLEnvironment,
     SQLFolder,
     SQLRequest,
     SQLSettings,
 )
-from restiny.entities import Environment, Folder, Request, Settings
+from restiny.entities import (
+    Cookie,
+    Environment,
+    Folder,
+    Request,
+    Settings,
+)
+from restiny.enums import HTTPMethod
 from restiny.logger import get_logger
 
 logger = get_logger()
 
+_METHOD_ORDER = {
+    method.value: index for index, method in enumerate(HTTPMethod)
+}
+
+# Requests sharing trigrams with the searched terms that are scored, and
+# the score (0 to 1) of the ones kept
+_FUZZY_SEARCH_MAX_CANDIDATES = 200
+_FUZZY_SEARCH_MIN_SCORE = 0.75
+
+
+def _fuzzy_score(terms: list[str], text: str) -> float:
+    """
+    Mean over the terms of the similarity with the closest word of `text`.
+    """
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        return 0
+
+    score = 0
+    for term in terms:
+        score += max(
+            1
+            if word.startswith(term)
+            else SequenceMatcher(a=term, b=word).ratio()
+            for word in words
+        )
+    return score / len(terms)
+
+
+def _utc_now() -> datetime:
+    # Naive, to compare with the naive UTC timestamps stored by SQLite
+    return datetime.now(UTC).replace(tzinfo=None)
+
 
 def safe_repo(func):
     @wraps(func)
@@ -124,6 +167,19 @@ class FoldersSQLRepo(SQLRepoBase):
             ]
             return RepoResp(data=folders)
 
+    @safe_repo
+    def get_all(
+        self, session: Session | None = None
+    ) -> RepoResp[list[Folder]]:
+        with self._ensure_session(session) as session:
+            sql_folders = session.scalars(
+                select(SQLFolder).order_by(SQLFolder.name.asc())
+            ).all()
+            folders = [
+                self._sql_to_folder(sql_folder) for sql_folder in sql_folders
+            ]
+            return RepoResp(data=folders)
+
     @safe_repo
     def get_by_id(
         self, id: int, session: Session | None = None
@@ -212,6 +268,64 @@ class RequestsSQLRepo(SQLRepoBase):
             ]
             return RepoResp(data=requests)
 
+    @safe_repo
+    def get_page_by_folder_id(
+        self,
+        folder_id: int,
+        limit: int,
+        after_id: int | None = None,
+        session: Session | None = None,
+    ) -> RepoResp[list[Request]]:
+        """
+        Page through the requests of a folder ordered by method and name,
+        starting right after the `after_id` request (keyset pagination).
+        """
+        sort_key = (
+            case(_METHOD_ORDER, value=SQLRequest.method),
+            func.lower(SQLRequest.name),
+            SQLRequest.id,
+        )
+
+        with self._ensure_session(session) as session:
+            query = select(SQLRequest).where(SQLRequest.folder_id == folder_id)
+            if after_id is not None:
+                after = session.get(SQLRequest, after_id)
+                if after is None:
+                    return RepoResp(status=RepoStatus.NOT_FOUND)
+
+                after_sort_key = (
+                    _METHOD_ORDER[after.method],
+                    func.lower(after.name),
+                    after.id,
+                )
+                query = query.where(
+                    tuple_(*sort_key) > tuple_(*after_sort_key)
+                )
+            sql_requests = session.scalars(
+                query.order_by(*sort_key).limit(limit)
+            ).all()
+            requests = [
+                self._sql_to_request(sql_request)
+                for sql_request in sql_requests
+            ]
+            return RepoResp(data=requests)
+
+    @safe_repo
+    def get_by_folder_ids(
+        self, folder_ids: list[int], session: Session | None = None
+    ) -> RepoResp[list[Request]]:
+        with self._ensure_session(session) as session:
+            sql_requests = session.scalars(
+                select(SQLRequest)
+                .where(SQLRequest.folder_id.in_(folder_ids))
+                .order_by(SQLRequest.name.asc())
+            ).all()
+            requests = [
+                self._sql_to_request(sql_request)
+                for sql_request in sql_requests
+            ]
+            return RepoResp(data=requests)
+
     @safe_repo
     def get_by_id(
         self, id: int, session: Session | None = None
@@ -225,6 +339,97 @@ class RequestsSQLRepo(SQLRepoBase):
             request = self._sql_to_request(sql_request)
             return RepoResp(data=request)
 
+    @safe_repo
+    def search(
+        self, query: str, limit: int = 50, session: Session | None = None
+    ) -> RepoResp[list[Request]]:
+        """
+        Full-text search (prefix match of every term) over the requests name,
+        url, headers and body; the best ranked requests come first.
+
+        When that finds less than `limit` requests, it's followed by a fuzzy
+        search over the name and url, for words close to the terms (e.g.
+        with a typo). Its candidates share at least a trigram with the
+        terms, so terms under 3 characters or with a typo in every trigram
+        only match by prefix.
+        """
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return RepoResp(data=[])
+        match_query = ' '.join(f'"{term}"*' for term in terms)
+
+        with self._ensure_session(session) as session:
+            request_ids = session.scalars(
+                text(
+                    'SELECT rowid FROM requests_fts '
+                    'WHERE requests_fts MATCH :match_query '
+                    # Weights of the name, url, headers and body columns
+                    'ORDER BY bm25(requests_fts, 10.0, 5.0, 2.0, 1.0) '
+                    'LIMIT :limit'
+                ),
+                {'match_query': match_query, 'limit': limit},
+            ).all()
+            if len(request_ids) < limit:
+                request_ids = request_ids + self._fuzzy_search_ids(
+                    terms=terms,
+                    limit=limit - len(request_ids),
+                    exclude_ids=set(request_ids),
+                    session=session,
+                )
+            sql_requests = session.scalars(
+                select(SQLRequest).where(SQLRequest.id.in_(request_ids))
+            ).all()
+            id_to_request = {
+                sql_request.id: self._sql_to_request(sql_request)
+                for sql_request in sql_requests
+            }
+            requests = [
+                id_to_request[request_id]
+                for request_id in request_ids
+                if request_id in id_to_request
+            ]
+            return RepoResp(data=requests)
+
+    def _fuzzy_search_ids(
+        self,
+        terms: list[str],
+        limit: int,
+        exclude_ids: set[int],
+        session: Session,
+    ) -> list[int]:
+        terms = [term.lower() for term in terms]
+        trigrams = {
+            term[index : index + 3]
+            for term in terms
+            for index in range(len(term) - 2)
+        }
+        if not trigrams:
+            return []
+        match_query = ' OR '.join(f'"{trigram}"' for trigram in trigrams)
+
+        candidates = session.execute(
+            text(
+                'SELECT rowid, name, url FROM requests_trigram_fts '
+                'WHERE requests_trigram_fts MATCH :match_query '
+                'ORDER BY bm25(requests_trigram_fts, 2.0, 1.0) '
+                'LIMIT :limit'
+            ),
+            {
+                'match_query': match_query,
+                'limit': _FUZZY_SEARCH_MAX_CANDIDATES,
+            },
+        ).all()
+        scored_ids = []
+        for request_id, name, url in candidates:
+            if request_id in exclude_ids:
+                continue
+            score = _fuzzy_score(terms=terms, text=f'{name} {url}')
+            if score >= _FUZZY_SEARCH_MIN_SCORE:
+                scored_ids.append((score, request_id))
+        # Stable, so the ties keep their bm25 order
+        scored_ids.sort(key=lambda scored_id: scored_id[0], reverse=True)
+        return [request_id for _, request_id in scored_ids[:limit]]
+
     @safe_repo
     def create(
         self, request: Request, session: Session | None = None
@@ -285,6 +490,12 @@ class RequestsSQLRepo(SQLRepoBase):
             SQLRequest.option_follow_redirects.key,
             SQLRequest.option_verify_ssl.key,
             SQLRequest.option_attach_cookies.key,
+            SQLRequest.option_http2.key,
+            SQLRequest.option_http_cache.key,
+            SQLRequest.option_compress_body.key,
+            SQLRequest.option_retry.key,
+            SQLRequest.import_fingerprint.key,
+            SQLRequest.import_checksum.key,
         ]
 
     def _sql_to_request(self, sql_request: SQLRequest) -> Request:
@@ -307,7 +518,15 @@ class RequestsSQLRepo(SQLRepoBase):
                 follow_redirects=sql_request.option_follow_redirects,
                 verify_ssl=sql_request.option_verify_ssl,
                 attach_cookies=sql_request.option_attach_cookies,
+                http2=sql_request.option_http2,
+                http_cache=sql_request.option_http_cache,
+                compress_body=sql_request.option_compress_body,
+                retry=json.loads(sql_request.option_retry)
+                if sql_request.option_retry
+                else Request.RetryPolicy(),
             ),
+            import_fingerprint=sql_request.import_fingerprint,
+            import_checksum=sql_request.import_checksum,
             created_at=sql_request.created_at.replace(tzinfo=UTC),
             updated_at=sql_request.updated_at.replace(tzinfo=UTC),
         )
@@ -339,6 +558,12 @@ class RequestsSQLRepo(SQLRepoBase):
             option_follow_redirects=request.options.follow_redirects,
             option_verify_ssl=request.options.verify_ssl,
             option_attach_cookies=request.options.attach_cookies,
+            option_http2=request.options.http2,
+            option_http_cache=request.options.http_cache,
+            option_compress_body=request.options.compress_body,
+            option_retry=json.dumps(request.options.retry.model_dump()),
+            import_fingerprint=request.import_fingerprint,
+            import_checksum=request.import_checksum,
             created_at=request.created_at,
             updated_at=request.updated_at,
         )
@@ -385,6 +610,9 @@ class SettingsSQLRepo(SQLRepoBase):
             SQLSettings.theme.key,
             SQLSettings.editor_theme.key,
             SQLSettings.editor_indent.key,
+            SQLSettings.host_max_in_flight.key,
+            SQLSettings.host_rate_limit.key,
+            SQLSettings.host_rate_burst.key,
         ]
 
     def _sql_to_settings(self, sql_settings: SQLSettings) -> Settings:
@@ -393,6 +621,9 @@ class SettingsSQLRepo(SQLRepoBase):
             theme=sql_settings.theme,
             editor_theme=sql_settings.editor_theme,
             editor_indent=sql_settings.editor_indent,
+            host_max_in_flight=sql_settings.host_max_in_flight,
+            host_rate_limit=sql_settings.host_rate_limit,
+            host_rate_burst=sql_settings.host_rate_burst,
             created_at=sql_settings.created_at.replace(tzinfo=UTC),
             updated_at=sql_settings.updated_at.replace(tzinfo=UTC),
         )
@@ -403,6 +634,9 @@ class SettingsSQLRepo(SQLRepoBase):
             theme=settings.theme,
             editor_theme=settings.editor_theme,
             editor_indent=settings.editor_indent,
+            host_max_in_flight=settings.host_max_in_flight,
+            host_rate_limit=settings.host_rate_limit,
+            host_rate_burst=settings.host_rate_burst,
             created_at=settings.created_at,
             updated_at=settings.updated_at,
         )
@@ -517,3 +751,102 @@ class EnvironmentsSQLRepo(SQLRepoBase):
             created_at=environment.created_at,
             updated_at=environment.updated_at,
         )
+
+
+class CookiesSQLRepo(SQLRepoBase):
+    @safe_repo
+    def get_by_environment_id(
+        self, environment_id: int, session: Session | None = None
+    ) -> RepoResp[list[Cookie]]:
+        with self._ensure_session(session) as session:
+            sql_cookies = session.scalars(
+                select(SQLCookie)
+                .where(
+                    SQLCookie.environment_id == environment_id,
+                    or_(
+                        SQLCookie.expires_at.is_(None),
+                        SQLCookie.expires_at > _utc_now(),
+                    ),
+                )
+                .order_by(
+                    SQLCookie.domain.asc(),
+                    SQLCookie.path.asc(),
+                    SQLCookie.name.asc(),
+                )
+            ).all()
+            cookies = [
+                self._sql_to_cookie(sql_cookie) for sql_cookie in sql_cookies
+            ]
+            return RepoResp(data=cookies)
+
+    @safe_repo
+    def replace_by_environment_id(
+        self,
+        environment_id: int,
+        cookies: list[Cookie],
+        session: Session | None = None,
+    ) -> RepoResp[None]:
+        """
+        Replaces the cookies of the environment with `cookies`, as the jar
+        is saved as a whole.
+        """
+        with self._ensure_session(session) as session:
+            session.execute(
+                delete(SQLCookie).where(
+                    SQLCookie.environment_id == environment_id
+                )
+            )
+            session.add_all(self._cookie_to_sql(cookie) for cookie in cookies)
+            return RepoResp()
+
+    @safe_repo
+    def delete_expired(self, session: Session | None = None) -> RepoResp[int]:
+        with self._ensure_session(session) as session:
+            result = session.execute(
+                delete(SQLCookie).where(SQLCookie.expires_at <= _utc_now())
+            )
+            return RepoResp(data=result.rowcount)
+
+    @property
+    def _updatable_sql_fields(self) -> list[str]:
+        return [
+            SQLCookie.value.key,
+            SQLCookie.expires_at.key,
+            SQLCookie.secure.key,
+            SQLCookie.http_only.key,
+        ]
+
+    def _sql_to_cookie(self, sql_cookie: SQLCookie) -> Cookie:
+        return Cookie(
+            id=sql_cookie.id,
+            environment_id=sql_cookie.environment_id,
+            name=sql_cookie.name,
+            value=sql_cookie.value,
+            domain=sql_cookie.domain,
+            path=sql_cookie.path,
+            expires_at=sql_cookie.expires_at.replace(tzinfo=UTC)
+            if sql_cookie.expires_at
+            else None,
+            secure=sql_cookie.secure,
+            http_only=sql_cookie.http_only,
+            created_at=sql_cookie.created_at.replace(tzinfo=UTC),
+            updated_at=sql_cookie.updated_at.replace(tzinfo=UTC),
+        )
+
+    def _cookie_to_sql(self, cookie: Cookie) -> SQLCookie:
+        return SQLCookie(
+            id=cookie.id,
+            environment_id=cookie.environment_id,
+            name=cookie.name,
+            value=cookie.value,
+            domain=cookie.domain,
+            path=cookie.path,
+            # Stored in naive UTC, like the timestamps SQLite sets
+            expires_at=cookie.expires_at.astimezone(UTC).replace(tzinfo=None)
+            if cookie.expires_at
+            else None,
+            secure=cookie.secure,
+            http_only=cookie.http_only,
+            created_at=cookie.created_at,
+            updated_at=cookie.updated_at,
+        )
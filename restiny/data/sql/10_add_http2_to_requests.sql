@@ -0,0 +1,2 @@
+ALTER TABLE requests
+  ADD option_http2 BOOLEAN NOT NULL DEFAULT FALSE
@@ -0,0 +1,2 @@
+ALTER TABLE requests
+  ADD option_http_cache BOOLEAN NOT NULL DEFAULT FALSE
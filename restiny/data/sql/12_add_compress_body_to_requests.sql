@@ -0,0 +1,2 @@
+ALTER TABLE requests
+  ADD option_compress_body TEXT NOT NULL DEFAULT 'identity'
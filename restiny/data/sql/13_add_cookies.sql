@@ -0,0 +1,22 @@
+CREATE TABLE cookies (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  environment_id INTEGER NOT NULL
+    REFERENCES environments(id) ON DELETE CASCADE,
+
+  name TEXT NOT NULL,
+  value TEXT NOT NULL,
+  domain TEXT NOT NULL,
+  path TEXT NOT NULL,
+  -- NULL for session cookies
+  expires_at DATETIME NULL,
+  secure BOOLEAN NOT NULL,
+  http_only BOOLEAN NOT NULL,
+
+  created_at DATETIME NOT NULL,
+  updated_at DATETIME NOT NULL,
+
+  UNIQUE (environment_id, domain, path, name)
+);
+
+CREATE INDEX ix_cookies_expires_at
+  ON cookies (expires_at);
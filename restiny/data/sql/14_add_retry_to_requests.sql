@@ -0,0 +1,2 @@
+ALTER TABLE requests
+  ADD option_retry TEXT
@@ -0,0 +1,8 @@
+ALTER TABLE settings
+  ADD host_max_in_flight INTEGER NOT NULL DEFAULT 6;
+
+ALTER TABLE settings
+  ADD host_rate_limit REAL NOT NULL DEFAULT 0;
+
+ALTER TABLE settings
+  ADD host_rate_burst INTEGER NOT NULL DEFAULT 1;
@@ -0,0 +1,34 @@
+-- Trigrams of the requests name and url, to find the requests whose words
+-- are close to (but not prefixed by) the searched terms, e.g. with typos
+CREATE VIRTUAL TABLE requests_trigram_fts USING fts5(
+  name,
+  url,
+  tokenize = 'trigram'
+);
+
+CREATE TRIGGER trg_requests_trigram_fts_insert
+AFTER INSERT ON requests
+FOR EACH ROW
+BEGIN
+  INSERT INTO requests_trigram_fts (rowid, name, url)
+  VALUES (NEW.id, NEW.name, NEW.url);
+END;
+
+CREATE TRIGGER trg_requests_trigram_fts_update
+AFTER UPDATE OF name, url ON requests
+FOR EACH ROW
+BEGIN
+  DELETE FROM requests_trigram_fts WHERE rowid = OLD.id;
+  INSERT INTO requests_trigram_fts (rowid, name, url)
+  VALUES (NEW.id, NEW.name, NEW.url);
+END;
+
+CREATE TRIGGER trg_requests_trigram_fts_delete
+AFTER DELETE ON requests
+FOR EACH ROW
+BEGIN
+  DELETE FROM requests_trigram_fts WHERE rowid = OLD.id;
+END;
+
+INSERT INTO requests_trigram_fts (rowid, name, url)
+SELECT id, name, url FROM requests;
@@ -0,0 +1,5 @@
+ALTER TABLE requests
+  ADD import_fingerprint TEXT NULL;
+
+ALTER TABLE requests
+  ADD import_checksum TEXT NULL;
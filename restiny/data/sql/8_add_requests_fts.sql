@@ -0,0 +1,116 @@
+CREATE VIRTUAL TABLE requests_fts USING fts5(
+  name,
+  url,
+  headers,
+  body,
+  tokenize = 'unicode61 remove_diacritics 2',
+  prefix = '2 3'
+);
+
+-- The FTS columns are derived from the JSON columns of requests: headers
+-- keep only their keys/values and the body keeps only its text (raw value,
+-- file path or form fields keys/values)
+CREATE TRIGGER trg_requests_fts_insert
+AFTER INSERT ON requests
+FOR EACH ROW
+BEGIN
+  INSERT INTO requests_fts (rowid, name, url, headers, body)
+  VALUES (
+    NEW.id,
+    NEW.name,
+    NEW.url,
+    (
+      SELECT group_concat(
+        IFNULL(json_extract(value, '$.key'), '') || ' ' ||
+        IFNULL(json_extract(value, '$.value'), ''),
+        ' '
+      )
+      FROM json_each(NEW.headers)
+    ),
+    IFNULL(
+      json_extract(NEW.body, '$.value'),
+      IFNULL(
+        json_extract(NEW.body, '$.file'),
+        (
+          SELECT group_concat(
+            IFNULL(json_extract(value, '$.key'), '') || ' ' ||
+            IFNULL(json_extract(value, '$.value'), ''),
+            ' '
+          )
+          FROM json_each(NEW.body, '$.fields')
+        )
+      )
+    )
+  );
+END;
+
+CREATE TRIGGER trg_requests_fts_update
+AFTER UPDATE ON requests
+FOR EACH ROW
+BEGIN
+  DELETE FROM requests_fts WHERE rowid = OLD.id;
+  INSERT INTO requests_fts (rowid, name, url, headers, body)
+  VALUES (
+    NEW.id,
+    NEW.name,
+    NEW.url,
+    (
+      SELECT group_concat(
+        IFNULL(json_extract(value, '$.key'), '') || ' ' ||
+        IFNULL(json_extract(value, '$.value'), ''),
+        ' '
+      )
+      FROM json_each(NEW.headers)
+    ),
+    IFNULL(
+      json_extract(NEW.body, '$.value'),
+      IFNULL(
+        json_extract(NEW.body, '$.file'),
+        (
+          SELECT group_concat(
+            IFNULL(json_extract(value, '$.key'), '') || ' ' ||
+            IFNULL(json_extract(value, '$.value'), ''),
+            ' '
+          )
+          FROM json_each(NEW.body, '$.fields')
+        )
+      )
+    )
+  );
+END;
+
+CREATE TRIGGER trg_requests_fts_delete
+AFTER DELETE ON requests
+FOR EACH ROW
+BEGIN
+  DELETE FROM requests_fts WHERE rowid = OLD.id;
+END;
+
+INSERT INTO requests_fts (rowid, name, url, headers, body)
+SELECT
+  requests.id,
+  requests.name,
+  requests.url,
+  (
+    SELECT group_concat(
+      IFNULL(json_extract(value, '$.key'), '') || ' ' ||
+      IFNULL(json_extract(value, '$.value'), ''),
+      ' '
+    )
+    FROM json_each(requests.headers)
+  ),
+  IFNULL(
+    json_extract(requests.body, '$.value'),
+    IFNULL(
+      json_extract(requests.body, '$.file'),
+      (
+        SELECT group_concat(
+          IFNULL(json_extract(value, '$.key'), '') || ' ' ||
+          IFNULL(json_extract(value, '$.value'), ''),
+          ' '
+        )
+        FROM json_each(requests.body, '$.fields')
+      )
+    )
+  )
+FROM requests;
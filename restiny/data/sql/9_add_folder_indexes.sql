@@ -0,0 +1,7 @@
+-- The unique indexes are on expressions, so they can not be used to look up
+-- the children of a folder
+CREATE INDEX IF NOT EXISTS ix_folders_parent_id
+  ON folders (parent_id);
+
+CREATE INDEX IF NOT EXISTS ix_requests_folder_id
+  ON requests (folder_id);
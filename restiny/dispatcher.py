@@ -0,0 +1,193 @@
+"""
+Per-host limits of the outgoing requests, so sending many requests to a
+shared upstream doesn't trip its rate limiter.
+
+Each host (scheme, host and port) has at most `max_in_flight` requests in
+flight and, with a `rate`, a token bucket of `burst` tokens refilled at
+`rate` tokens per second. A `429 Too Many Requests` pauses the host until
+its `Retry-After` and halves its rate, which then grows back slowly while
+the host answers normally (AIMD).
+
+Every send should go through the dispatcher; the time it waited for its
+turn is reported apart from the time the server took.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from restiny.retries import parse_retry_after
+
+if TYPE_CHECKING:
+    import httpx
+
+# Key of the `httpx.Request.extensions` with the `DispatchInfo` of the send
+DISPATCH_INFO_EXTENSION = 'restiny.dispatch'
+
+# Pause of a host answering a 429 without a `Retry-After`
+DEFAULT_PAUSE_SECONDS = 1.0
+# A 429 divides the rate of the host by this, down to the minimum factor
+RATE_DECREASE_FACTOR = 2
+MIN_RATE_FACTOR = 1 / 16
+# Each other response gives this much of the rate back
+RATE_INCREASE_STEP = 0.05
+
+
+@dataclass
+class DispatchInfo:
+    # Seconds waited for a free slot, a token or the end of a pause, summed
+    # over the attempts of the send
+    queued_seconds: float = 0
+    throttled: int = 0
+
+
+@dataclass
+class _HostState:
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+    in_flight: int = 0
+    tokens: float | None = None
+    refilled_at: float = field(default_factory=time.monotonic)
+    paused_until: float = 0
+    rate_factor: float = 1
+
+
+class Dispatcher:
+    def __init__(
+        self, max_in_flight: int = 6, rate: float = 0, burst: int = 1
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        # Requests per second; 0 means unlimited
+        self.rate = rate
+        self.burst = burst
+        self._states: dict[tuple[str, str, int | None], _HostState] = {}
+        self._wake_up_tasks: set[asyncio.Task] = set()
+
+    def configure(self, max_in_flight: int, rate: float, burst: int) -> None:
+        self.max_in_flight = max(max_in_flight, 1)
+        self.rate = max(rate, 0)
+        self.burst = max(burst, 1)
+        for state in self._states.values():
+            state.tokens = None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # No event loop, so no sender is waiting
+            return
+        # The queued senders check the new limits (e.g. a higher
+        # `max_in_flight` admits some of them right away)
+        for state in self._states.values():
+            task = loop.create_task(self._wake_up(state))
+            self._wake_up_tasks.add(task)
+            task.add_done_callback(self._wake_up_tasks.discard)
+
+    def reset(self) -> None:
+        """
+        Forget the state of the hosts, e.g. before the event loop closes.
+        """
+        self._states.clear()
+
+    @asynccontextmanager
+    async def slot(
+        self, url: httpx.URL, dispatch_info: DispatchInfo
+    ) -> AsyncIterator[None]:
+        """
+        Wait for the turn of a request to `url`; the request must be sent
+        (and its response read) inside the context.
+        """
+        state = self._get_state(url)
+        queued_at = time.monotonic()
+
+        async with state.condition:
+            await state.condition.wait_for(
+                lambda: state.in_flight < self.max_in_flight
+            )
+            state.in_flight += 1
+        try:
+            await self._take_token(state)
+            dispatch_info.queued_seconds += time.monotonic() - queued_at
+            yield
+        finally:
+            async with state.condition:
+                state.in_flight -= 1
+                # All of them, as the limit may have been raised since
+                state.condition.notify_all()
+
+    def observe(self, url: httpx.URL, response: httpx.Response) -> None:
+        """
+        Adapt the limits of the host of `url` to its response.
+        """
+        state = self._get_state(url)
+        if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+            state.rate_factor = min(state.rate_factor + RATE_INCREASE_STEP, 1)
+            return
+
+        pause_seconds = parse_retry_after(response.headers.get('retry-after'))
+        if pause_seconds is None:
+            pause_seconds = DEFAULT_PAUSE_SECONDS
+        state.paused_until = max(
+            state.paused_until, time.monotonic() + pause_seconds
+        )
+        state.rate_factor = max(
+            state.rate_factor / RATE_DECREASE_FACTOR, MIN_RATE_FACTOR
+        )
+        # The requests already admitted don't get a burst after the pause
+        state.tokens = 0
+
+        dispatch_info = response.request.extensions.get(
+            DISPATCH_INFO_EXTENSION
+        )
+        if dispatch_info is not None:
+            dispatch_info.throttled += 1
+
+    def _get_state(self, url: httpx.URL) -> _HostState:
+        key = (url.scheme, url.host, url.port)
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _HostState()
+        return state
+
+    async def _wake_up(self, state: _HostState) -> None:
+        async with state.condition:
+            state.condition.notify_all()
+
+    async def _take_token(self, state: _HostState) -> None:
+        while True:
+            now = time.monotonic()
+            if state.paused_until > now:
+                await asyncio.sleep(state.paused_until - now)
+                continue
+            if not self.rate:
+                return
+
+            rate = self.rate * state.rate_factor
+            if state.tokens is None:
+                state.tokens = self.burst
+            else:
+                state.tokens = min(
+                    state.tokens + (now - state.refilled_at) * rate,
+                    self.burst,
+                )
+            state.refilled_at = now
+
+            if state.tokens >= 1:
+                state.tokens -= 1
+                return
+            await asyncio.sleep((1 - state.tokens) / rate)
+
+
+_dispatcher: Dispatcher | None = None
+
+
+def get_dispatcher() -> Dispatcher:
+    global _dispatcher
+    if _dispatcher:
+        return _dispatcher
+
+    _dispatcher = Dispatcher()
+    return _dispatcher
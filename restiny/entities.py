@@ -3,22 +3,25 @@ from __future__ import annotations
 import mimetypes
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-import httpx
 from pydantic import BaseModel, field_validator
 from pydantic import Field as _Field
 from pydantic_core.core_schema import ValidationInfo
 
-from restiny import httpx_auths
 from restiny.enums import (
     AuthMode,
     BodyMode,
     BodyRawLanguage,
+    ContentEncoding,
     ContentType,
     HTTPMethod,
+    OAuth2GrantType,
 )
-from restiny.utils import build_curl_cmd
+from restiny.utils import build_curl_cmd, is_websocket_url
+
+if TYPE_CHECKING:
+    import httpx
 
 
 class Folder(BaseModel):
@@ -94,11 +97,50 @@ class Request(BaseModel):
         username: str
         password: str
 
+    class OAuth2Auth(BaseModel):
+        grant_type: OAuth2GrantType
+        token_url: str
+        client_id: str
+        client_secret: str
+        scope: str
+        username: str
+        password: str
+        refresh_token: str
+        credentials_in: Literal['header', 'body']
+
+    class RetryPolicy(BaseModel):
+        # Attempts in total, so 1 never retries
+        max_attempts: int = 1
+        # Seconds before the first retry, doubled on each one up to the cap
+        backoff_base: float = 0.5
+        backoff_cap: float = 30
+        # Wait a random time between 0 and the backoff ("full jitter")
+        jitter: bool = True
+        status_codes: list[int] = _Field(
+            default_factory=lambda: [429, 502, 503, 504]
+        )
+        # Names of `httpx` transport errors
+        exceptions: list[str] = _Field(
+            default_factory=lambda: [
+                'ConnectError',
+                'ConnectTimeout',
+                'ReadError',
+                'RemoteProtocolError',
+            ]
+        )
+        respect_retry_after: bool = True
+
     class Options(BaseModel):
         timeout: float = 5.5
         follow_redirects: bool = True
         verify_ssl: bool = True
         attach_cookies: bool = True
+        http2: bool = False
+        http_cache: bool = False
+        compress_body: ContentEncoding = ContentEncoding.IDENTITY
+        retry: Request.RetryPolicy = _Field(
+            default_factory=lambda: Request.RetryPolicy()
+        )
 
     id: int | None = None
 
@@ -118,13 +160,30 @@ class Request(BaseModel):
 
     auth_enabled: bool = False
     auth_mode: AuthMode = AuthMode.BASIC
-    auth: BasicAuth | BearerAuth | ApiKeyAuth | DigestAuth | None = None
+    auth: (
+        BasicAuth | BearerAuth | ApiKeyAuth | DigestAuth | OAuth2Auth | None
+    ) = None
 
     options: Options = _Field(default_factory=Options)
 
+    # Identifies the source operation of imported requests (e.g. openapi)
+    import_fingerprint: str | None = None
+    import_checksum: str | None = None
+
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    @property
+    def is_websocket(self) -> bool:
+        """
+        WebSocket requests are the ones with a `ws://` or `wss://` URL.
+        """
+        return is_websocket_url(self.url)
+
+    @property
+    def display_method(self) -> str:
+        return 'WS' if self.is_websocket else self.method
+
     def resolve_variables(
         self, variables: list[Environment.Variable]
     ) -> Request:
@@ -184,6 +243,18 @@ class Request(BaseModel):
                     username=_resolve_variables(self.auth.username),
                     password=_resolve_variables(self.auth.password),
                 )
+            elif self.auth_mode == AuthMode.OAUTH2:
+                resolved_auth = self.OAuth2Auth(
+                    grant_type=self.auth.grant_type,
+                    token_url=_resolve_variables(self.auth.token_url),
+                    client_id=_resolve_variables(self.auth.client_id),
+                    client_secret=_resolve_variables(self.auth.client_secret),
+                    scope=_resolve_variables(self.auth.scope),
+                    username=_resolve_variables(self.auth.username),
+                    password=_resolve_variables(self.auth.password),
+                    refresh_token=_resolve_variables(self.auth.refresh_token),
+                    credentials_in=self.auth.credentials_in,
+                )
 
         resolved_body = self.body
         if self.body_enabled:
@@ -231,6 +302,14 @@ class Request(BaseModel):
     def to_httpx_req(
         self, cookies: httpx.Cookies | None = None
     ) -> httpx.Request:
+        import httpx
+
+        if (
+            self.body_enabled
+            and self.options.compress_body != ContentEncoding.IDENTITY
+        ):
+            return self._to_compressed_httpx_req(cookies=cookies)
+
         headers: dict[str, str] = {
             header.key: header.value
             for header in self.headers
@@ -324,7 +403,66 @@ class Request(BaseModel):
                 cookies=cookies,
             )
 
+    def _to_compressed_httpx_req(
+        self, cookies: httpx.Cookies | None = None
+    ) -> httpx.Request:
+        import httpx
+
+        from restiny.compression import (
+            COMPRESSION_INFO_EXTENSION,
+            CompressedFileContent,
+            CompressionInfo,
+            compress,
+        )
+
+        encoding = self.options.compress_body
+        info = CompressionInfo(encoding=encoding)
+        uncompressed = self.model_copy(
+            update=dict(
+                options=self.options.model_copy(
+                    update=dict(compress_body=ContentEncoding.IDENTITY)
+                )
+            )
+        )
+
+        if self.body_mode == BodyMode.FILE:
+            # Streamed, so the file is never read into memory at once
+            httpx_request = uncompressed.model_copy(
+                update=dict(body_enabled=False)
+            ).to_httpx_req(cookies=cookies)
+            headers = httpx_request.headers.copy()
+            if 'content-type' not in headers:
+                headers['content-type'] = (
+                    mimetypes.guess_type(self.body.file.name)[0]
+                    or 'application/octet-stream'
+                )
+            content = CompressedFileContent(
+                file=self.body.file, encoding=encoding, info=info
+            )
+        else:
+            httpx_request = uncompressed.to_httpx_req(cookies=cookies)
+            headers = httpx_request.headers.copy()
+            raw_content = httpx_request.read()
+            content = compress(raw_content, encoding=encoding)
+            info.raw_bytes = len(raw_content)
+            info.compressed_bytes = len(content)
+
+        headers.pop('content-length', None)
+        headers.pop('transfer-encoding', None)
+        headers['content-encoding'] = encoding
+        return httpx.Request(
+            method=httpx_request.method,
+            url=httpx_request.url,
+            headers=headers,
+            content=content,
+            extensions={COMPRESSION_INFO_EXTENSION: info},
+        )
+
     def to_httpx_auth(self) -> httpx.Auth | None:
+        import httpx
+
+        from restiny import httpx_auths
+
         if not self.auth_enabled:
             return
 
@@ -344,9 +482,21 @@ class Request(BaseModel):
                     key=self.auth.key, value=self.auth.value
                 )
         elif self.auth_mode == AuthMode.DIGEST:
-            return httpx.DigestAuth(
+            return httpx_auths.DigestAuth(
                 username=self.auth.username, password=self.auth.password
             )
+        elif self.auth_mode == AuthMode.OAUTH2:
+            return httpx_auths.OAuth2Auth(
+                grant_type=self.auth.grant_type,
+                token_url=self.auth.token_url,
+                client_id=self.auth.client_id,
+                client_secret=self.auth.client_secret,
+                scope=self.auth.scope,
+                username=self.auth.username,
+                password=self.auth.password,
+                refresh_token=self.auth.refresh_token,
+                credentials_in=self.auth.credentials_in,
+            )
 
     def to_curl(self) -> str:
         headers: dict[str, str] = {
@@ -397,6 +547,15 @@ class Request(BaseModel):
                     auth_api_key_param = (self.auth.key, self.auth.value)
             elif self.auth_mode == AuthMode.DIGEST:
                 auth_digest = (self.auth.username, self.auth.password)
+            elif self.auth_mode == AuthMode.OAUTH2:
+                # The token got by the last send, if still cached
+                oauth2_token = self.to_httpx_auth().cached_token
+                if oauth2_token is not None:
+                    auth_api_key_header = (
+                        'Authorization',
+                        f'{oauth2_token.token_type} '
+                        f'{oauth2_token.access_token}',
+                    )
 
         return build_curl_cmd(
             method=self.method,
@@ -421,6 +580,10 @@ class Settings(BaseModel):
     theme: str = 'textual-dark'
     editor_theme: str = 'vscode_dark'
     editor_indent: int = 2
+    # Limits of the requests to each host; a rate of 0 is unlimited
+    host_max_in_flight: int = 6
+    host_rate_limit: float = 0
+    host_rate_burst: int = 1
 
     created_at: datetime | None = None
     updated_at: datetime | None = None
@@ -468,3 +631,20 @@ class Environment(BaseModel):
             )
 
         return self.model_copy(update=dict(variables=resolved_vars))
+
+
+class Cookie(BaseModel):
+    id: int | None = None
+
+    environment_id: int
+    name: str
+    value: str
+    domain: str
+    path: str = '/'
+    # `None` for session cookies
+    expires_at: datetime | None = None
+    secure: bool = False
+    http_only: bool = False
+
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
@@ -44,3 +44,18 @@ class AuthMode(StrEnum):
     BEARER = 'bearer'
     API_KEY = 'api_key'
     DIGEST = 'digest'
+    OAUTH2 = 'oauth2'
+
+
+class OAuth2GrantType(StrEnum):
+    CLIENT_CREDENTIALS = 'client_credentials'
+    PASSWORD = 'password'
+    REFRESH_TOKEN = 'refresh_token'
+
+
+class ContentEncoding(StrEnum):
+    IDENTITY = 'identity'
+    GZIP = 'gzip'
+    DEFLATE = 'deflate'
+    BROTLI = 'br'
+    ZSTD = 'zstd'
@@ -0,0 +1,289 @@
+"""
+Client-side HTTP cache with revalidation (RFC 9111).
+
+Responses with validators (`ETag` and/or `Last-Modified`) are stored on
+disk per method + URL + the request headers named by their `Vary`. The next
+send of the same request is made conditional (`If-None-Match` /
+`If-Modified-Since`) and a `304 Not Modified` is answered with the stored
+body, so it isn't downloaded again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from restiny.consts import CACHE_DIR
+from restiny.logger import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = get_logger()
+
+HTTP_CACHE_DIR = CACHE_DIR / 'http'
+HTTP_CACHE_MAX_ENTRIES = 200
+CACHEABLE_METHODS = ('GET', 'HEAD')
+
+# Key of the `httpx.Response.extensions` with the `CacheInfo` of the send
+CACHE_INFO_EXTENSION = 'restiny.cache'
+
+# The stored body is already decoded, so these don't apply to it anymore
+_BODY_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+@dataclass
+class CacheInfo:
+    status: Literal['hit', 'stored', 'miss']
+    saved_bytes: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    meta_file: Path
+    body_file: Path
+    status_code: int
+    headers: list[tuple[str, str]]
+    wire_size: int
+
+    @property
+    def etag(self) -> str | None:
+        return self._header('etag')
+
+    @property
+    def last_modified(self) -> str | None:
+        return self._header('last-modified')
+
+    def _header(self, name: str) -> str | None:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+class HTTPCache:
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+
+    def prepare(self, request: httpx.Request) -> _CacheEntry | None:
+        """
+        Make `request` conditional if a response to it is stored, returning
+        the stored entry.
+        """
+        if request.method not in CACHEABLE_METHODS:
+            return None
+
+        entry = self._load_entry(request)
+        if entry is None:
+            return None
+
+        # Validators set by the user take precedence
+        if entry.etag and 'if-none-match' not in request.headers:
+            request.headers['If-None-Match'] = entry.etag
+        if entry.last_modified and 'if-modified-since' not in request.headers:
+            request.headers['If-Modified-Since'] = entry.last_modified
+        return entry
+
+    def handle_response(
+        self, response: httpx.Response, entry: _CacheEntry | None
+    ) -> httpx.Response:
+        """
+        Answer a `304 Not Modified` with the stored response, and store the
+        cacheable responses.
+        """
+        # After a redirect the 304 is about another resource than the entry
+        if (
+            entry is not None
+            and response.status_code == 304
+            and not response.history
+        ):
+            return self._build_cached_response(response, entry)
+
+        info = CacheInfo(status='miss')
+        if self._is_storable(response) and self._store(response):
+            info = CacheInfo(status='stored')
+        response.extensions = {
+            **response.extensions,
+            CACHE_INFO_EXTENSION: info,
+        }
+        return response
+
+    def _build_cached_response(
+        self, response: httpx.Response, entry: _CacheEntry
+    ) -> httpx.Response:
+        import httpx
+
+        try:
+            body = entry.body_file.read_bytes()
+        except OSError:
+            logger.exception('Failed to read the cached response body')
+            return response
+
+        # Freshen the stored headers with the ones of the 304
+        headers = httpx.Headers(entry.headers)
+        for key, value in response.headers.items():
+            if key.lower() not in _BODY_HEADERS:
+                headers[key] = value
+        try:
+            self._write_meta(
+                meta_file=entry.meta_file,
+                status_code=entry.status_code,
+                headers=headers,
+                wire_size=entry.wire_size,
+            )
+        except OSError:
+            logger.exception('Failed to update the cached response headers')
+
+        cached_response = httpx.Response(
+            status_code=entry.status_code,
+            headers=headers,
+            content=body,
+            request=response.request,
+            extensions={
+                **response.extensions,
+                CACHE_INFO_EXTENSION: CacheInfo(
+                    status='hit',
+                    saved_bytes=max(
+                        entry.wire_size - response.num_bytes_downloaded, 0
+                    ),
+                ),
+            },
+            history=response.history,
+        )
+        cached_response.elapsed = response.elapsed
+        return cached_response
+
+    def _is_storable(self, response: httpx.Response) -> bool:
+        if response.request.method not in CACHEABLE_METHODS:
+            return False
+        if response.status_code != 200:
+            return False
+        if 'no-store' in response.headers.get('cache-control', '').lower():
+            return False
+        if response.headers.get('vary', '').strip() == '*':
+            return False
+        return (
+            'etag' in response.headers or 'last-modified' in response.headers
+        )
+
+    def _store(self, response: httpx.Response) -> bool:
+        vary = [
+            name.strip().lower()
+            for name in response.headers.get('vary', '').split(',')
+            if name.strip()
+        ]
+        variant_key = self._variant_key(response.request, vary=vary)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._vary_file(response.request).write_text(json.dumps(vary))
+            (self.cache_dir / f'{variant_key}.body').write_bytes(
+                response.content
+            )
+            self._write_meta(
+                meta_file=self.cache_dir / f'{variant_key}.meta.json',
+                status_code=response.status_code,
+                headers=response.headers,
+                wire_size=response.num_bytes_downloaded,
+            )
+            self._prune()
+        except OSError:
+            logger.exception('Failed to store the response in the cache')
+            return False
+        return True
+
+    def _load_entry(self, request: httpx.Request) -> _CacheEntry | None:
+        try:
+            vary = json.loads(self._vary_file(request).read_text())
+            variant_key = self._variant_key(request, vary=vary)
+            meta_file = self.cache_dir / f'{variant_key}.meta.json'
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+        body_file = self.cache_dir / f'{variant_key}.body'
+        if not body_file.exists():
+            return None
+
+        return _CacheEntry(
+            meta_file=meta_file,
+            body_file=body_file,
+            status_code=meta['status_code'],
+            headers=[tuple(header) for header in meta['headers']],
+            wire_size=meta['wire_size'],
+        )
+
+    def _write_meta(
+        self,
+        meta_file: Path,
+        status_code: int,
+        headers: httpx.Headers,
+        wire_size: int,
+    ) -> None:
+        meta_file.write_text(
+            json.dumps(
+                {
+                    'status_code': status_code,
+                    'headers': [
+                        (key, value)
+                        for key, value in headers.multi_items()
+                        if key.lower() not in _BODY_HEADERS
+                    ],
+                    'wire_size': wire_size,
+                }
+            )
+        )
+
+    def _prune(self) -> None:
+        meta_files = sorted(
+            self.cache_dir.glob('*.meta.json'),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        if len(meta_files) <= HTTP_CACHE_MAX_ENTRIES:
+            return
+
+        for meta_file in meta_files[HTTP_CACHE_MAX_ENTRIES:]:
+            variant_key = meta_file.name.removesuffix('.meta.json')
+            meta_file.unlink(missing_ok=True)
+            (self.cache_dir / f'{variant_key}.body').unlink(missing_ok=True)
+
+        # The vary files of the URLs without any variant left
+        url_keys = {
+            meta_file.name.split('.', 1)[0]
+            for meta_file in meta_files[:HTTP_CACHE_MAX_ENTRIES]
+        }
+        for vary_file in self.cache_dir.glob('*.vary.json'):
+            if vary_file.name.split('.', 1)[0] not in url_keys:
+                vary_file.unlink(missing_ok=True)
+
+    def _url_key(self, request: httpx.Request) -> str:
+        return hashlib.sha256(
+            f'{request.method} {request.url}'.encode()
+        ).hexdigest()
+
+    def _vary_file(self, request: httpx.Request) -> Path:
+        return self.cache_dir / f'{self._url_key(request)}.vary.json'
+
+    def _variant_key(self, request: httpx.Request, vary: list[str]) -> str:
+        # Prefixed by the URL key, to tell the URLs with variants left
+        vary_key = hashlib.sha256(
+            json.dumps(
+                [(name, request.headers.get(name)) for name in vary]
+            ).encode()
+        ).hexdigest()
+        return f'{self._url_key(request)}.{vary_key}'
+
+
+_http_cache: HTTPCache | None = None
+
+
+def get_http_cache() -> HTTPCache:
+    global _http_cache
+    if _http_cache:
+        return _http_cache
+
+    _http_cache = HTTPCache()
+    return _http_cache
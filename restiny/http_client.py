@@ -0,0 +1,325 @@
+"""
+HTTP clients shared by all the sends of the app.
+
+Reusing the clients keeps their connections alive between sends, and with
+HTTP/2 the concurrent sends to the same origin are multiplexed as streams
+over a single connection instead of opening one connection per send.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+
+from restiny.dispatcher import (
+    DISPATCH_INFO_EXTENSION,
+    DispatchInfo,
+    get_dispatcher,
+)
+from restiny.http_cache import CACHE_INFO_EXTENSION, get_http_cache
+from restiny.retries import (
+    RETRY_INFO_EXTENSION,
+    RetryAttempt,
+    RetryInfo,
+    backoff_delay,
+    is_retryable_error,
+    parse_retry_after,
+)
+from restiny.sse import is_event_stream
+
+if TYPE_CHECKING:
+    import httpx
+
+    from restiny.cassettes import Cassette, CassetteRecorder
+    from restiny.entities import Request
+
+
+@dataclass
+class TransferMetrics:
+    wire_bytes: int
+    decoded_bytes: int
+    header_bytes: int
+    elapsed_seconds: float
+    # The body was read from the HTTP cache, after a `304 Not Modified`
+    from_cache: bool = False
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """
+        Wire bytes per decoded byte of the body (lower is better).
+        """
+        if self.from_cache or not self.decoded_bytes:
+            return None
+        return self.wire_bytes / self.decoded_bytes
+
+    @property
+    def throughput(self) -> float | None:
+        """
+        Wire bytes per second.
+        """
+        if self.from_cache or not self.elapsed_seconds:
+            return None
+        return self.wire_bytes / self.elapsed_seconds
+
+
+def measure_transfer(response: httpx.Response) -> TransferMetrics:
+    """
+    Measure a read response. The header bytes are the size of the status
+    line and headers as HTTP/1.1 text, which over HTTP/2 is the size before
+    the HPACK compression.
+    """
+    header_bytes = len(
+        f'{response.http_version} {response.status_code} '
+        f'{response.reason_phrase}\r\n'
+    )
+    for key, value in response.headers.raw:
+        header_bytes += len(key) + len(value) + 4  # ': ' and CRLF
+    header_bytes += 2  # The empty line ending the headers
+
+    cache_info = response.extensions.get(CACHE_INFO_EXTENSION)
+    return TransferMetrics(
+        wire_bytes=response.num_bytes_downloaded,
+        decoded_bytes=len(response.content),
+        header_bytes=header_bytes,
+        elapsed_seconds=response.elapsed.total_seconds(),
+        from_cache=cache_info is not None and cache_info.status == 'hit',
+    )
+
+
+# Clients by (http2, verify_ssl, id of the cookie jar)
+_clients: dict[tuple[bool, bool, int | None], httpx.AsyncClient] = {}
+
+# While a cassette is replayed, all the sends go through this client
+_replay_client: httpx.AsyncClient | None = None
+
+# While a cassette is recorded, all the read responses are written to it
+_recorder: CassetteRecorder | None = None
+
+
+def get_http_client(
+    http2: bool, verify_ssl: bool, cookies: httpx.Cookies | None = None
+) -> httpx.AsyncClient:
+    """
+    Return the shared client for the given transport options.
+
+    The client stores the cookies of the responses in `cookies` (and sends
+    them on redirects); without `cookies` it never stores cookies, so
+    nothing leaks between sends that don't attach cookies.
+    """
+    import httpx
+
+    key = (http2, verify_ssl, None if cookies is None else id(cookies.jar))
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        if cookies is None:
+            cookie_jar = CookieJar(
+                policy=DefaultCookiePolicy(allowed_domains=[])
+            )
+        else:
+            cookie_jar = cookies.jar
+
+        client = _clients[key] = httpx.AsyncClient(
+            http2=http2, verify=verify_ssl, cookies=cookie_jar, timeout=None
+        )
+    return client
+
+
+async def send_request(
+    request: Request,
+    cookies: httpx.Cookies | None = None,
+    stream_events: bool = False,
+) -> httpx.Response:
+    """
+    Send `request` and read the response, retrying it as its retry policy
+    says.
+
+    With `stream_events`, an event stream (`text/event-stream`) response is
+    returned unread instead, for its events to be read as they arrive; the
+    caller must close it.
+    """
+    import httpx
+
+    client = _replay_client or get_http_client(
+        http2=request.options.http2,
+        verify_ssl=request.options.verify_ssl,
+        cookies=cookies,
+    )
+    policy = request.options.retry
+    retry_info = RetryInfo(max_attempts=max(policy.max_attempts, 1))
+    dispatch_info = DispatchInfo()
+    while True:
+        started_at = time.perf_counter()
+        try:
+            response = await _send_once(
+                client=client,
+                request=request,
+                cookies=cookies,
+                stream_events=stream_events,
+                retry_info=retry_info,
+                dispatch_info=dispatch_info,
+            )
+        except httpx.TransportError as error:
+            attempt = RetryAttempt(
+                status_code=None,
+                error=type(error).__name__,
+                elapsed_seconds=time.perf_counter() - started_at,
+            )
+            retry_info.attempts.append(attempt)
+            is_last_attempt = (
+                len(retry_info.attempts) >= retry_info.max_attempts
+            )
+            if is_last_attempt or not is_retryable_error(
+                policy=policy, error=error
+            ):
+                raise
+            delay_seconds = backoff_delay(
+                policy=policy, retry_number=len(retry_info.attempts)
+            )
+        else:
+            attempt = RetryAttempt(
+                status_code=response.status_code,
+                error=None,
+                elapsed_seconds=time.perf_counter() - started_at,
+            )
+            retry_info.attempts.append(attempt)
+            if (
+                len(retry_info.attempts) >= retry_info.max_attempts
+                or response.status_code not in policy.status_codes
+            ):
+                return response
+
+            delay_seconds = backoff_delay(
+                policy=policy, retry_number=len(retry_info.attempts)
+            )
+            if policy.respect_retry_after:
+                retry_after = parse_retry_after(
+                    response.headers.get('retry-after')
+                )
+                if retry_after is not None:
+                    # Not worth waiting for; show the response instead
+                    if retry_after > policy.backoff_cap:
+                        return response
+                    delay_seconds = retry_after
+            await response.aclose()
+
+        attempt.delay_seconds = delay_seconds
+        await asyncio.sleep(delay_seconds)
+
+
+async def _send_once(
+    client: httpx.AsyncClient,
+    request: Request,
+    cookies: httpx.Cookies | None,
+    stream_events: bool,
+    retry_info: RetryInfo,
+    dispatch_info: DispatchInfo,
+) -> httpx.Response:
+    import httpx
+
+    from restiny.httpx_auths import HTTPCacheAuth
+
+    httpx_request = request.to_httpx_req(cookies=cookies)
+    httpx_request.extensions['timeout'] = httpx.Timeout(
+        request.options.timeout
+    ).as_dict()
+    httpx_request.extensions[RETRY_INFO_EXTENSION] = retry_info
+    httpx_request.extensions[DISPATCH_INFO_EXTENSION] = dispatch_info
+    # Unlike `client.build_request`, `client.send` doesn't add the default
+    # headers of the client, so advertise the encodings it can decode
+    # (brotli and zstd only with their optional packages)
+    httpx_request.headers.setdefault(
+        'accept-encoding', client.headers['accept-encoding']
+    )
+
+    auth = request.to_httpx_auth()
+    http_cache = get_http_cache() if request.options.http_cache else None
+    if http_cache:
+        auth = HTTPCacheAuth(auth=auth, http_cache=http_cache)
+
+    dispatcher = get_dispatcher()
+    # An event stream gives its slot back once its headers are received
+    async with dispatcher.slot(
+        url=httpx_request.url, dispatch_info=dispatch_info
+    ):
+        response = await client.send(
+            request=httpx_request,
+            auth=auth,
+            follow_redirects=request.options.follow_redirects,
+            stream=True,
+        )
+        dispatcher.observe(url=httpx_request.url, response=response)
+
+        if stream_events and is_event_stream(response):
+            # The server sends events whenever it wants, so the time between
+            # two reads is unbounded; the timeouts are read on each read
+            response.request.extensions['timeout'] = {
+                **response.request.extensions['timeout'],
+                'read': None,
+            }
+            return response
+
+        try:
+            await response.aread()
+        except BaseException:
+            await response.aclose()
+            raise
+
+    if http_cache:
+        response = http_cache.handle_response(response, entry=auth.cache_entry)
+    if _recorder:
+        _recorder.record(response)
+    return response
+
+
+async def close_http_clients() -> None:
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
+    get_dispatcher().reset()
+    await stop_replaying()
+
+
+def start_recording(recorder: CassetteRecorder) -> None:
+    global _recorder
+    _recorder = recorder
+
+
+def stop_recording() -> CassetteRecorder | None:
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def get_recorder() -> CassetteRecorder | None:
+    return _recorder
+
+
+async def start_replaying(
+    cassette: Cassette, latency_seconds: float | None = None
+) -> None:
+    """
+    Answer all the sends from `cassette` instead of the network.
+    """
+    import httpx
+
+    global _replay_client
+    await stop_replaying()
+    _replay_client = httpx.AsyncClient(
+        transport=cassette.make_transport(latency_seconds=latency_seconds),
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        timeout=None,
+    )
+
+
+async def stop_replaying() -> None:
+    global _replay_client
+    if _replay_client is not None:
+        await _replay_client.aclose()
+        _replay_client = None
+
+
+def is_replaying() -> bool:
+    return _replay_client is not None
@@ -1,7 +1,26 @@
-from collections.abc import Generator
+from __future__ import annotations
+
+import asyncio
+import base64
+import time
+from collections.abc import AsyncGenerator, Generator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+from urllib.request import parse_http_list
 
 import httpx
 
+from restiny.enums import OAuth2GrantType
+
+if TYPE_CHECKING:
+    from httpx._auth import _DigestAuthChallenge
+
+    from restiny.http_cache import HTTPCache, _CacheEntry
+
+# Tokens are refreshed this long before they expire (or halfway through
+# their lifetime, for shorter-lived ones)
+OAUTH2_REFRESH_MARGIN_SECONDS = 30
+
 
 class BearerAuth(httpx.Auth):
     """
@@ -50,3 +69,392 @@ class APIKeyParamAuth(httpx.Auth):
             params=request.url.params.set(self._key, self._value)
         )
         yield request
+
+
+@dataclass
+class DigestNonce:
+    challenge: _DigestAuthChallenge
+    # URL prefixes of the protection space of the challenge
+    url_prefixes: set[str] = field(default_factory=set)
+    # Next `nc` to send with the nonce of the challenge
+    nonce_count: int = 1
+
+
+# (origin, username, realm) -> last challenge of the protection space
+_digest_nonces: dict[tuple[str, bytes, bytes], DigestNonce] = {}
+
+
+def _digest_url_prefixes(request: httpx.Request, auth_header: str) -> set[str]:
+    """
+    URL prefixes of the protection space of a Digest challenge: the URIs of
+    its `domain`, or else the paths at or under the one challenged (as for
+    Basic auth).
+    """
+    domain = ''
+    for challenge_field in parse_http_list(auth_header.partition(' ')[2]):
+        key, _, value = challenge_field.strip().partition('=')
+        if key.lower() == 'domain':
+            domain = value.strip('"')
+
+    uris = domain.split()
+    if not uris:
+        path = request.url.path
+        uris = [path[: path.rfind('/') + 1]]
+    return {str(request.url.join(uri)) for uri in uris}
+
+
+class DigestAuth(httpx.DigestAuth):
+    """
+    Digest auth that remembers the last challenge of each protection space
+    (origin, realm and URL prefixes) and user, so the next requests in it
+    are authorized up front (with the next `nc`) instead of costing a 401
+    round trip each. The challenge is only answered again when the server
+    rejects the request (e.g. the nonce is stale).
+    """
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response]:
+        digest_nonce = self._find_digest_nonce(request)
+        if digest_nonce is not None:
+            self._authorize(request=request, digest_nonce=digest_nonce)
+
+        response = yield request
+
+        if response.status_code != 401:
+            return
+        for auth_header in response.headers.get_list('www-authenticate'):
+            if auth_header.lower().startswith('digest '):
+                break
+        else:
+            return
+
+        challenge = self._parse_challenge(request, response, auth_header)
+        url_prefixes = _digest_url_prefixes(
+            request=request, auth_header=auth_header
+        )
+        cache_key = (
+            f'{request.url.scheme}://{request.url.netloc.decode()}',
+            self._username,
+            challenge.realm,
+        )
+        digest_nonce = _digest_nonces.get(cache_key)
+        if digest_nonce is not None:
+            url_prefixes |= digest_nonce.url_prefixes
+        # A nonce must never be sent twice with the same `nc`
+        if (
+            digest_nonce is None
+            or digest_nonce.challenge.nonce != challenge.nonce
+        ):
+            digest_nonce = DigestNonce(challenge=challenge)
+            _digest_nonces[cache_key] = digest_nonce
+        digest_nonce.url_prefixes = url_prefixes
+        self._authorize(request=request, digest_nonce=digest_nonce)
+        if response.cookies:
+            httpx.Cookies(response.cookies).set_cookie_header(request=request)
+
+        yield request
+
+    def _find_digest_nonce(self, request: httpx.Request) -> DigestNonce | None:
+        """
+        The challenge of the most specific protection space of the request.
+        """
+        url = str(request.url)
+        found_digest_nonce = None
+        found_prefix_length = -1
+        for (_, username, _), digest_nonce in _digest_nonces.items():
+            if username != self._username:
+                continue
+            for url_prefix in digest_nonce.url_prefixes:
+                if (
+                    url.startswith(url_prefix)
+                    and len(url_prefix) > found_prefix_length
+                ):
+                    found_digest_nonce = digest_nonce
+                    found_prefix_length = len(url_prefix)
+        return found_digest_nonce
+
+    def _authorize(
+        self, request: httpx.Request, digest_nonce: DigestNonce
+    ) -> None:
+        self._nonce_count = digest_nonce.nonce_count
+        digest_nonce.nonce_count += 1
+        request.headers['authorization'] = self._build_auth_header(
+            request, digest_nonce.challenge
+        )
+
+
+class OAuth2Error(httpx.RequestError):
+    """
+    The token endpoint didn't issue a token.
+    """
+
+
+@dataclass
+class OAuth2Token:
+    access_token: str
+    token_type: str
+    refresh_token: str | None
+    # `time.monotonic()` after which the token is refreshed; `None` when the
+    # token endpoint didn't say when it expires
+    refresh_at: float | None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.refresh_at is None or time.monotonic() < self.refresh_at
+
+
+_oauth2_tokens: dict[tuple[str, ...], OAuth2Token] = {}
+_oauth2_locks: dict[tuple[str, ...], asyncio.Lock] = {}
+
+
+class OAuth2Auth(httpx.Auth):
+    """
+    Gets an access token from the token endpoint and adds it to the
+    Authorization header of each request.
+
+    Tokens are shared by every request with the same token URL, client and
+    scope, until shortly before they expire; then they're refreshed (with
+    the refresh token, when there's one). Concurrent requests needing a new
+    token wait for a single token request. A request rejected with a 401 is
+    retried once with a new token.
+    """
+
+    # Only for the sync flow; the async one reads the token responses alone,
+    # so the responses to the requests themselves can still be streamed
+    requires_response_body = True
+
+    def __init__(
+        self,
+        grant_type: OAuth2GrantType,
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        scope: str = '',
+        username: str = '',
+        password: str = '',
+        refresh_token: str = '',
+        credentials_in: Literal['header', 'body'] = 'header',
+    ) -> None:
+        self._grant_type = grant_type
+        self._token_url = token_url
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._scope = scope
+        self._username = username
+        self._password = password
+        self._refresh_token = refresh_token
+        self._credentials_in = credentials_in
+
+    @property
+    def cache_key(self) -> tuple[str, ...]:
+        # Users of the password grant never share their tokens
+        return (
+            self._token_url,
+            self._client_id,
+            self._scope,
+            self._username
+            if self._grant_type == OAuth2GrantType.PASSWORD
+            else '',
+        )
+
+    @property
+    def cached_token(self) -> OAuth2Token | None:
+        return _oauth2_tokens.get(self.cache_key)
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response]:
+        token = self.cached_token
+        is_new_token = token is None or not token.is_fresh
+        if is_new_token:
+            token = yield from self._token_flow(previous=token)
+
+        self._authorize(request=request, token=token)
+        response = yield request
+
+        if response.status_code == 401 and not is_new_token:
+            token = yield from self._token_flow(previous=token)
+            self._authorize(request=request, token=token)
+            yield request
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        token = self.cached_token
+        is_new_token = False
+        for attempt in range(2):
+            if attempt == 1 or token is None or not token.is_fresh:
+                is_new_token = True
+                lock = _oauth2_locks.setdefault(self.cache_key, asyncio.Lock())
+                async with lock:
+                    cached_token = self.cached_token
+                    if (
+                        cached_token is not None
+                        and cached_token is not token
+                        and cached_token.is_fresh
+                    ):
+                        # Got by another request while waiting for the lock
+                        token = cached_token
+                    else:
+                        token_flow = self._token_flow(previous=token)
+                        token_request = next(token_flow)
+                        while True:
+                            token_response = yield token_request
+                            await token_response.aread()
+                            try:
+                                token_request = token_flow.send(token_response)
+                            except StopIteration as stop:
+                                token = stop.value
+                                break
+
+            self._authorize(request=request, token=token)
+            response = yield request
+            if response.status_code != 401 or is_new_token:
+                return
+
+    def _token_flow(
+        self, previous: OAuth2Token | None
+    ) -> Generator[httpx.Request, httpx.Response, OAuth2Token]:
+        if previous is not None and previous.refresh_token:
+            response = yield self._build_token_request(
+                grant={
+                    'grant_type': 'refresh_token',
+                    'refresh_token': previous.refresh_token,
+                }
+            )
+            # An expired or revoked refresh token falls back to the grant
+            if response.is_success:
+                return self._store_token(response=response, previous=previous)
+
+        response = yield self._build_token_request(grant=self._grant())
+        return self._store_token(response=response, previous=previous)
+
+    def _grant(self) -> dict[str, str]:
+        if self._grant_type == OAuth2GrantType.PASSWORD:
+            return {
+                'grant_type': 'password',
+                'username': self._username,
+                'password': self._password,
+            }
+        if self._grant_type == OAuth2GrantType.REFRESH_TOKEN:
+            return {
+                'grant_type': 'refresh_token',
+                'refresh_token': self._refresh_token,
+            }
+        return {'grant_type': 'client_credentials'}
+
+    def _build_token_request(self, grant: dict[str, str]) -> httpx.Request:
+        data = dict(grant)
+        if self._scope:
+            data['scope'] = self._scope
+
+        headers = {'accept': 'application/json'}
+        if self._credentials_in == 'header':
+            credentials = f'{self._client_id}:{self._client_secret}'
+            headers['authorization'] = (
+                f'Basic {base64.b64encode(credentials.encode()).decode()}'
+            )
+        else:
+            data['client_id'] = self._client_id
+            if self._client_secret:
+                data['client_secret'] = self._client_secret
+
+        return httpx.Request(
+            'POST', self._token_url, data=data, headers=headers
+        )
+
+    def _store_token(
+        self, response: httpx.Response, previous: OAuth2Token | None
+    ) -> OAuth2Token:
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+
+        if not response.is_success or not payload.get('access_token'):
+            error = payload.get('error') or f'HTTP {response.status_code}'
+            description = payload.get('error_description')
+            raise OAuth2Error(
+                f'Token request failed ({error})'
+                + (f': {description}' if description else ''),
+                request=response.request,
+            )
+
+        refresh_at = None
+        try:
+            expires_in = float(payload['expires_in'])
+        except (KeyError, TypeError, ValueError):
+            pass
+        else:
+            refresh_at = time.monotonic() + max(
+                expires_in - OAUTH2_REFRESH_MARGIN_SECONDS, expires_in / 2
+            )
+
+        token_type = payload.get('token_type') or 'Bearer'
+        token = OAuth2Token(
+            access_token=payload['access_token'],
+            token_type='Bearer'
+            if token_type.lower() == 'bearer'
+            else token_type,
+            # The refresh token is kept when a refresh doesn't rotate it
+            refresh_token=payload.get('refresh_token')
+            or (previous.refresh_token if previous else None),
+            refresh_at=refresh_at,
+        )
+        _oauth2_tokens[self.cache_key] = token
+        return token
+
+    def _authorize(self, request: httpx.Request, token: OAuth2Token) -> None:
+        request.headers['authorization'] = (
+            f'{token.token_type} {token.access_token}'
+        )
+
+
+class HTTPCacheAuth(httpx.Auth):
+    """
+    Makes each request of the flow of `auth` conditional on the response
+    stored in the HTTP cache, once `auth` authorized it, so the stored
+    response is looked up with the headers and params added by `auth`
+    (e.g. for a `Vary: Authorization`), as it was stored.
+    """
+
+    def __init__(self, auth: httpx.Auth | None, http_cache: HTTPCache) -> None:
+        # Without auth, the base class sends the request unchanged
+        self._auth = auth or httpx.Auth()
+        self._http_cache = http_cache
+        # Entry of the last request of the flow, the one answered
+        self.cache_entry: _CacheEntry | None = None
+        self._prepared_request: httpx.Request | None = None
+        self._conditional_headers: list[str] = []
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        auth_flow = self._auth.async_auth_flow(request)
+        try:
+            request = await anext(auth_flow)
+            while True:
+                self._prepare(request)
+                response = yield request
+                try:
+                    request = await auth_flow.asend(response)
+                except StopAsyncIteration:
+                    return
+        finally:
+            await auth_flow.aclose()
+
+    def _prepare(self, request: httpx.Request) -> None:
+        # A request sent again (e.g. after a 401) may be another variant
+        if self._prepared_request is not None:
+            for name in self._conditional_headers:
+                self._prepared_request.headers.pop(name, None)
+
+        header_names = set(request.headers.keys())
+        self.cache_entry = self._http_cache.prepare(request)
+        self._prepared_request = request
+        self._conditional_headers = [
+            name for name in request.headers.keys() if name not in header_names
+        ]
@@ -0,0 +1,106 @@
+"""
+Memory usage inspection of the running app: the process RSS and
+`tracemalloc` snapshots diffed against the previous one.
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+# Frames kept per allocation; more frames give better tracebacks but cost
+# more memory and time while tracing
+TRACEMALLOC_FRAMES = 1
+
+
+@dataclass
+class AllocationDiff:
+    site: str
+    size_bytes: int
+    size_diff_bytes: int
+    count: int
+    count_diff: int
+
+
+def process_rss_bytes() -> tuple[int | None, bool]:
+    """
+    Return the resident set size of the process and whether it is the peak
+    one (when the current one isn't available on the platform).
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE'), False
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None, False
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return (max_rss if sys.platform == 'darwin' else max_rss * 1024), True
+
+
+class MemoryTracer:
+    def __init__(self) -> None:
+        self._previous_snapshot: tracemalloc.Snapshot | None = None
+
+    @property
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._previous_snapshot = self._take_snapshot()
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._previous_snapshot = None
+
+    def diff(self, limit: int = 50) -> list[AllocationDiff]:
+        """
+        Take a snapshot and return the allocation sites that grew the most
+        since the previous one.
+        """
+        snapshot = self._take_snapshot()
+        stats = snapshot.compare_to(self._previous_snapshot, 'lineno')
+        self._previous_snapshot = snapshot
+
+        return [
+            AllocationDiff(
+                site=f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+                size_bytes=stat.size,
+                size_diff_bytes=stat.size_diff,
+                count=stat.count,
+                count_diff=stat.count_diff,
+            )
+            for stat in stats[:limit]
+        ]
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                tracemalloc.Filter(
+                    False, '<frozen importlib._bootstrap_external>'
+                ),
+            ]
+        )
+
+
+_memory_tracer: MemoryTracer | None = None
+
+
+def get_memory_tracer() -> MemoryTracer:
+    global _memory_tracer
+    if _memory_tracer:
+        return _memory_tracer
+
+    _memory_tracer = MemoryTracer()
+    return _memory_tracer
@@ -0,0 +1,336 @@
+"""
+Local mock HTTP/1.1 server answering from the operations of an OpenAPI spec
+(example payloads built from their schemas) or from the responses of a
+cassette, with configurable latency, jitter and error rate.
+
+It runs on the event loop of the app, so client flows can be exercised
+with no network access or real service.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+from dataclasses import dataclass
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from restiny.cassettes import Cassette
+from restiny.logger import get_logger
+from restiny.openapi import (
+    build_json_body_from_schema,
+    get_spec_version,
+    resolve_schema_ref,
+)
+
+logger = get_logger()
+
+_SPEC_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch')
+_PATH_TEMPLATE_REGEX = re.compile(r'\\\{[^/]+?\\\}')
+
+
+@dataclass
+class MockResponse:
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+@dataclass
+class MockRoute:
+    method: str
+    path: re.Pattern
+    # Exact query string to match; `None` matches any
+    query: str | None
+    response: MockResponse
+
+
+@dataclass
+class MockServerStats:
+    requests: int = 0
+    injected_errors: int = 0
+    unmatched: int = 0
+
+
+def _json_response(status_code: int, payload: object) -> MockResponse:
+    return MockResponse(
+        status_code=status_code,
+        headers=[('Content-Type', 'application/json')],
+        body=json.dumps(payload).encode(),
+    )
+
+
+def _spec_response(spec: dict, operation: dict, is_v2: bool) -> MockResponse:
+    responses = operation.get('responses', {})
+    success_statuses = sorted(
+        str(status)
+        for status in responses
+        if str(status).isdigit() and str(status).startswith('2')
+    )
+    if success_statuses:
+        status = success_statuses[0]
+        response = responses.get(status, responses.get(int(status)))
+    else:
+        status = '200'
+        response = responses.get('default', {})
+    response = resolve_schema_ref(spec=spec, schema=response or {})
+
+    if is_v2:
+        example = response.get('examples', {}).get('application/json')
+        schema = response.get('schema')
+    else:
+        content = response.get('content', {})
+        media = content.get('application/json') or next(
+            iter(content.values()), {}
+        )
+        example = media.get('example')
+        if example is None and media.get('examples'):
+            example = next(iter(media['examples'].values())).get('value')
+        schema = media.get('schema')
+
+    if example is None and schema is None:
+        return MockResponse(status_code=int(status), headers=[], body=b'')
+    if example is None:
+        example = build_json_body_from_schema(spec=spec, schema=schema)
+    return _json_response(status_code=int(status), payload=example)
+
+
+def routes_from_spec(spec: dict) -> list[MockRoute]:
+    """
+    One route per operation, answering with its first success response.
+    """
+    spec_version = get_spec_version(spec=spec) or ''
+    is_v2 = '2.0' in spec_version
+    if is_v2:
+        base_path = spec.get('basePath', '')
+    else:
+        servers = spec.get('servers') or [{'url': ''}]
+        base_path = urlsplit(servers[0]['url']).path
+    base_path = base_path.rstrip('/')
+
+    routes = []
+    for path, methods in spec.get('paths', {}).items():
+        path_regex = _PATH_TEMPLATE_REGEX.sub(
+            '[^/]+', re.escape(base_path + path)
+        )
+        for method, operation in methods.items():
+            if method not in _SPEC_METHODS:
+                continue
+            routes.append(
+                MockRoute(
+                    method=method.upper(),
+                    path=re.compile(path_regex),
+                    query=None,
+                    response=_spec_response(
+                        spec=spec, operation=operation, is_v2=is_v2
+                    ),
+                )
+            )
+
+    # Literal paths (`/pets/mine`) win over templated ones (`/pets/{id}`)
+    routes.sort(key=lambda route: route.path.pattern.count('[^/]+'))
+    return routes
+
+
+def routes_from_cassette(cassette: Cassette) -> list[MockRoute]:
+    """
+    One route per recorded request, on its path and query whatever the
+    host it was recorded from.
+    """
+    return [
+        MockRoute(
+            method=interaction.method,
+            path=re.compile(re.escape(urlsplit(interaction.url).path or '/')),
+            query=urlsplit(interaction.url).query,
+            response=MockResponse(
+                status_code=interaction.status_code,
+                headers=[
+                    (key, value)
+                    for key, value in interaction.headers
+                    if key.lower() != 'connection'
+                ],
+                body=interaction.body,
+            ),
+        )
+        for interaction in cassette.interactions
+    ]
+
+
+class MockServer:
+    def __init__(
+        self,
+        routes: list[MockRoute],
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        error_status_code: int = HTTPStatus.SERVICE_UNAVAILABLE,
+        seed: int | None = None,
+    ) -> None:
+        self.routes = routes
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+        self.stats = MockServerStats()
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=self.host, port=self.port
+        )
+        # The actual port, when a random one (0) was asked for
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        # Kept-alive connections would keep `wait_closed` waiting
+        for writer in self._writers:
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def match(self, method: str, target: str) -> MockResponse | None:
+        url = urlsplit(target)
+        # Routes on the exact query first, then on the path alone
+        for match_query in (True, False):
+            for route in self.routes:
+                # HEAD is answered like a GET, with no body
+                if route.method != method and (
+                    method != 'HEAD' or route.method != 'GET'
+                ):
+                    continue
+                if match_query and route.query not in (None, url.query):
+                    continue
+                if route.path.fullmatch(url.path):
+                    return route.response
+        return None
+
+    def _respond(self, method: str, target: str) -> MockResponse:
+        self.stats.requests += 1
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats.injected_errors += 1
+            return _json_response(
+                status_code=self.error_status_code,
+                payload={'error': 'Injected error'},
+            )
+
+        response = self.match(method=method, target=target)
+        if response is None:
+            self.stats.unmatched += 1
+            return _json_response(
+                status_code=HTTPStatus.NOT_FOUND,
+                payload={'error': f'No mock for {method} {target}'},
+            )
+        return response
+
+    def _delay_seconds(self) -> float:
+        jitter_ms = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(self.latency_ms + jitter_ms, 0) / 1000
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, target, keep_alive = request
+
+                response = self._respond(method=method, target=target)
+                delay_seconds = self._delay_seconds()
+                if delay_seconds:
+                    await asyncio.sleep(delay_seconds)
+
+                writer.write(
+                    _serialize_response(
+                        response=response,
+                        with_body=method != 'HEAD',
+                        keep_alive=keep_alive,
+                    )
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            logger.debug('Mock server connection dropped', exc_info=True)
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, bool] | None:
+    """
+    Reads a request (its body is discarded) and returns its method, target
+    and whether the connection is kept alive; `None` once the client is
+    gone.
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        return None
+
+    request_line, *header_lines = head.decode('latin-1').split('\r\n')[:-2]
+    method, target, version = request_line.split(' ', 2)
+    headers = {}
+    for header_line in header_lines:
+        key, _, value = header_line.partition(':')
+        headers[key.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        while True:
+            chunk_size = int((await reader.readline()).split(b';')[0], 16)
+            await reader.readexactly(chunk_size + 2)
+            if chunk_size == 0:
+                break
+    elif headers.get('content-length'):
+        await reader.readexactly(int(headers['content-length']))
+
+    connection = headers.get('connection', '').lower()
+    keep_alive = (
+        connection != 'close'
+        if version == 'HTTP/1.1'
+        else connection == 'keep-alive'
+    )
+    return method, target, keep_alive
+
+
+def _serialize_response(
+    response: MockResponse, with_body: bool, keep_alive: bool
+) -> bytes:
+    try:
+        reason = HTTPStatus(response.status_code).phrase
+    except ValueError:
+        reason = ''
+
+    lines = [f'HTTP/1.1 {response.status_code} {reason}']
+    lines.extend(f'{key}: {value}' for key, value in response.headers)
+    if response.status_code not in (
+        HTTPStatus.NO_CONTENT,
+        HTTPStatus.NOT_MODIFIED,
+    ):
+        lines.append(f'Content-Length: {len(response.body)}')
+    lines.append(f'Connection: {"keep-alive" if keep_alive else "close"}')
+    head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    return head + response.body if with_body else head
@@ -0,0 +1,235 @@
+"""
+Loading of OpenAPI (2.0 and 3.0) specs and example payloads from their
+schemas, shared by the spec import and the mock server.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from restiny.consts import CACHE_DIR
+from restiny.logger import get_logger
+
+try:
+    # libyaml bindings are an order of magnitude faster than the pure-Python
+    # loader, but they're only available when PyYAML was built against it
+    from yaml import CSafeLoader as _BaseYAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseYAMLLoader
+
+
+class _YAMLLoader(_BaseYAMLLoader):
+    """
+    Loads unquoted dates and timestamps (e.g. `example: 2024-01-01`) as
+    strings, as JSON has no such types and they end up in JSON bodies.
+    """
+
+    yaml_implicit_resolvers = {
+        first_char: [
+            (tag, regexp)
+            for tag, regexp in resolvers
+            if tag != 'tag:yaml.org,2002:timestamp'
+        ]
+        for first_char, resolvers in (
+            _BaseYAMLLoader.yaml_implicit_resolvers.items()
+        )
+    }
+
+
+logger = get_logger()
+
+_SPEC_CACHE_DIR = CACHE_DIR / 'openapi_specs'
+_SPEC_CACHE_MAX_FILES = 10
+_SPEC_CACHE_MAX_IN_MEMORY = 2
+_SPEC_CACHE_MAX_STATS = 100
+# Bumped whenever the parsing changes, so older cached specs aren't used
+_SPEC_CACHE_VERSION = 2
+
+# (path, mtime, size) -> digest, so unchanged files aren't even read again
+_spec_digest_by_stat: dict[tuple[str, int, int], str] = {}
+# digest -> pickled spec, so each caller gets a spec of its own to mutate
+_spec_by_digest: dict[str, bytes] = {}
+
+
+class InvalidSpecFileError(Exception):
+    pass
+
+
+def load_spec(spec_file: Path) -> dict:
+    """
+    Returns the parsed spec, parsing the file only if its content was
+    never seen before. Parsed specs are cached in memory and on disk,
+    keyed by the content digest; the returned spec is a fresh copy.
+    """
+    try:
+        stat = spec_file.stat()
+    except OSError as error:
+        raise InvalidSpecFileError() from error
+
+    stat_key = (str(spec_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    digest = _spec_digest_by_stat.get(stat_key)
+    if digest and digest in _spec_by_digest:
+        return pickle.loads(_spec_by_digest[digest])
+
+    try:
+        raw_bytes = spec_file.read_bytes()
+    except OSError as error:
+        raise InvalidSpecFileError() from error
+
+    digest = hashlib.sha256(
+        f'{_SPEC_CACHE_VERSION}\0{spec_file.suffix}\0'.encode() + raw_bytes
+    ).hexdigest()
+    while len(_spec_digest_by_stat) >= _SPEC_CACHE_MAX_STATS:
+        del _spec_digest_by_stat[next(iter(_spec_digest_by_stat))]
+    _spec_digest_by_stat[stat_key] = digest
+    if digest in _spec_by_digest:
+        return pickle.loads(_spec_by_digest[digest])
+
+    cache_file = _SPEC_CACHE_DIR / f'{digest}.pickle'
+    spec = None
+    if cache_file.exists():
+        try:
+            pickled_spec = cache_file.read_bytes()
+            spec = pickle.loads(pickled_spec)
+        except Exception:
+            logger.warning(f'Discarding corrupted spec cache {cache_file}')
+            cache_file.unlink(missing_ok=True)
+
+    if not isinstance(spec, dict):
+        try:
+            raw_text = raw_bytes.decode('utf-8')
+        except UnicodeDecodeError as error:
+            raise InvalidSpecFileError() from error
+
+        spec = parse_spec(raw_text=raw_text, suffix=spec_file.suffix)
+        pickled_spec = pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL)
+        _write_spec_cache(cache_file=cache_file, pickled_spec=pickled_spec)
+
+    while len(_spec_by_digest) >= _SPEC_CACHE_MAX_IN_MEMORY:
+        del _spec_by_digest[next(iter(_spec_by_digest))]
+    _spec_by_digest[digest] = pickled_spec
+
+    return spec
+
+
+def parse_spec(raw_text: str, suffix: str) -> dict:
+    if suffix == '.json':
+        try:
+            spec = json.loads(raw_text)
+        except json.JSONDecodeError as error:
+            raise InvalidSpecFileError() from error
+    elif suffix in ('.yaml', '.yml'):
+        try:
+            spec = yaml.load(raw_text, Loader=_YAMLLoader)
+        except yaml.YAMLError as error:
+            raise InvalidSpecFileError() from error
+    else:
+        raise InvalidSpecFileError()
+
+    if not isinstance(spec, dict):
+        raise InvalidSpecFileError()
+
+    return spec
+
+
+def _write_spec_cache(cache_file: Path, pickled_spec: bytes) -> None:
+    try:
+        _SPEC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickled_spec)
+
+        cache_files = sorted(
+            _SPEC_CACHE_DIR.glob('*.pickle'),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for old_cache_file in cache_files[_SPEC_CACHE_MAX_FILES:]:
+            old_cache_file.unlink(missing_ok=True)
+    except OSError:
+        logger.exception('Failed to write the openapi spec cache')
+
+
+def get_spec_version(spec: dict) -> str | None:
+    spec_version = spec.get('swagger') or spec.get('openapi')
+    if not isinstance(spec_version, str):
+        return None
+    return spec_version
+
+
+def resolve_schema_ref(spec: dict, schema: dict) -> dict:
+    ref = schema.get('$ref')
+    if not ref:
+        return schema
+
+    # OpenAPI 2.0
+    if ref.startswith('#/definitions/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['definitions'][schema_name]
+    if ref.startswith('#/parameters/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['parameters'][schema_name]
+    if ref.startswith('#/responses/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['responses'][schema_name]
+
+    # OpenAPI 3.0
+    if ref.startswith('#/components/schemas/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['components']['schemas'][schema_name]
+    if ref.startswith('#/components/parameters/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['components']['parameters'][schema_name]
+    if ref.startswith('#/components/responses/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['components']['responses'][schema_name]
+    if ref.startswith('#/components/requestBodies/'):
+        schema_name = ref.rsplit('/', 1)[-1]
+        return spec['components']['requestBodies'][schema_name]
+
+    return schema
+
+
+def build_json_body_from_schema(spec: dict, schema: dict) -> Any:
+    schema = resolve_schema_ref(spec=spec, schema=schema)
+
+    if 'example' in schema:
+        return schema['example']
+    if 'default' in schema:
+        return schema['default']
+
+    schema_type = schema.get('type')
+    if schema_type == 'object':
+        props = schema.get('properties', {})
+        obj = {}
+        for prop_name, prop in props.items():
+            obj[prop_name] = build_json_body_from_schema(
+                spec=spec, schema=prop
+            )
+        return obj
+    elif schema_type == 'array':
+        items = schema.get('items', {})
+        return [build_json_body_from_schema(spec=spec, schema=items)]
+    elif schema_type == 'integer':
+        return 0
+    elif schema_type == 'number':
+        return 0.0
+    elif schema_type == 'boolean':
+        return False
+    elif schema_type == 'string':
+        fmt = schema.get('format')
+        # Fixed values, so the body (and its checksum) is the same on every
+        # import of an unchanged spec
+        if fmt == 'date-time':
+            return '1970-01-01T00:00:00Z'
+        elif fmt == 'date':
+            return '1970-01-01'
+        elif fmt == 'uuid':
+            return '00000000-0000-0000-0000-000000000000'
+        return ''
+
+    return {}
@@ -0,0 +1,260 @@
+"""
+Opt-in profiler of the running app, toggled from the command palette.
+
+A session records, until it is stopped:
+- a cProfile of the main thread, written as `<stamp>.pstats` (open it with
+  `python -m pstats` or `snakeviz`);
+- wall-clock samples of the main thread stack, written as collapsed stacks
+  `<stamp>.folded` (open it with `flamegraph.pl` or speedscope);
+- the time taken (and SQL queries run) by the handlers decorated with
+  `@timed`, written as `<stamp>.handlers.txt`;
+- the count and latency of each SQL statement, written as `<stamp>.sql.txt`
+  (only if given the query instrumentation of the database).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from restiny.consts import PROFILES_DIR
+
+if TYPE_CHECKING:
+    from restiny.data.instrumentation import (
+        QueryInstrumentation,
+        StatementStats,
+    )
+
+# Interval between two samples of the main thread stack
+SAMPLING_INTERVAL = 0.005
+
+
+@dataclass
+class HandlerTiming:
+    name: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    queries: int = 0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls
+
+
+@dataclass
+class ProfileResult:
+    pstats_file: Path
+    folded_file: Path
+    handlers_file: Path
+    handler_timings: list[HandlerTiming]
+    sql_file: Path | None = None
+    statements: list[StatementStats] = field(default_factory=list)
+
+
+class _StackSampler(threading.Thread):
+    def __init__(self, thread_id: int) -> None:
+        super().__init__(name='restiny-stack-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.stack_counts: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(SAMPLING_INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f'{code.co_qualname} '
+                    f'({os.path.basename(code.co_filename)}:'
+                    f'{code.co_firstlineno})'
+                )
+                frame = frame.f_back
+            # Collapsed stacks go from the root to the leaf
+            self.stack_counts[';'.join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self._cprofile: cProfile.Profile | None = None
+        self._sampler: _StackSampler | None = None
+        self._handler_timings: dict[str, HandlerTiming] = {}
+        self._query_instrumentation: QueryInstrumentation | None = None
+        self._was_instrumenting_queries = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._cprofile is not None
+
+    @property
+    def queries_count(self) -> int:
+        if self._query_instrumentation is None:
+            return 0
+        return self._query_instrumentation.queries_count
+
+    def start(
+        self, query_instrumentation: QueryInstrumentation | None = None
+    ) -> None:
+        if self.is_running:
+            return
+
+        self._handler_timings = {}
+        self._query_instrumentation = query_instrumentation
+        if query_instrumentation is not None:
+            self._was_instrumenting_queries = query_instrumentation.is_running
+            query_instrumentation.reset()
+            query_instrumentation.start()
+        self._sampler = _StackSampler(thread_id=threading.get_ident())
+        self._sampler.start()
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop(self) -> ProfileResult | None:
+        if not self.is_running:
+            return None
+
+        self._cprofile.disable()
+        self._sampler.stop()
+
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+
+        pstats_file = PROFILES_DIR / f'{stamp}.pstats'
+        self._cprofile.dump_stats(pstats_file)
+
+        folded_file = PROFILES_DIR / f'{stamp}.folded'
+        folded_file.write_text(
+            ''.join(
+                f'{stack} {count}\n'
+                for stack, count in self._sampler.stack_counts.items()
+            )
+        )
+
+        handler_timings = sorted(
+            self._handler_timings.values(),
+            key=lambda timing: timing.total_ms,
+            reverse=True,
+        )
+        handlers_file = PROFILES_DIR / f'{stamp}.handlers.txt'
+        handlers_file.write_text(format_handler_timings(handler_timings))
+
+        sql_file = None
+        statements = []
+        if self._query_instrumentation is not None:
+            from restiny.data.instrumentation import format_statements
+
+            statements = self._query_instrumentation.statements
+            sql_file = PROFILES_DIR / f'{stamp}.sql.txt'
+            sql_file.write_text(format_statements(statements))
+            if not self._was_instrumenting_queries:
+                self._query_instrumentation.stop()
+
+        self._cprofile = None
+        self._sampler = None
+        self._query_instrumentation = None
+        return ProfileResult(
+            pstats_file=pstats_file,
+            folded_file=folded_file,
+            handlers_file=handlers_file,
+            handler_timings=handler_timings,
+            sql_file=sql_file,
+            statements=statements,
+        )
+
+    def record(self, name: str, elapsed_ms: float, queries: int = 0) -> None:
+        timing = self._handler_timings.get(name)
+        if timing is None:
+            timing = self._handler_timings[name] = HandlerTiming(name=name)
+        timing.calls += 1
+        timing.total_ms += elapsed_ms
+        timing.max_ms = max(timing.max_ms, elapsed_ms)
+        timing.queries += queries
+
+
+def format_handler_timings(handler_timings: list[HandlerTiming]) -> str:
+    lines = [
+        f'{"handler":<60} {"calls":>7} {"total ms":>10} '
+        f'{"mean ms":>10} {"max ms":>10} {"queries":>8}'
+    ]
+    for timing in handler_timings:
+        lines.append(
+            f'{timing.name:<60} {timing.calls:>7} {timing.total_ms:>10.1f} '
+            f'{timing.mean_ms:>10.1f} {timing.max_ms:>10.1f} '
+            f'{timing.queries:>8}'
+        )
+    return '\n'.join(lines) + '\n'
+
+
+_profiler: Profiler | None = None
+
+
+def get_profiler() -> Profiler:
+    global _profiler
+    if _profiler:
+        return _profiler
+
+    _profiler = Profiler()
+    return _profiler
+
+
+def timed(func):
+    """
+    Record the time taken (and SQL queries run) by each call of the
+    decorated function (sync or async) while a profiler session is running.
+    """
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            profiler = get_profiler()
+            if not profiler.is_running:
+                return await func(*args, **kwargs)
+
+            queries_count = profiler.queries_count
+            started_at = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                profiler.record(
+                    name,
+                    elapsed_ms=(time.perf_counter() - started_at) * 1000,
+                    queries=profiler.queries_count - queries_count,
+                )
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = get_profiler()
+        if not profiler.is_running:
+            return func(*args, **kwargs)
+
+        queries_count = profiler.queries_count
+        started_at = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.record(
+                name,
+                elapsed_ms=(time.perf_counter() - started_at) * 1000,
+                queries=profiler.queries_count - queries_count,
+            )
+
+    return wrapper
@@ -0,0 +1,87 @@
+"""
+Retries of the sends that failed transiently (e.g. a `503` or a reset
+connection), with exponential backoff and jitter.
+
+Each attempt is recorded, so a flaky infrastructure can be told apart from
+a real error.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+    from restiny.entities import Request
+
+# Key of the `httpx.Request.extensions` with the `RetryInfo` of the send
+RETRY_INFO_EXTENSION = 'restiny.retry'
+
+
+@dataclass
+class RetryAttempt:
+    # Either the status code of the response or the name of the error
+    status_code: int | None
+    error: str | None
+    elapsed_seconds: float
+    # Seconds waited before the next attempt; `None` for the last one
+    delay_seconds: float | None = None
+
+
+@dataclass
+class RetryInfo:
+    max_attempts: int
+    attempts: list[RetryAttempt] = field(default_factory=list)
+
+
+def is_retryable_error(
+    policy: Request.RetryPolicy, error: httpx.TransportError
+) -> bool:
+    import httpx
+
+    for name in policy.exceptions:
+        error_class = getattr(httpx, name, None)
+        if isinstance(error_class, type) and isinstance(error, error_class):
+            return True
+    return False
+
+
+def backoff_delay(
+    policy: Request.RetryPolicy,
+    retry_number: int,
+    rng: random.Random | None = None,
+) -> float:
+    """
+    Seconds to wait before the retry number `retry_number` (1 for the
+    first one).
+    """
+    delay = min(
+        policy.backoff_base * 2 ** (retry_number - 1), policy.backoff_cap
+    )
+    if policy.jitter:
+        delay = (rng or random).uniform(0, delay)
+    return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Seconds to wait from a `Retry-After` header, in seconds or as an HTTP
+    date.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
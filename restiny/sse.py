@@ -0,0 +1,110 @@
+"""
+Incremental parsing of Server-Sent Events (`text/event-stream`), following
+the WHATWG HTML "event stream interpretation".
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+EVENT_STREAM_MIMETYPE = 'text/event-stream'
+
+_LINE_SEPARATOR_REGEX = re.compile(r'\r\n|\r|\n')
+
+
+@dataclass
+class ServerSentEvent:
+    event: str = 'message'
+    data: str = ''
+    id: str | None = None
+    retry: int | None = None
+
+
+class SSEParser:
+    """
+    Turns the chunks of an event stream into events as soon as each event
+    is complete, whatever the chunk boundaries are.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ''
+        self._event = ''
+        self._data_lines: list[str] = []
+        self._last_event_id: str | None = None
+        self._retry: int | None = None
+
+    def feed(self, text: str) -> list[ServerSentEvent]:
+        buffer = self._pending + text
+        lines = _LINE_SEPARATOR_REGEX.split(buffer)
+        # The last line is incomplete; a line ending in '\r' is held back
+        # too, as the '\r' may be the first half of a '\r\n' split across
+        # chunks
+        self._pending = lines.pop()
+        if buffer.endswith('\r') and lines:
+            self._pending = lines.pop() + '\r'
+
+        events = []
+        for line in lines:
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> ServerSentEvent | None:
+        if line == '':
+            return self._dispatch()
+        if line.startswith(':'):
+            # Comment, usually a keep-alive
+            return None
+
+        field, _, value = line.partition(':')
+        value = value.removeprefix(' ')
+        if field == 'event':
+            self._event = value
+        elif field == 'data':
+            self._data_lines.append(value)
+        elif field == 'id':
+            if '\0' not in value:
+                self._last_event_id = value
+        elif field == 'retry':
+            if value.isdigit():
+                self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> ServerSentEvent | None:
+        event_type = self._event
+        data_lines = self._data_lines
+        retry = self._retry
+        self._event = ''
+        self._data_lines = []
+        self._retry = None
+
+        if not data_lines:
+            return None
+        return ServerSentEvent(
+            event=event_type or 'message',
+            data='\n'.join(data_lines),
+            id=self._last_event_id,
+            retry=retry,
+        )
+
+
+def is_event_stream(response: httpx.Response) -> bool:
+    content_type = response.headers.get('content-type', '')
+    mimetype = content_type.split(';', 1)[0].strip().lower()
+    return mimetype == EVENT_STREAM_MIMETYPE
+
+
+async def aiter_events(
+    response: httpx.Response,
+) -> AsyncIterator[ServerSentEvent]:
+    parser = SSEParser()
+    async for text in response.aiter_text():
+        for event in parser.feed(text):
+            yield event
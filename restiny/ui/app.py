@@ -1,14 +1,18 @@
+from __future__ import annotations
+
 import asyncio
 import json
 import mimetypes
+import time
 from collections.abc import Iterable
+from datetime import datetime
 from http import HTTPStatus
+from typing import TYPE_CHECKING
 
-import httpx
-import pyperclip
 from textual import on
 from textual.app import App, ComposeResult, SystemCommand
 from textual.binding import Binding
+from textual.command import CommandPalette
 from textual.containers import Horizontal, Vertical
 from textual.events import DescendantFocus
 from textual.screen import Screen
@@ -17,14 +21,21 @@ from textual.widgets import Footer, Header
 
 from restiny.__about__ import __version__
 from restiny.assets import STYLE_TCSS
-from restiny.consts import DOWNLOADS_DIR
+from restiny.compression import (
+    COMPRESSION_INFO_EXTENSION,
+    is_encoding_available,
+)
+from restiny.consts import CASSETTES_DIR, DOWNLOADS_DIR
+from restiny.cookies import CookieJars
 from restiny.data.db import DBManager
 from restiny.data.repos import (
+    CookiesSQLRepo,
     EnvironmentsSQLRepo,
     FoldersSQLRepo,
     RequestsSQLRepo,
     SettingsSQLRepo,
 )
+from restiny.dispatcher import DISPATCH_INFO_EXTENSION, get_dispatcher
 from restiny.entities import Request
 from restiny.enums import (
     AuthMode,
@@ -32,6 +43,21 @@ from restiny.enums import (
     BodyRawLanguage,
     ContentType,
 )
+from restiny.http_cache import CACHE_INFO_EXTENSION
+from restiny.http_client import (
+    close_http_clients,
+    get_recorder,
+    is_replaying,
+    measure_transfer,
+    send_request,
+    start_recording,
+    start_replaying,
+    stop_recording,
+    stop_replaying,
+)
+from restiny.profiler import get_profiler, timed
+from restiny.retries import RETRY_INFO_EXTENSION
+from restiny.sse import aiter_events
 from restiny.ui import (
     CollectionsArea,
     RequestArea,
@@ -39,15 +65,19 @@ from restiny.ui import (
     TopBarArea,
     URLArea,
 )
-from restiny.ui.screens import (
-    EnvironmentsScreen,
-    OpenapiSpecImportScreen,
-    PostmanCollectionImportScreen,
-    PostmanEnvironmentImportScreen,
-    SettingsScreen,
+from restiny.ui.commands import RequestsSearchProvider
+from restiny.utils import (
+    format_bytes,
+    is_textual_mimetype,
+    is_websocket_url,
 )
-from restiny.utils import is_textual_mimetype
-from restiny.widgets.custom_text_area import CustomTextArea
+from restiny.widgets import CustomTextArea, DynamicFields
+
+if TYPE_CHECKING:
+    import httpx
+
+    from restiny.cassettes import Cassette
+    from restiny.mock_server import MockServer
 
 
 class RESTinyApp(App, inherit_bindings=False):
@@ -88,6 +118,12 @@ class RESTinyApp(App, inherit_bindings=False):
             description='Toggle collections',
             show=True,
         ),
+        Binding(
+            key='ctrl+f',
+            action='search_requests',
+            description='Search requests',
+            show=False,
+        ),
         Binding(
             key='f10',
             action='maximize_or_minimize_area',
@@ -103,6 +139,7 @@ class RESTinyApp(App, inherit_bindings=False):
         requests_repo: RequestsSQLRepo,
         settings_repo: SettingsSQLRepo,
         environments_repo: EnvironmentsSQLRepo,
+        cookies_repo: CookiesSQLRepo,
         *args,
         **kwargs,
     ) -> None:
@@ -112,13 +149,15 @@ class RESTinyApp(App, inherit_bindings=False):
         self.requests_repo = requests_repo
         self.settings_repo = settings_repo
         self.environments_repo = environments_repo
+        self.cookies_repo = cookies_repo
 
         self._active_request_task: asyncio.Task | None = None
         self._last_focused_widget: Widget | None = None
         self._last_focused_maximizable_area: Widget | None = None
         self._selected_request: Request | None = None
         self._request_id_to_response: dict[int, httpx.Response] = {}
-        self._cookies: httpx.Cookies = httpx.Cookies()
+        self._cookie_jars = CookieJars(cookies_repo=cookies_repo)
+        self._mock_server: MockServer | None = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -144,7 +183,13 @@ class RESTinyApp(App, inherit_bindings=False):
 
         self._apply_settings()
 
+    async def on_unmount(self) -> None:
+        await close_http_clients()
+        if self._mock_server is not None:
+            await self._mock_server.stop()
+
     def get_system_commands(self, screen: Screen) -> Iterable[SystemCommand]:
+        yield SystemCommand('Search requests', None, self.search_requests)
         yield SystemCommand('Copy as cURL', None, self.copy_as_curl)
         yield SystemCommand(
             'Show/Hide keys and help panel',
@@ -160,6 +205,11 @@ class RESTinyApp(App, inherit_bindings=False):
             'Manage environments', None, self.manage_environments
         )
         yield SystemCommand('Manage settings', None, self.manage_settings)
+        yield SystemCommand(
+            'Manage cookies',
+            'Cookies of the selected environment',
+            self.manage_cookies,
+        )
         yield SystemCommand(
             'Import postman collection',
             None,
@@ -171,6 +221,59 @@ class RESTinyApp(App, inherit_bindings=False):
         yield SystemCommand(
             'Import openapi spec', None, self.import_openapi_spec
         )
+        yield SystemCommand(
+            'Inspect memory',
+            'Memory used by responses, widgets and the database objects',
+            self.inspect_memory,
+        )
+        if get_profiler().is_running:
+            yield SystemCommand(
+                'Stop profiler',
+                'Stop profiling and show the report',
+                self.toggle_profiler,
+            )
+        else:
+            yield SystemCommand(
+                'Start profiler',
+                'Profile the app until stopped (output in ~/.restiny/profiles)',
+                self.toggle_profiler,
+            )
+        if get_recorder():
+            yield SystemCommand(
+                'Stop recording cassette',
+                'Stop recording the responses',
+                self.toggle_cassette_recording,
+            )
+        else:
+            yield SystemCommand(
+                'Start recording cassette',
+                'Record the responses until stopped (output in ~/.restiny/cassettes)',
+                self.toggle_cassette_recording,
+            )
+        if is_replaying():
+            yield SystemCommand(
+                'Stop replaying cassette',
+                'Send the requests to the network again',
+                self.stop_replaying_cassette,
+            )
+        else:
+            yield SystemCommand(
+                'Replay cassette',
+                'Answer the requests from a recorded cassette, offline',
+                self.replay_cassette,
+            )
+        if self._mock_server is not None:
+            yield SystemCommand(
+                'Stop mock server',
+                f'Stop the mock server on {self._mock_server.url}',
+                self.stop_mock_server,
+            )
+        else:
+            yield SystemCommand(
+                'Start mock server',
+                'Serve an OpenAPI spec or a cassette locally, with latency and errors',
+                self.start_mock_server,
+            )
 
     def action_toggle_collections(self) -> None:
         if self.collections_area.display:
@@ -187,6 +290,7 @@ class RESTinyApp(App, inherit_bindings=False):
     def action_prompt_delete(self) -> None:
         self.collections_area.prompt_delete()
 
+    @timed
     def action_save(self) -> None:
         if not self.selected_request:
             self.notify('No request selected', severity='warning')
@@ -199,6 +303,9 @@ class RESTinyApp(App, inherit_bindings=False):
         )
         self.notify('Saved changes', severity='information')
 
+    def action_search_requests(self) -> None:
+        self.search_requests()
+
     def action_maximize_or_minimize_area(self) -> None:
         if not self._last_focused_maximizable_area:
             self.notify('No area focused', severity='warning')
@@ -215,6 +322,14 @@ class RESTinyApp(App, inherit_bindings=False):
         else:
             self.action_show_help_panel()
 
+    def search_requests(self) -> None:
+        self.push_screen(
+            screen=CommandPalette(
+                providers=[RequestsSearchProvider],
+                placeholder='Search requests...',
+            )
+        )
+
     def copy_as_curl(self) -> None:
         if not self.selected_request:
             self.notify(
@@ -231,6 +346,8 @@ class RESTinyApp(App, inherit_bindings=False):
         )
 
     def manage_settings(self) -> None:
+        from restiny.ui.screens import SettingsScreen
+
         def on_settings_result(result: bool) -> None:
             if result is False:
                 return
@@ -243,6 +360,8 @@ class RESTinyApp(App, inherit_bindings=False):
         )
 
     def manage_environments(self) -> None:
+        from restiny.ui.screens import EnvironmentsScreen
+
         def on_manage_environments_result(result) -> None:
             self.top_bar_area.populate()
 
@@ -250,7 +369,25 @@ class RESTinyApp(App, inherit_bindings=False):
             screen=EnvironmentsScreen(), callback=on_manage_environments_result
         )
 
+    def manage_cookies(self) -> None:
+        from restiny.ui.screens import CookiesScreen
+
+        environment_id = self.get_environment_id()
+
+        def on_manage_cookies_result(result) -> None:
+            self._cookie_jars.save(environment_id)
+
+        self.push_screen(
+            screen=CookiesScreen(
+                cookies=self._cookie_jars.get(environment_id),
+                environment=self.top_bar_area.environment or 'global',
+            ),
+            callback=on_manage_cookies_result,
+        )
+
     def import_postman_collection(self) -> None:
+        from restiny.ui.screens import PostmanCollectionImportScreen
+
         def on_import_postman_collection_result(result: bool) -> None:
             if result is False:
                 return
@@ -265,6 +402,8 @@ class RESTinyApp(App, inherit_bindings=False):
         )
 
     def import_postman_environment(self) -> None:
+        from restiny.ui.screens import PostmanEnvironmentImportScreen
+
         def on_import_postman_environment_result(result: bool) -> None:
             if result is False:
                 return
@@ -277,6 +416,8 @@ class RESTinyApp(App, inherit_bindings=False):
         )
 
     def import_openapi_spec(self) -> None:
+        from restiny.ui.screens import OpenapiSpecImportScreen
+
         def on_import_openapi_spec(result: bool) -> None:
             if result is False:
                 return
@@ -289,9 +430,198 @@ class RESTinyApp(App, inherit_bindings=False):
             screen=OpenapiSpecImportScreen(), callback=on_import_openapi_spec
         )
 
+    def toggle_profiler(self) -> None:
+        from restiny.ui.screens import ProfilerReportScreen
+
+        profiler = get_profiler()
+        if not profiler.is_running:
+            profiler.start(
+                query_instrumentation=self.db_manager.query_instrumentation
+            )
+            self.notify('Profiler started', severity='information')
+            return
+
+        result = profiler.stop()
+        self.notify(
+            f'Profile saved to {result.pstats_file.parent}',
+            severity='information',
+        )
+        self.push_screen(screen=ProfilerReportScreen(result=result))
+
+    def toggle_cassette_recording(self) -> None:
+        from restiny.cassettes import CassetteRecorder
+
+        recorder = get_recorder()
+        if recorder is None:
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            start_recording(
+                CassetteRecorder(path=CASSETTES_DIR / f'{stamp}.jsonl')
+            )
+            self.notify('Recording cassette', severity='information')
+            return
+
+        stop_recording()
+        self.notify(
+            f'Recorded {recorder.interactions_count} responses to '
+            f'{recorder.path}',
+            severity='information',
+        )
+
+    def replay_cassette(self) -> None:
+        from restiny.ui.screens import CassetteReplayScreen
+
+        async def on_replay_cassette_result(
+            result: tuple[Cassette, float | None] | None,
+        ) -> None:
+            if result is None:
+                return
+
+            cassette, latency_seconds = result
+            await start_replaying(
+                cassette=cassette, latency_seconds=latency_seconds
+            )
+            self.sub_title = 'Replaying cassette (offline)'
+            self.notify(
+                f'Replaying {len(cassette.interactions)} responses',
+                severity='information',
+            )
+
+        self.push_screen(
+            screen=CassetteReplayScreen(),
+            callback=on_replay_cassette_result,
+        )
+
+    async def stop_replaying_cassette(self) -> None:
+        await stop_replaying()
+        self.sub_title = self.SUB_TITLE
+        self.notify('Stopped replaying cassette', severity='information')
+
+    def start_mock_server(self) -> None:
+        from restiny.ui.screens import MockServerScreen
+
+        async def on_mock_server_result(
+            mock_server: MockServer | None,
+        ) -> None:
+            if mock_server is None:
+                return
+
+            try:
+                await mock_server.start()
+            except OSError as error:
+                self.notify(
+                    f'Failed to start the mock server: {error}',
+                    severity='error',
+                )
+                return
+
+            self._mock_server = mock_server
+            self.notify(
+                f'Mock server of {len(mock_server.routes)} routes running '
+                f'on {mock_server.url}',
+                severity='information',
+                timeout=10,
+            )
+
+        self.push_screen(
+            screen=MockServerScreen(), callback=on_mock_server_result
+        )
+
+    async def stop_mock_server(self) -> None:
+        mock_server = self._mock_server
+        if mock_server is None:
+            return
+
+        await mock_server.stop()
+        self._mock_server = None
+        stats = mock_server.stats
+        self.notify(
+            f'Mock server stopped ({stats.requests} requests, '
+            f'{stats.injected_errors} injected errors, '
+            f'{stats.unmatched} unmatched)',
+            severity='information',
+        )
+
+    def open_websocket(self) -> None:
+        from restiny.ui.screens import WebSocketScreen
+        from restiny.websocket import is_websocket_available
+
+        if not is_websocket_available():
+            self.notify(
+                'WebSocket requests require "pip install restiny[websocket]"',
+                severity='error',
+            )
+            return
+
+        request = self.get_resolved_request()
+        self.push_screen(
+            screen=WebSocketScreen(
+                request=request,
+                cookies=self._cookie_jars.get(self.get_environment_id())
+                if request.options.attach_cookies
+                else None,
+            )
+        )
+
+    def inspect_memory(self) -> None:
+        from restiny.ui.screens import MemoryReportScreen
+
+        self.push_screen(screen=MemoryReportScreen())
+
+    def memory_usage(self) -> list[tuple[str, str]]:
+        """
+        Summary of what the app keeps in memory, as (label, value) pairs.
+        """
+        import gc
+
+        from restiny.data.models import SQLModelBase
+        from restiny.memory import process_rss_bytes
+
+        rss_bytes, is_peak_rss = process_rss_bytes()
+        responses_bytes = sum(
+            len(response.content)
+            + sum(len(key) + len(value) for key, value in response.headers.raw)
+            for response in self._request_id_to_response.values()
+        )
+
+        tree_nodes = 0
+        nodes_stack = [self.collections_area.collections_tree.root]
+        while nodes_stack:
+            node = nodes_stack.pop()
+            tree_nodes += 1
+            nodes_stack.extend(node.children)
+
+        main_screen = self.screen_stack[0]
+        dynamic_fields = sum(
+            len(dynamic_fields.fields)
+            for dynamic_fields in main_screen.query(DynamicFields)
+        )
+        widgets = sum(1 for _ in main_screen.walk_children())
+
+        orm_objects = sum(
+            1 for obj in gc.get_objects() if isinstance(obj, SQLModelBase)
+        )
+
+        return [
+            (
+                'Process RSS (peak)' if is_peak_rss else 'Process RSS',
+                format_bytes(rss_bytes) if rss_bytes is not None else 'n/a',
+            ),
+            (
+                'Cached responses',
+                f'{len(self._request_id_to_response)} '
+                f'({format_bytes(responses_bytes)})',
+            ),
+            ('Collections tree nodes', str(tree_nodes)),
+            ('Dynamic fields mounted', str(dynamic_fields)),
+            ('Widgets mounted (main screen)', str(widgets)),
+            ('ORM objects alive', str(orm_objects)),
+        ]
+
     def copy_to_clipboard(self, text: str) -> None:
         super().copy_to_clipboard(text)
         try:
+            import pyperclip
+
             # Also copy to the system clipboard (outside of the app)
             pyperclip.copy(text)
         except Exception:
@@ -316,10 +646,21 @@ class RESTinyApp(App, inherit_bindings=False):
 
     @on(URLArea.SendRequest)
     def _on_send_request(self, message: URLArea.SendRequest) -> None:
+        if is_websocket_url(self.url_area.url):
+            self.open_websocket()
+            return
+
         self._active_request_task = asyncio.create_task(self._send_request())
 
     @on(URLArea.DownloadResponse)
     def _on_download_response(self, message: URLArea.DownloadResponse) -> None:
+        if is_websocket_url(self.url_area.url):
+            self.notify(
+                'WebSocket requests have no response to download',
+                severity='warning',
+            )
+            return
+
         self._active_request_task = asyncio.create_task(
             self._send_request(download=True)
         )
@@ -330,6 +671,7 @@ class RESTinyApp(App, inherit_bindings=False):
             self._active_request_task.cancel()
 
     @on(CollectionsArea.RequestSelected)
+    @timed
     def _on_request_selected(
         self, message: CollectionsArea.RequestSelected
     ) -> None:
@@ -374,6 +716,12 @@ class RESTinyApp(App, inherit_bindings=False):
                 )
             )
 
+        get_dispatcher().configure(
+            max_in_flight=settings.host_max_in_flight,
+            rate=settings.host_rate_limit,
+            burst=settings.host_rate_burst,
+        )
+
     def _find_maximizable_area_by_widget(
         self, widget: Widget
     ) -> Widget | None:
@@ -393,6 +741,16 @@ class RESTinyApp(App, inherit_bindings=False):
 
     @selected_request.setter
     def selected_request(self, request: Request | None) -> None:
+        # The event stream of the previous request would keep showing its
+        # events in the response of this one
+        if self.response_area.is_streaming_events and (
+            request is None
+            or self._selected_request is None
+            or request.id != self._selected_request.id
+        ):
+            self._active_request_task.cancel()
+            self.response_area.is_streaming_events = False
+
         if request is None:
             self.url_area.clear()
             self.request_area.clear()
@@ -453,6 +811,18 @@ class RESTinyApp(App, inherit_bindings=False):
                 username=self.request_area.auth_digest_username,
                 password=self.request_area.auth_digest_password,
             )
+        elif auth_mode == AuthMode.OAUTH2:
+            auth = Request.OAuth2Auth(
+                grant_type=self.request_area.auth_oauth2_grant_type,
+                token_url=self.request_area.auth_oauth2_token_url,
+                client_id=self.request_area.auth_oauth2_client_id,
+                client_secret=self.request_area.auth_oauth2_client_secret,
+                scope=self.request_area.auth_oauth2_scope,
+                username=self.request_area.auth_oauth2_username,
+                password=self.request_area.auth_oauth2_password,
+                refresh_token=self.request_area.auth_oauth2_refresh_token,
+                credentials_in=self.request_area.auth_oauth2_credentials_in,
+            )
 
         body_enabled = self.request_area.body_enabled
         body_mode = self.request_area.body_mode
@@ -493,6 +863,10 @@ class RESTinyApp(App, inherit_bindings=False):
             follow_redirects=self.request_area.option_follow_redirects,
             verify_ssl=self.request_area.option_verify_ssl,
             attach_cookies=self.request_area.option_attach_cookies,
+            http2=self.request_area.option_http2,
+            http_cache=self.request_area.option_http_cache,
+            compress_body=self.request_area.option_compress_body,
+            retry=self.request_area.option_retry,
         )
 
         return Request(
@@ -510,6 +884,8 @@ class RESTinyApp(App, inherit_bindings=False):
             auth_mode=auth_mode,
             auth=auth,
             options=options,
+            import_fingerprint=self.selected_request.import_fingerprint,
+            import_checksum=self.selected_request.import_checksum,
         )
 
     def get_resolved_request(self) -> Request:
@@ -528,6 +904,16 @@ class RESTinyApp(App, inherit_bindings=False):
             request = request.resolve_variables(resolved_environment.variables)
         return request
 
+    def get_environment_id(self) -> int:
+        """
+        The selected environment, or the global one when none is selected.
+        """
+        environment = self.environments_repo.get_by_name(
+            name=self.top_bar_area.environment or 'global'
+        ).data
+        return environment.id
+
+    @timed
     def set_request(self, request: Request) -> None:
         self.url_area.clear()
         self.request_area.clear()
@@ -563,6 +949,28 @@ class RESTinyApp(App, inherit_bindings=False):
             elif request.auth_mode == AuthMode.DIGEST:
                 self.request_area.auth_digest_username = request.auth.username
                 self.request_area.auth_digest_password = request.auth.password
+            elif request.auth_mode == AuthMode.OAUTH2:
+                self.request_area.auth_oauth2_grant_type = (
+                    request.auth.grant_type
+                )
+                self.request_area.auth_oauth2_token_url = (
+                    request.auth.token_url
+                )
+                self.request_area.auth_oauth2_client_id = (
+                    request.auth.client_id
+                )
+                self.request_area.auth_oauth2_client_secret = (
+                    request.auth.client_secret
+                )
+                self.request_area.auth_oauth2_scope = request.auth.scope
+                self.request_area.auth_oauth2_username = request.auth.username
+                self.request_area.auth_oauth2_password = request.auth.password
+                self.request_area.auth_oauth2_refresh_token = (
+                    request.auth.refresh_token
+                )
+                self.request_area.auth_oauth2_credentials_in = (
+                    request.auth.credentials_in
+                )
 
         self.request_area.body_enabled = request.body_enabled
         self.request_area.body_mode = request.body_mode
@@ -600,31 +1008,46 @@ class RESTinyApp(App, inherit_bindings=False):
         self.request_area.option_attach_cookies = (
             request.options.attach_cookies
         )
+        self.request_area.option_http2 = request.options.http2
+        self.request_area.option_http_cache = request.options.http_cache
+        self.request_area.option_compress_body = request.options.compress_body
+        self.request_area.option_retry = request.options.retry
 
+    @timed
     async def _send_request(self, download: bool = False) -> None:
+        import httpx
+
+        environment_id = self.get_environment_id()
+        is_streaming_events = False
         self.response_area.clear()
         self.response_area.loading = True
         self.url_area.request_pending = True
 
         try:
             request = self.get_resolved_request()
-
-            async with httpx.AsyncClient(
-                timeout=request.options.timeout,
-                follow_redirects=request.options.follow_redirects,
-                verify=request.options.verify_ssl,
-            ) as http_client:
-                response = await http_client.send(
-                    request=request.to_httpx_req(
-                        cookies=self._cookies
-                        if request.options.attach_cookies
-                        else None
-                    ),
-                    auth=request.to_httpx_auth(),
+            if not is_encoding_available(request.options.compress_body):
+                self.notify(
+                    f'Compressing the body with {request.options.compress_body} '
+                    'requires "pip install restiny[compression]"',
+                    severity='error',
                 )
+                self.response_area.is_showing_response = False
+                return
 
-            if request.options.attach_cookies:
-                self._cookies.extract_cookies(response)
+            # The client stores the cookies of the response in the jar
+            response = await send_request(
+                request=request,
+                cookies=self._cookie_jars.get(environment_id)
+                if request.options.attach_cookies
+                else None,
+                stream_events=not download,
+            )
+
+            if not response.is_closed:
+                self._request_id_to_response.pop(request.id, None)
+                is_streaming_events = True
+                await self._stream_events(response=response)
+                return
 
             if download:
                 content_disposition = response.headers.get(
@@ -667,21 +1090,87 @@ class RESTinyApp(App, inherit_bindings=False):
         except httpx.RequestError as error:
             error_name = type(error).__name__
             error_message = str(error)
+            try:
+                retry_info = error.request.extensions.get(RETRY_INFO_EXTENSION)
+            except RuntimeError:  # Raised before the request was built
+                retry_info = None
+            if retry_info is not None and len(retry_info.attempts) > 1:
+                error_name = (
+                    f'{error_name} (after {len(retry_info.attempts)} attempts)'
+                )
             if error_message:
                 self.notify(f'{error_name}: {error_message}', severity='error')
             else:
                 self.notify(f'{error_name}', severity='error')
-            self.response_area.clear()
-            self.response_area.is_showing_response = False
+            # Keep the events received before the stream broke
+            if not self.response_area.is_streaming_events:
+                self.response_area.clear()
+                self.response_area.is_showing_response = False
 
         except asyncio.CancelledError:
-            self.response_area.clear()
-            self.response_area.is_showing_response = False
+            # Also stopped by selecting another request, whose response is
+            # shown already
+            if is_streaming_events:
+                self.notify('Event stream stopped')
+            else:
+                self.response_area.clear()
+                self.response_area.is_showing_response = False
 
         finally:
             self.response_area.loading = False
             self.url_area.request_pending = False
+            self._cookie_jars.save(environment_id)
+
+    async def _stream_events(self, response: httpx.Response) -> None:
+        """
+        Show the events of an event stream as they arrive, until the server
+        closes the stream or the send is canceled.
+        """
+        self.response_area.status = HTTPStatus(response.status_code)
+        self.response_area.headers = {
+            header_key: header_value
+            for header_key, header_value in response.headers.multi_items()
+        }
+        info = {
+            'Protocol': response.http_version,
+            'Method': response.request.method,
+            'URL': str(response.url),
+            'Redirects': str(len(response.history)),
+        }
+        dispatch_info = response.request.extensions.get(
+            DISPATCH_INFO_EXTENSION
+        )
+        if dispatch_info is not None:
+            info['Queued'] = f'{dispatch_info.queued_seconds:.2f} s'
+        self.response_area.info = info
+        self.response_area.body_raw_language = BodyRawLanguage.PLAIN
+        self.response_area.body_raw = (
+            '[EVENT STREAM]\nThe events are shown in the "Events" tab'
+        )
+        self.response_area.is_streaming_events = True
+        self.response_area.is_showing_response = True
+        self.response_area.loading = False
+
+        started_at = previous_at = time.perf_counter()
+        try:
+            async for event in aiter_events(response):
+                arrived_at = time.perf_counter()
+                self.response_area.add_event(
+                    event=event,
+                    arrived_at=datetime.now(),
+                    since_previous_ms=(arrived_at - previous_at) * 1000,
+                )
+                self.response_area.content_size = response.num_bytes_downloaded
+                self.response_area.elapsed_time = round(
+                    arrived_at - started_at, 2
+                )
+                previous_at = arrived_at
+        finally:
+            await response.aclose()
+
+        self.notify('Event stream closed by the server')
 
+    @timed
     def _display_response(self, response: httpx.Response) -> None:
         content_type_to_body_language = {
             ContentType.TEXT: BodyRawLanguage.PLAIN,
@@ -700,6 +1189,74 @@ class RESTinyApp(App, inherit_bindings=False):
             header_key: header_value
             for header_key, header_value in response.headers.multi_items()
         }
+        transfer = measure_transfer(response)
+        info = {
+            'Protocol': response.http_version,
+            'Method': response.request.method,
+            'URL': str(response.url),
+            'Redirects': str(len(response.history)),
+            'Header bytes': format_bytes(transfer.header_bytes),
+            'Body bytes (wire)': 'served from cache'
+            if transfer.from_cache
+            else format_bytes(transfer.wire_bytes),
+            'Body bytes (decoded)': format_bytes(transfer.decoded_bytes),
+            'Content-Encoding': response.headers.get(
+                'content-encoding', 'identity'
+            ),
+        }
+        if transfer.compression_ratio is not None:
+            info['Compression ratio'] = (
+                f'{transfer.compression_ratio:.1%} of the decoded size'
+            )
+        if transfer.throughput is not None:
+            info['Throughput'] = f'{format_bytes(transfer.throughput)}/s'
+
+        compression_info = response.request.extensions.get(
+            COMPRESSION_INFO_EXTENSION
+        )
+        if compression_info is not None:
+            info['Request body'] = (
+                f'{compression_info.encoding}, '
+                f'{format_bytes(compression_info.raw_bytes)} -> '
+                f'{format_bytes(compression_info.compressed_bytes)}'
+                + (
+                    f' ({compression_info.ratio:.0%})'
+                    if compression_info.ratio is not None
+                    else ''
+                )
+            )
+        cache_info = response.extensions.get(CACHE_INFO_EXTENSION)
+        if cache_info is not None:
+            if cache_info.status == 'hit':
+                saved = format_bytes(cache_info.saved_bytes)
+                self.response_area.cache_saved = saved
+                info['Cache'] = f'hit (304 Not Modified, {saved} saved)'
+            else:
+                info['Cache'] = cache_info.status
+        dispatch_info = response.request.extensions.get(
+            DISPATCH_INFO_EXTENSION
+        )
+        if dispatch_info is not None:
+            # Waiting for the per-host limits, apart from the server latency
+            info['Queued'] = f'{dispatch_info.queued_seconds:.2f} s'
+            if dispatch_info.throttled:
+                info['Throttled (429)'] = str(dispatch_info.throttled)
+        retry_info = response.request.extensions.get(RETRY_INFO_EXTENSION)
+        if retry_info is not None and retry_info.max_attempts > 1:
+            info['Attempts'] = (
+                f'{len(retry_info.attempts)} of {retry_info.max_attempts}'
+            )
+            for number, attempt in enumerate(retry_info.attempts, start=1):
+                outcome = attempt.error or str(attempt.status_code)
+                info[f'Attempt {number}'] = (
+                    f'{outcome} in {attempt.elapsed_seconds:.2f} s'
+                    + (
+                        f', retried after {attempt.delay_seconds:.2f} s'
+                        if attempt.delay_seconds is not None
+                        else ''
+                    )
+                )
+        self.response_area.info = info
 
         content_type = response.headers.get('Content-Type', '')
         mimetype = content_type.split(';', 1)[0].strip().lower()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import deque
 from typing import TYPE_CHECKING
 
 from textual import on
@@ -12,8 +14,7 @@ from textual.widgets import (
 )
 from textual.widgets.tree import TreeNode
 
-from restiny.entities import Request
-from restiny.enums import HTTPMethod
+from restiny.profiler import timed
 from restiny.ui.screens.request_or_folder_screen import (
     AddFolderResult,
     AddRequestOrFolderScreen,
@@ -28,8 +29,37 @@ from restiny.widgets import (
 )
 
 if TYPE_CHECKING:
+    from restiny.entities import Folder
     from restiny.ui.app import RESTinyApp
 
+REQUESTS_PAGE_SIZE = 200
+
+
+def _longest_increasing_subsequence(values: list[int]) -> set[int]:
+    """
+    Return the positions of one longest strictly increasing subsequence.
+    """
+    tail_values: list[int] = []  # Smallest tail value of each length
+    tails: list[int] = []  # Position of the smallest tail of each length
+    prev_position: list[int | None] = [None] * len(values)
+    for position, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length > 0:
+            prev_position[position] = tails[length - 1]
+        if length == len(tails):
+            tail_values.append(value)
+            tails.append(position)
+        else:
+            tail_values[length] = value
+            tails[length] = position
+
+    positions: set[int] = set()
+    position = tails[-1] if tails else None
+    while position is not None:
+        positions.add(position)
+        position = prev_position[position]
+    return positions
+
 
 class CollectionsArea(Widget):
     app: RESTinyApp
@@ -101,10 +131,14 @@ class CollectionsArea(Widget):
         self.content_switcher = self.query_one(ContentSwitcher)
         self.collections_tree = self.query_one(CollectionsTree)
         self.border_title = 'Collections'
+        # Expanded folders under each collapsed folder, expanded again along
+        # with it
+        self._expanded_ids_by_collapsed_id: dict[int, set[int]] = {}
 
         self.populate_children(node=self.collections_tree.root)
         self._sync_content_switcher()
 
+    @timed
     def prompt_add(self) -> None:
         parents = [
             (parent['path'], parent['id'])
@@ -118,9 +152,14 @@ class CollectionsArea(Widget):
             callback=self._on_prompt_add_result,
         )
 
+    @timed
     def prompt_update(self) -> None:
         if not self.collections_tree.cursor_node:
             return
+        if self.collections_tree.is_load_more(
+            self.collections_tree.cursor_node
+        ):
+            return
 
         node = self.collections_tree.cursor_node
         kind = None
@@ -154,6 +193,10 @@ class CollectionsArea(Widget):
     def prompt_delete(self) -> None:
         if not self.collections_tree.cursor_node:
             return
+        if self.collections_tree.is_load_more(
+            self.collections_tree.cursor_node
+        ):
+            return
 
         self.app.push_screen(
             screen=ConfirmPrompt(
@@ -162,49 +205,237 @@ class CollectionsArea(Widget):
             callback=self._on_prompt_delete_result,
         )
 
+    @timed
     def populate_children(self, node: TreeNode) -> None:
+        """
+        Reconcile the children of the folder node with the database, only
+        touching the nodes that were added, changed, moved or removed so
+        the expansion state and the cursor are kept.
+        """
         folder_id = node.data['id']
 
-        folders = self.app.folders_repo.get_by_parent_id(folder_id).data
-        requests = self.app.requests_repo.get_by_folder_id(folder_id).data
+        # Keep at least as many requests as already loaded by "Load more"
+        loaded_requests_count = len(
+            [
+                child_node
+                for child_node in node.children
+                if not child_node.allow_expand
+                and not self.collections_tree.is_load_more(child_node)
+            ]
+        )
+        limit = max(REQUESTS_PAGE_SIZE, loaded_requests_count)
 
-        def sort_requests(request: Request) -> tuple:
-            methods = [method.value for method in HTTPMethod]
-            method_order = {
-                method: index for index, method in enumerate(methods)
-            }
-            return (method_order[request.method], request.name.lower())
+        folders = self.app.folders_repo.get_by_parent_id(folder_id).data
+        sorted_requests = self.app.requests_repo.get_page_by_folder_id(
+            folder_id, limit=limit + 1
+        ).data
+        has_more_requests = len(sorted_requests) > limit
+        sorted_requests = sorted_requests[:limit]
 
         sorted_folders = sorted(
             folders, key=lambda folder: folder.name.lower()
         )
-        sorted_requests = sorted(requests, key=sort_requests)
+        desired = [(True, folder) for folder in sorted_folders] + [
+            (False, request) for request in sorted_requests
+        ]
 
+        cursor_node = self.collections_tree.cursor_node
+        cursor_key = (
+            (cursor_node.allow_expand, cursor_node.data['id'])
+            if cursor_node is not None
+            else None
+        )
+
+        desired_index_by_key = {
+            (is_folder, item.id): index
+            for index, (is_folder, item) in enumerate(desired)
+        }
+        kept_children = []
         for child_node in list(node.children):
+            key = (child_node.allow_expand, child_node.data['id'])
+            if key in desired_index_by_key:
+                kept_children.append(child_node)
+            else:
+                self.collections_tree.remove(child_node)
+
+        # Nodes outside of the longest run already in the desired order have
+        # moved (e.g. renamed), so they are re-inserted at their new place.
+        in_order_indexes = _longest_increasing_subsequence(
+            [
+                desired_index_by_key[
+                    (child_node.allow_expand, child_node.data['id'])
+                ]
+                for child_node in kept_children
+            ]
+        )
+        moved_expanded_folder_ids: set[int] = set()
+        for index, child_node in enumerate(kept_children):
+            if index in in_order_indexes:
+                continue
+            if child_node.is_expanded:
+                moved_expanded_folder_ids.add(child_node.data['id'])
             self.collections_tree.remove(child_node)
 
-        for folder in sorted_folders:
-            self.collections_tree.add_folder(
-                parent_node=node, name=folder.name, id=folder.id
+        for index, (is_folder, item) in enumerate(desired):
+            current_node = (
+                node.children[index] if index < len(node.children) else None
             )
 
-        for request in sorted_requests:
+            if current_node is not None and (
+                current_node.allow_expand,
+                current_node.data['id'],
+            ) == (is_folder, item.id):
+                if is_folder:
+                    self.collections_tree.update_folder(
+                        node=current_node, name=item.name
+                    )
+                else:
+                    self.collections_tree.update_request(
+                        node=current_node,
+                        method=item.display_method,
+                        name=item.name,
+                    )
+            elif is_folder:
+                new_node = self.collections_tree.add_folder(
+                    parent_node=node,
+                    name=item.name,
+                    id=item.id,
+                    before=current_node,
+                )
+                if item.id in moved_expanded_folder_ids:
+                    self.populate_children(new_node)
+                    with self.collections_tree.prevent(
+                        CollectionsTree.NodeExpanded
+                    ):
+                        new_node.expand()
+            else:
+                self.collections_tree.add_request(
+                    parent_node=node,
+                    method=item.display_method,
+                    name=item.name,
+                    id=item.id,
+                    before=current_node,
+                )
+
+        if has_more_requests:
+            self.collections_tree.add_load_more(parent_node=node)
+
+        node.refresh()
+        self._sync_content_switcher()
+        self._restore_cursor(cursor_key)
+
+    @timed
+    def load_more_requests(self, node: TreeNode) -> None:
+        """
+        Load the next page of requests of the folder node.
+        """
+        load_more_node = node.children[-1]
+        request_nodes = [
+            child_node
+            for child_node in node.children
+            if not child_node.allow_expand and child_node is not load_more_node
+        ]
+        after_id = request_nodes[-1].data['id'] if request_nodes else None
+
+        resp = self.app.requests_repo.get_page_by_folder_id(
+            node.data['id'], limit=REQUESTS_PAGE_SIZE + 1, after_id=after_id
+        )
+        if not resp.ok:
+            # The last loaded request is gone, so reload the folder instead
+            self.populate_children(node)
+            return
+
+        self.collections_tree.remove(load_more_node)
+        for request in resp.data[:REQUESTS_PAGE_SIZE]:
             self.collections_tree.add_request(
                 parent_node=node,
-                method=request.method,
+                method=request.display_method,
                 name=request.name,
                 id=request.id,
             )
+        if len(resp.data) > REQUESTS_PAGE_SIZE:
+            self.collections_tree.add_load_more(parent_node=node)
+
+    @timed
+    def reveal_request(self, request_id: int) -> None:
+        """
+        Expand the folders leading to the request and select its node.
+        """
+        request = self.app.requests_repo.get_by_id(request_id).data
+        if request is None:
+            self.notify('Request not found', severity='warning')
+            return
 
-        node.refresh()
-        self._sync_content_switcher()
+        folder_ids: list[int] = []
+        folder_id = request.folder_id
+        while folder_id is not None:
+            folder_ids.insert(0, folder_id)
+            folder_id = self.app.folders_repo.get_by_id(
+                folder_id
+            ).data.parent_id
+
+        node = self.collections_tree.root
+        for folder_id in folder_ids:
+            self.populate_children(node)
+            node = self.collections_tree.folder_node_by_id.get(folder_id)
+            if node is None:
+                return
+            if not node.is_expanded:
+                with self.collections_tree.prevent(
+                    CollectionsTree.NodeExpanded
+                ):
+                    node.expand()
+
+        self.populate_children(node)
+        while (
+            request_id not in self.collections_tree.request_node_by_id
+            and node.children
+            and self.collections_tree.is_load_more(node.children[-1])
+        ):
+            self.load_more_requests(node)
+        request_node = self.collections_tree.request_node_by_id.get(request_id)
+        if request_node is None:
+            return
+
+        self.display = True
+        self.collections_tree.focus()
+        self.call_after_refresh(
+            lambda: self.collections_tree.select_node(request_node)
+        )
 
     @on(CollectionsTree.NodeExpanded)
     def _on_node_expanded(self, message: CollectionsTree.NodeExpanded) -> None:
         self.populate_children(node=message.node)
+        self._expand_folders(
+            node=message.node,
+            folder_ids=self._expanded_ids_by_collapsed_id.pop(
+                message.node.data['id'], set()
+            ),
+        )
+
+    @on(CollectionsTree.NodeCollapsed)
+    def _on_node_collapsed(
+        self, message: CollectionsTree.NodeCollapsed
+    ) -> None:
+        # Collapsed children are not rendered, so release them until the
+        # folder is expanded again
+        self._expanded_ids_by_collapsed_id[message.node.data['id']] = (
+            self.collections_tree.expanded_folder_ids(message.node)
+        )
+        self.collections_tree.release_children(message.node)
+
+    @on(CollectionsTree.NodeHighlighted)
+    def _on_node_highlighted(
+        self, message: CollectionsTree.NodeHighlighted
+    ) -> None:
+        if self.collections_tree.is_load_more(message.node):
+            self.load_more_requests(message.node.parent)
 
     @on(CollectionsTree.NodeSelected)
     def _on_node_selected(self, message: CollectionsTree.NodeSelected) -> None:
+        if self.collections_tree.is_load_more(message.node):
+            return
+
         if message.node.allow_expand:
             self.post_message(
                 message=self.FolderSelected(folder_id=message.node.data['id'])
@@ -223,13 +454,11 @@ class CollectionsArea(Widget):
             return
 
         if isinstance(result, AddRequestResult):
-            parent_node = self.collections_tree.node_by_id[result.folder_id]
-            self.populate_children(parent_node)
+            self._populate_loaded_folders(result.folder_id)
             self._sync_content_switcher()
             self.post_message(message=self.RequestAdded(request_id=result.id))
         elif isinstance(result, AddFolderResult):
-            parent_node = self.collections_tree.node_by_id[result.parent_id]
-            self.populate_children(parent_node)
+            self._populate_loaded_folders(result.parent_id)
             self._sync_content_switcher()
             self.post_message(message=self.FolderAdded(folder_id=result.id))
 
@@ -238,22 +467,14 @@ class CollectionsArea(Widget):
             return
 
         if isinstance(result, UpdateRequestResult):
-            parent = self.collections_tree.node_by_id[result.folder_id]
-            old_parent = self.collections_tree.node_by_id[result.old_folder_id]
-            if parent is old_parent:
-                self.populate_children(parent)
-            else:
-                self.populate_children(old_parent)
-                self.populate_children(parent)
+            self._populate_loaded_folders(
+                result.old_folder_id, result.folder_id
+            )
             self.post_message(self.RequestUpdated(request_id=result.id))
         elif isinstance(result, UpdateFolderResult):
-            parent = self.collections_tree.node_by_id[result.parent_id]
-            old_parent = self.collections_tree.node_by_id[result.old_parent_id]
-            if parent is old_parent:
-                self.populate_children(parent)
-            else:
-                self.populate_children(old_parent)
-                self.populate_children(parent)
+            self._populate_loaded_folders(
+                result.old_parent_id, result.parent_id
+            )
             self.post_message(self.FolderUpdated(folder_id=result.id))
 
         self._sync_content_switcher()
@@ -262,75 +483,104 @@ class CollectionsArea(Widget):
         if result is False:
             return
 
+        deleted_node = self.collections_tree.cursor_node
+        parent_node = deleted_node.parent
         try:
-            prev_selected_index_in_parent = (
-                self.collections_tree.cursor_node.parent.children.index(
-                    self.collections_tree.cursor_node
-                )
+            prev_selected_index_in_parent = parent_node.children.index(
+                deleted_node
             )
         except ValueError:
             prev_selected_index_in_parent = 0
 
-        if self.collections_tree.cursor_node.allow_expand:
-            self.app.folders_repo.delete_by_id(
-                self.collections_tree.cursor_node.data['id']
-            )
+        if deleted_node.allow_expand:
+            self.app.folders_repo.delete_by_id(deleted_node.data['id'])
             self.notify('Folder deleted', severity='information')
-            self.populate_children(
-                node=self.collections_tree.cursor_node.parent
-            )
+            self.populate_children(node=parent_node)
             self._sync_content_switcher()
             self.post_message(
-                message=self.FolderDeleted(
-                    folder_id=self.collections_tree.cursor_node.data['id']
-                )
+                message=self.FolderDeleted(folder_id=deleted_node.data['id'])
             )
         else:
-            self.app.requests_repo.delete_by_id(
-                self.collections_tree.cursor_node.data['id']
-            )
+            self.app.requests_repo.delete_by_id(deleted_node.data['id'])
             self.notify('Request deleted', severity='information')
-            self.populate_children(
-                node=self.collections_tree.cursor_node.parent
-            )
+            self.populate_children(node=parent_node)
             self._sync_content_switcher()
             self.post_message(
-                message=self.RequestDeleted(
-                    request_id=self.collections_tree.cursor_node.data['id']
-                )
+                message=self.RequestDeleted(request_id=deleted_node.data['id'])
             )
 
-        if self.collections_tree.cursor_node.parent.children:
+        if parent_node.children:
             next_index_to_select = min(
-                prev_selected_index_in_parent,
-                len(self.collections_tree.cursor_node.parent.children) - 1,
-            )
-            next_node_to_select = (
-                self.collections_tree.cursor_node.parent.children[
-                    next_index_to_select
-                ]
+                prev_selected_index_in_parent, len(parent_node.children) - 1
             )
+            next_node_to_select = parent_node.children[next_index_to_select]
         else:
-            next_node_to_select = self.collections_tree.cursor_node.parent
+            next_node_to_select = parent_node
         self.call_after_refresh(
             lambda: self.collections_tree.select_node(next_node_to_select)
         )
 
+    def _populate_loaded_folders(self, *folder_ids: int | None) -> None:
+        # Folders never expanded have no node yet and are loaded on expand
+        for folder_id in dict.fromkeys(folder_ids):
+            node = self.collections_tree.folder_node_by_id.get(folder_id)
+            if node is None:
+                continue
+            if node is self.collections_tree.root or node.is_expanded:
+                self.populate_children(node)
+
+    def _expand_folders(self, node: TreeNode, folder_ids: set[int]) -> None:
+        """
+        Expand the folders under the node with the given ids, at any depth.
+        """
+        if not folder_ids:
+            return
+
+        for child_node in list(node.children):
+            if (
+                not child_node.allow_expand
+                or child_node.data['id'] not in folder_ids
+            ):
+                continue
+            self.populate_children(child_node)
+            with self.collections_tree.prevent(CollectionsTree.NodeExpanded):
+                child_node.expand()
+            self._expand_folders(node=child_node, folder_ids=folder_ids)
+
+    def _restore_cursor(self, cursor_key: tuple[bool, int] | None) -> None:
+        if cursor_key is None:
+            return
+
+        is_folder, id = cursor_key
+        if is_folder:
+            cursor_node = self.collections_tree.folder_node_by_id.get(id)
+        else:
+            cursor_node = self.collections_tree.request_node_by_id.get(id)
+        if cursor_node is None:
+            return
+
+        # The lines are only rebuilt on refresh, so the cursor (a line
+        # index) is moved back to its node afterwards.
+        self.call_after_refresh(
+            lambda: self.collections_tree.move_cursor(cursor_node)
+        )
+
     def _resolve_all_folder_paths(self) -> list[dict[str, str | int | None]]:
         paths: list[dict[str, str | int | None]] = [{'path': '/', 'id': None}]
 
-        paths_stack: list[tuple[str, int | None]] = [('/', None)]
-        while paths_stack:
-            parent_path, parent_id = paths_stack.pop(0)
+        # A single query for all the folders (already sorted by name),
+        # instead of one per folder
+        children_by_parent_id: dict[int | None, list[Folder]] = {}
+        for folder in self.app.folders_repo.get_all().data:
+            children_by_parent_id.setdefault(folder.parent_id, []).append(
+                folder
+            )
 
-            if parent_id is None:
-                children = self.app.folders_repo.get_roots().data
-            else:
-                children = self.app.folders_repo.get_by_parent_id(
-                    parent_id
-                ).data
+        paths_stack: deque[tuple[str, int | None]] = deque([('/', None)])
+        while paths_stack:
+            parent_path, parent_id = paths_stack.popleft()
 
-            for folder in children:
+            for folder in children_by_parent_id.get(parent_id, []):
                 path = f'{parent_path.rstrip("/")}/{folder.name}'
                 paths.append({'path': path, 'id': folder.id})
                 paths_stack.append((path, folder.id))
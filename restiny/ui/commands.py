@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from textual.command import Hit, Hits, Provider
+
+if TYPE_CHECKING:
+    from restiny.ui.app import RESTinyApp
+
+
+class RequestsSearchProvider(Provider):
+    """
+    Command palette provider that searches the saved requests by name, url,
+    headers and body.
+    """
+
+    app: RESTinyApp
+
+    async def startup(self) -> None:
+        folders = self.app.folders_repo.get_all().data or []
+        folder_by_id = {folder.id: folder for folder in folders}
+
+        self._folder_id_to_path: dict[int, str] = {}
+        for folder in folders:
+            names = []
+            current = folder
+            while current is not None:
+                names.append(current.name)
+                current = folder_by_id.get(current.parent_id)
+            self._folder_id_to_path[folder.id] = '/' + '/'.join(
+                reversed(names)
+            )
+
+    async def search(self, query: str) -> Hits:
+        requests = self.app.requests_repo.search(query).data or []
+        for index, request in enumerate(requests):
+            path = self._folder_id_to_path.get(request.folder_id, '/')
+            yield Hit(
+                score=1 / (index + 1),
+                match_display=f'{request.display_method} {request.name}',
+                command=partial(
+                    self.app.collections_area.reveal_request, request.id
+                ),
+                help=f'{path}  {request.url}',
+            )
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from textual import on
 from textual.app import ComposeResult
-from textual.containers import Container, Horizontal
+from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import (
     Button,
     ContentSwitcher,
@@ -18,7 +18,14 @@ from textual.widgets import (
     TabPane,
 )
 
-from restiny.enums import AuthMode, BodyMode, BodyRawLanguage
+from restiny.entities import Request
+from restiny.enums import (
+    AuthMode,
+    BodyMode,
+    BodyRawLanguage,
+    ContentEncoding,
+    OAuth2GrantType,
+)
 from restiny.widgets import (
     CustomInput,
     CustomTextArea,
@@ -33,6 +40,10 @@ if TYPE_CHECKING:
     from restiny.ui.app import RESTinyApp
 
 
+def _split_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
 class RequestArea(Static):
     app: RESTinyApp
 
@@ -74,6 +85,7 @@ class RequestArea(Static):
                             ('Bearer', AuthMode.BEARER),
                             ('API Key', AuthMode.API_KEY),
                             ('Digest', AuthMode.DIGEST),
+                            ('OAuth2', AuthMode.OAUTH2),
                         ),
                         allow_blank=False,
                         tooltip='Auth mode',
@@ -134,6 +146,80 @@ class RequestArea(Static):
                             id='auth-digest-password',
                         )
 
+                    with Vertical(id='auth-oauth2', classes='mt-1 h-auto'):
+                        with Horizontal(classes='h-auto'):
+                            yield Select(
+                                (
+                                    (
+                                        'Client credentials',
+                                        OAuth2GrantType.CLIENT_CREDENTIALS,
+                                    ),
+                                    ('Password', OAuth2GrantType.PASSWORD),
+                                    (
+                                        'Refresh token',
+                                        OAuth2GrantType.REFRESH_TOKEN,
+                                    ),
+                                ),
+                                allow_blank=False,
+                                tooltip='Grant type',
+                                classes='w-1fr',
+                                id='auth-oauth2-grant-type',
+                            )
+                            yield CustomInput(
+                                placeholder='Token URL',
+                                select_on_focus=False,
+                                classes='w-2fr',
+                                id='auth-oauth2-token-url',
+                            )
+                        with Horizontal(classes='h-auto'):
+                            yield Select(
+                                (
+                                    ('Credentials in header', 'header'),
+                                    ('Credentials in body', 'body'),
+                                ),
+                                allow_blank=False,
+                                tooltip='How the client authenticates',
+                                classes='w-1fr',
+                                id='auth-oauth2-credentials-in',
+                            )
+                            yield CustomInput(
+                                placeholder='Client ID',
+                                select_on_focus=False,
+                                classes='w-1fr',
+                                id='auth-oauth2-client-id',
+                            )
+                            yield PasswordInput(
+                                placeholder='Client secret',
+                                select_on_focus=False,
+                                classes='w-1fr',
+                                id='auth-oauth2-client-secret',
+                            )
+                        yield CustomInput(
+                            placeholder='Scope',
+                            select_on_focus=False,
+                            id='auth-oauth2-scope',
+                        )
+                        with Horizontal(
+                            classes='h-auto', id='auth-oauth2-password-grant'
+                        ):
+                            yield CustomInput(
+                                placeholder='Username',
+                                select_on_focus=False,
+                                classes='w-1fr',
+                                id='auth-oauth2-username',
+                            )
+                            yield PasswordInput(
+                                placeholder='Password',
+                                select_on_focus=False,
+                                classes='w-2fr',
+                                id='auth-oauth2-password',
+                            )
+                        yield PasswordInput(
+                            placeholder='Refresh token',
+                            select_on_focus=False,
+                            id='auth-oauth2-refresh-token',
+                        )
+
                 yield Rule()
 
                 with Horizontal(classes='ml-1 h-auto'):
@@ -235,6 +321,85 @@ class RequestArea(Static):
                     yield Label(
                         'Attach cookies (store and send)', classes='pt-1'
                     )
+                with Horizontal(classes='h-auto'):
+                    yield Switch(id='options-http2')
+                    yield Label(
+                        'HTTP/2 (if the server supports it)', classes='pt-1'
+                    )
+                with Horizontal(classes='h-auto'):
+                    yield Switch(id='options-http-cache')
+                    yield Label(
+                        'Cache (revalidate with ETag/Last-Modified)',
+                        classes='pt-1',
+                    )
+                with Horizontal(classes='mt-1 h-auto'):
+                    yield Label('Compress body', classes='pt-1 ml-1')
+                    yield Select(
+                        (
+                            ('No', ContentEncoding.IDENTITY),
+                            ('gzip', ContentEncoding.GZIP),
+                            ('deflate', ContentEncoding.DEFLATE),
+                            ('brotli', ContentEncoding.BROTLI),
+                            ('zstd', ContentEncoding.ZSTD),
+                        ),
+                        allow_blank=False,
+                        tooltip='Content-Encoding of the request body',
+                        classes='w-1fr',
+                        id='options-compress-body',
+                    )
+                with Horizontal(classes='mt-1 h-auto'):
+                    yield Label('Attempts', classes='pt-1 ml-1')
+                    yield CustomInput(
+                        '1',
+                        placeholder='1',
+                        select_on_focus=False,
+                        type='integer',
+                        tooltip='Attempts in total (1 never retries)',
+                        classes='w-1fr',
+                        id='options-retry-max-attempts',
+                    )
+                    yield Label('Backoff (s)', classes='pt-1 ml-1')
+                    yield CustomInput(
+                        '0.5',
+                        placeholder='0.5',
+                        select_on_focus=False,
+                        type='number',
+                        tooltip='Before the first retry, doubled on each one',
+                        classes='w-1fr',
+                        id='options-retry-backoff-base',
+                    )
+                    yield Label('up to', classes='pt-1')
+                    yield CustomInput(
+                        '30',
+                        placeholder='30',
+                        select_on_focus=False,
+                        type='number',
+                        tooltip='Longest backoff (and Retry-After) waited',
+                        classes='w-1fr',
+                        id='options-retry-backoff-cap',
+                    )
+                with Horizontal(classes='h-auto'):
+                    yield Label('Retry on', classes='pt-1 ml-1')
+                    yield CustomInput(
+                        placeholder='Status codes (e.g. 502, 503)',
+                        select_on_focus=False,
+                        classes='w-1fr',
+                        id='options-retry-status-codes',
+                    )
+                    yield CustomInput(
+                        placeholder='Errors (e.g. ConnectError, ReadError)',
+                        select_on_focus=False,
+                        classes='w-1fr',
+                        id='options-retry-exceptions',
+                    )
+                with Horizontal(classes='h-auto'):
+                    yield Switch(value=True, id='options-retry-jitter')
+                    yield Label('Random backoff (jitter)', classes='pt-1')
+                with Horizontal(classes='h-auto'):
+                    yield Switch(
+                        value=True, id='options-retry-respect-retry-after'
+                    )
+                    yield Label('Wait as Retry-After says', classes='pt-1')
 
     def on_mount(self) -> None:
         self.header_fields = self.query_one('#headers', DynamicFields)
@@ -270,6 +435,36 @@ class RequestArea(Static):
         self.auth_digest_password_input = self.query_one(
             '#auth-digest-password', PasswordInput
         )
+        self.auth_oauth2_grant_type_select = self.query_one(
+            '#auth-oauth2-grant-type', Select
+        )
+        self.auth_oauth2_token_url_input = self.query_one(
+            '#auth-oauth2-token-url', CustomInput
+        )
+        self.auth_oauth2_credentials_in_select = self.query_one(
+            '#auth-oauth2-credentials-in', Select
+        )
+        self.auth_oauth2_client_id_input = self.query_one(
+            '#auth-oauth2-client-id', CustomInput
+        )
+        self.auth_oauth2_client_secret_input = self.query_one(
+            '#auth-oauth2-client-secret', PasswordInput
+        )
+        self.auth_oauth2_scope_input = self.query_one(
+            '#auth-oauth2-scope', CustomInput
+        )
+        self.auth_oauth2_password_grant_container = self.query_one(
+            '#auth-oauth2-password-grant', Horizontal
+        )
+        self.auth_oauth2_username_input = self.query_one(
+            '#auth-oauth2-username', CustomInput
+        )
+        self.auth_oauth2_password_input = self.query_one(
+            '#auth-oauth2-password', PasswordInput
+        )
+        self.auth_oauth2_refresh_token_input = self.query_one(
+            '#auth-oauth2-refresh-token', PasswordInput
+        )
         self.copy_auth_button = self.query_one('#copy-auth', Button)
         self.paste_auth_button = self.query_one('#paste-auth', Button)
 
@@ -302,6 +497,34 @@ class RequestArea(Static):
         self.options_attach_cookies_switch = self.query_one(
             '#options-attach-cookies', Switch
         )
+        self.options_http2_switch = self.query_one('#options-http2', Switch)
+        self.options_http_cache_switch = self.query_one(
+            '#options-http-cache', Switch
+        )
+        self.options_compress_body_select = self.query_one(
+            '#options-compress-body', Select
+        )
+        self.options_retry_max_attempts_input = self.query_one(
+            '#options-retry-max-attempts', CustomInput
+        )
+        self.options_retry_backoff_base_input = self.query_one(
+            '#options-retry-backoff-base', CustomInput
+        )
+        self.options_retry_backoff_cap_input = self.query_one(
+            '#options-retry-backoff-cap', CustomInput
+        )
+        self.options_retry_status_codes_input = self.query_one(
+            '#options-retry-status-codes', CustomInput
+        )
+        self.options_retry_exceptions_input = self.query_one(
+            '#options-retry-exceptions', CustomInput
+        )
+        self.options_retry_jitter_switch = self.query_one(
+            '#options-retry-jitter', Switch
+        )
+        self.options_retry_respect_retry_after_switch = self.query_one(
+            '#options-retry-respect-retry-after', Switch
+        )
 
     @property
     def headers(self) -> list[dict[str, str | bool]]:
@@ -317,20 +540,7 @@ class RequestArea(Static):
 
     @headers.setter
     def headers(self, headers: list[dict[str, str | bool]]) -> None:
-        for field in self.header_fields.fields:
-            self.header_fields.remove_field(field=field)
-
-        for header in headers:
-            self.run_worker(
-                self.header_fields.add_field(
-                    field=TextDynamicField(
-                        enabled=header['enabled'],
-                        key=header['key'],
-                        value=header['value'],
-                    ),
-                    before_last=True,
-                )
-            )
+        self.header_fields.queue_values(headers)
 
     @property
     def params(self) -> list[dict[str, str | bool]]:
@@ -346,20 +556,7 @@ class RequestArea(Static):
 
     @params.setter
     def params(self, params: list[dict[str, str | bool]]) -> None:
-        for field in self.param_fields.fields:
-            self.param_fields.remove_field(field=field)
-
-        for param in params:
-            self.run_worker(
-                self.param_fields.add_field(
-                    field=TextDynamicField(
-                        enabled=param['enabled'],
-                        key=param['key'],
-                        value=param['value'],
-                    ),
-                    before_last=True,
-                )
-            )
+        self.param_fields.queue_values(params)
 
     @property
     def auth_enabled(self) -> bool:
@@ -441,6 +638,78 @@ class RequestArea(Static):
     def auth_digest_password(self, value: str) -> None:
         self.auth_digest_password_input.value = value
 
+    @property
+    def auth_oauth2_grant_type(self) -> OAuth2GrantType:
+        return self.auth_oauth2_grant_type_select.value
+
+    @auth_oauth2_grant_type.setter
+    def auth_oauth2_grant_type(self, value: OAuth2GrantType) -> None:
+        self.auth_oauth2_grant_type_select.value = value
+
+    @property
+    def auth_oauth2_token_url(self) -> str:
+        return self.auth_oauth2_token_url_input.value
+
+    @auth_oauth2_token_url.setter
+    def auth_oauth2_token_url(self, value: str) -> None:
+        self.auth_oauth2_token_url_input.value = value
+
+    @property
+    def auth_oauth2_credentials_in(self) -> str:
+        return self.auth_oauth2_credentials_in_select.value
+
+    @auth_oauth2_credentials_in.setter
+    def auth_oauth2_credentials_in(self, value: str) -> None:
+        self.auth_oauth2_credentials_in_select.value = value
+
+    @property
+    def auth_oauth2_client_id(self) -> str:
+        return self.auth_oauth2_client_id_input.value
+
+    @auth_oauth2_client_id.setter
+    def auth_oauth2_client_id(self, value: str) -> None:
+        self.auth_oauth2_client_id_input.value = value
+
+    @property
+    def auth_oauth2_client_secret(self) -> str:
+        return self.auth_oauth2_client_secret_input.value
+
+    @auth_oauth2_client_secret.setter
+    def auth_oauth2_client_secret(self, value: str) -> None:
+        self.auth_oauth2_client_secret_input.value = value
+
+    @property
+    def auth_oauth2_scope(self) -> str:
+        return self.auth_oauth2_scope_input.value
+
+    @auth_oauth2_scope.setter
+    def auth_oauth2_scope(self, value: str) -> None:
+        self.auth_oauth2_scope_input.value = value
+
+    @property
+    def auth_oauth2_username(self) -> str:
+        return self.auth_oauth2_username_input.value
+
+    @auth_oauth2_username.setter
+    def auth_oauth2_username(self, value: str) -> None:
+        self.auth_oauth2_username_input.value = value
+
+    @property
+    def auth_oauth2_password(self) -> str:
+        return self.auth_oauth2_password_input.value
+
+    @auth_oauth2_password.setter
+    def auth_oauth2_password(self, value: str) -> None:
+        self.auth_oauth2_password_input.value = value
+
+    @property
+    def auth_oauth2_refresh_token(self) -> str:
+        return self.auth_oauth2_refresh_token_input.value
+
+    @auth_oauth2_refresh_token.setter
+    def auth_oauth2_refresh_token(self, value: str) -> None:
+        self.auth_oauth2_refresh_token_input.value = value
+
     @property
     def body_enabled(self) -> bool:
         return self.body_enabled_switch.value
@@ -497,20 +766,7 @@ class RequestArea(Static):
     def body_form_urlencoded(
         self, values: list[dict[str, str | bool]]
     ) -> None:
-        for field in self.body_form_urlencoded_fields.fields:
-            self.body_form_urlencoded_fields.remove_field(field=field)
-
-        for value in values:
-            self.run_worker(
-                self.body_form_urlencoded_fields.add_field(
-                    field=TextDynamicField(
-                        enabled=value['enabled'],
-                        key=value['key'],
-                        value=value['value'],
-                    ),
-                    before_last=True,
-                )
-            )
+        self.body_form_urlencoded_fields.queue_values(values)
 
     @property
     def body_form_multipart(self) -> list[dict[str, str | bool, Path | None]]:
@@ -529,21 +785,7 @@ class RequestArea(Static):
     def body_form_multipart(
         self, values: list[dict[str, str | bool, Path | None]]
     ) -> None:
-        for field in self.body_form_multipart_fields.fields:
-            self.body_form_multipart_fields.remove_field(field=field)
-
-        for value in values:
-            self.run_worker(
-                self.body_form_multipart_fields.add_field(
-                    TextOrFileDynamicField(
-                        enabled=value['enabled'],
-                        key=value['key'],
-                        value=value['value'],
-                        value_kind=value['value_kind'],
-                    ),
-                    before_last=True,
-                )
-            )
+        self.body_form_multipart_fields.queue_values(values)
 
     @property
     def option_timeout(self) -> float | None:
@@ -580,6 +822,78 @@ class RequestArea(Static):
     def option_attach_cookies(self, value: bool) -> None:
         self.options_attach_cookies_switch.value = value
 
+    @property
+    def option_http2(self) -> bool:
+        return self.options_http2_switch.value
+
+    @option_http2.setter
+    def option_http2(self, value: bool) -> None:
+        self.options_http2_switch.value = value
+
+    @property
+    def option_http_cache(self) -> bool:
+        return self.options_http_cache_switch.value
+
+    @option_http_cache.setter
+    def option_http_cache(self, value: bool) -> None:
+        self.options_http_cache_switch.value = value
+
+    @property
+    def option_compress_body(self) -> ContentEncoding:
+        return self.options_compress_body_select.value
+
+    @option_compress_body.setter
+    def option_compress_body(self, value: ContentEncoding) -> None:
+        self.options_compress_body_select.value = value
+
+    @property
+    def option_retry(self) -> Request.RetryPolicy:
+        default = Request.RetryPolicy()
+        try:
+            max_attempts = int(self.options_retry_max_attempts_input.value)
+        except ValueError:
+            max_attempts = default.max_attempts
+        try:
+            backoff_base = float(self.options_retry_backoff_base_input.value)
+        except ValueError:
+            backoff_base = default.backoff_base
+        try:
+            backoff_cap = float(self.options_retry_backoff_cap_input.value)
+        except ValueError:
+            backoff_cap = default.backoff_cap
+
+        return Request.RetryPolicy(
+            max_attempts=max(max_attempts, 1),
+            backoff_base=max(backoff_base, 0),
+            backoff_cap=max(backoff_cap, 0),
+            jitter=self.options_retry_jitter_switch.value,
+            status_codes=[
+                int(status_code)
+                for status_code in _split_list(
+                    self.options_retry_status_codes_input.value
+                )
+                if status_code.isdigit()
+            ],
+            exceptions=_split_list(self.options_retry_exceptions_input.value),
+            respect_retry_after=(
+                self.options_retry_respect_retry_after_switch.value
+            ),
+        )
+
+    @option_retry.setter
+    def option_retry(self, value: Request.RetryPolicy) -> None:
+        self.options_retry_max_attempts_input.value = str(value.max_attempts)
+        self.options_retry_backoff_base_input.value = str(value.backoff_base)
+        self.options_retry_backoff_cap_input.value = str(value.backoff_cap)
+        self.options_retry_status_codes_input.value = ', '.join(
+            str(status_code) for status_code in value.status_codes
+        )
+        self.options_retry_exceptions_input.value = ', '.join(value.exceptions)
+        self.options_retry_jitter_switch.value = value.jitter
+        self.options_retry_respect_retry_after_switch.value = (
+            value.respect_retry_after
+        )
+
     def clear(self) -> None:
         self.headers = []
         self.params = []
@@ -594,6 +908,15 @@ class RequestArea(Static):
         self.auth_api_key_where = 'header'
         self.auth_digest_username = ''
         self.auth_digest_password = ''
+        self.auth_oauth2_grant_type = OAuth2GrantType.CLIENT_CREDENTIALS
+        self.auth_oauth2_token_url = ''
+        self.auth_oauth2_credentials_in = 'header'
+        self.auth_oauth2_client_id = ''
+        self.auth_oauth2_client_secret = ''
+        self.auth_oauth2_scope = ''
+        self.auth_oauth2_username = ''
+        self.auth_oauth2_password = ''
+        self.auth_oauth2_refresh_token = ''
 
         self.body_enabled = False
         self.body_mode = BodyMode.RAW
@@ -606,6 +929,10 @@ class RequestArea(Static):
         self.option_timeout = None
         self.option_follow_redirects = False
         self.option_verify_ssl = False
+        self.option_http2 = False
+        self.option_http_cache = False
+        self.option_compress_body = ContentEncoding.IDENTITY
+        self.option_retry = Request.RetryPolicy()
 
     @on(Select.Changed, '#auth-mode')
     def _on_change_auth_mode(self, message: Select.Changed) -> None:
@@ -617,6 +944,19 @@ class RequestArea(Static):
             self.auth_mode_switcher.current = 'auth-api-key'
         elif message.value == 'digest':
             self.auth_mode_switcher.current = 'auth-digest'
+        elif message.value == 'oauth2':
+            self.auth_mode_switcher.current = 'auth-oauth2'
+
+    @on(Select.Changed, '#auth-oauth2-grant-type')
+    def _on_change_auth_oauth2_grant_type(
+        self, message: Select.Changed
+    ) -> None:
+        self.auth_oauth2_password_grant_container.display = (
+            message.value == OAuth2GrantType.PASSWORD
+        )
+        self.auth_oauth2_refresh_token_input.display = (
+            message.value == OAuth2GrantType.REFRESH_TOKEN
+        )
 
     @on(Select.Changed, '#body-mode')
     def _on_change_body_mode(self, message: Select.Changed) -> None:
@@ -646,6 +986,15 @@ class RequestArea(Static):
             'api_key_value': self.auth_api_key_value,
             'digest_username': self.auth_digest_username,
             'digest_password': self.auth_digest_password,
+            'oauth2_grant_type': self.auth_oauth2_grant_type,
+            'oauth2_token_url': self.auth_oauth2_token_url,
+            'oauth2_credentials_in': self.auth_oauth2_credentials_in,
+            'oauth2_client_id': self.auth_oauth2_client_id,
+            'oauth2_client_secret': self.auth_oauth2_client_secret,
+            'oauth2_scope': self.auth_oauth2_scope,
+            'oauth2_username': self.auth_oauth2_username,
+            'oauth2_password': self.auth_oauth2_password,
+            'oauth2_refresh_token': self.auth_oauth2_refresh_token,
         }
 
         self.app.notify('Auth copied')
@@ -671,5 +1020,27 @@ class RequestArea(Static):
         elif self._auth_clipboard['mode'] == AuthMode.DIGEST:
             self.auth_digest_username = self._auth_clipboard['digest_username']
             self.auth_digest_password = self._auth_clipboard['digest_password']
+        elif self._auth_clipboard['mode'] == AuthMode.OAUTH2:
+            self.auth_oauth2_grant_type = self._auth_clipboard[
+                'oauth2_grant_type'
+            ]
+            self.auth_oauth2_token_url = self._auth_clipboard[
+                'oauth2_token_url'
+            ]
+            self.auth_oauth2_credentials_in = self._auth_clipboard[
+                'oauth2_credentials_in'
+            ]
+            self.auth_oauth2_client_id = self._auth_clipboard[
+                'oauth2_client_id'
+            ]
+            self.auth_oauth2_client_secret = self._auth_clipboard[
+                'oauth2_client_secret'
+            ]
+            self.auth_oauth2_scope = self._auth_clipboard['oauth2_scope']
+            self.auth_oauth2_username = self._auth_clipboard['oauth2_username']
+            self.auth_oauth2_password = self._auth_clipboard['oauth2_password']
+            self.auth_oauth2_refresh_token = self._auth_clipboard[
+                'oauth2_refresh_token'
+            ]
 
         self.app.notify('Auth pasted')
@@ -1,4 +1,6 @@
 import re
+from collections import deque
+from datetime import datetime
 from http import HTTPStatus
 
 from textual import on
@@ -15,8 +17,13 @@ from textual.widgets import (
 )
 
 from restiny.enums import BodyRawLanguage
+from restiny.sse import ServerSentEvent
 from restiny.widgets import CustomTextArea
 
+# Events of an event stream kept in the "Events" tab; the oldest ones are
+# dropped as new ones arrive
+EVENTS_BUFFER_SIZE = 1000
+
 
 # TODO: Implement 'Trace' tab pane
 class ResponseArea(Static):
@@ -45,7 +52,10 @@ class ResponseArea(Static):
         self._title_regex = (
             rf'^{self.BORDER_TITLE}\s+(?P<code>\d{{3}})\((?P<phrase>[^)]+)\)$'
         )
-        self._subtitle_regex = r'^(?P<content_size>\d+)\s+bytes\s+in\s+(?P<elapsed_time>[\d.]+)\s+seconds$'
+        self._event_row_keys: deque = deque()
+        self._events_count = 0
+        self._is_streaming_events = False
+        self._subtitle_regex = r'^(?P<content_size>\d+)\s+bytes\s+in\s+(?P<elapsed_time>[\d.]+)\s+seconds(?:\s+\(from cache, (?P<cache_saved>[^)]+) saved\))?$'
 
     def compose(self) -> ComposeResult:
         with ContentSwitcher(id='response-switcher', initial='no-content'):
@@ -55,7 +65,7 @@ class ResponseArea(Static):
             )
 
             with TabbedContent(id='content'):
-                with TabPane('Headers'):
+                with TabPane('Headers', id='headers-tab'):
                     with VerticalScroll():
                         yield DataTable(show_cursor=False, id='headers')
                 with TabPane('Body'):
@@ -74,6 +84,13 @@ class ResponseArea(Static):
                     yield CustomTextArea.code_editor(
                         id='body-raw', read_only=True, classes='mt-1'
                     )
+                with TabPane('Info'):
+                    with VerticalScroll():
+                        yield DataTable(show_cursor=False, id='info')
+                with TabPane('Events', id='events-tab'):
+                    yield DataTable(
+                        cursor_type='row', zebra_stripes=True, id='events'
+                    )
 
     def on_mount(self) -> None:
         self._response_switcher = self.query_one(
@@ -85,8 +102,16 @@ class ResponseArea(Static):
             '#body-raw-language', Select
         )
         self.body_raw_editor = self.query_one('#body-raw', CustomTextArea)
+        self.info_data_table = self.query_one('#info', DataTable)
+        self.content_tabbed_content = self.query_one('#content', TabbedContent)
+        self.events_data_table = self.query_one('#events', DataTable)
 
         self.headers_data_table.add_columns('Key', 'Value')
+        self.info_data_table.add_columns('Key', 'Value')
+        self.events_data_table.add_columns(
+            '#', 'Arrived', 'Since previous (ms)', 'Event', 'ID', 'Data'
+        )
+        self.content_tabbed_content.hide_tab('events-tab')
 
     @property
     def status(self) -> HTTPStatus | None:
@@ -113,10 +138,12 @@ class ResponseArea(Static):
         match = re.match(self._subtitle_regex, self.border_subtitle)
         if match:
             elapsed_time = match['elapsed_time']
+            cache_saved = match['cache_saved']
         else:
             elapsed_time = '0'
+            cache_saved = None
 
-        self.border_subtitle = f'{value} bytes in {elapsed_time} seconds'
+        self._set_subtitle(value, elapsed_time, cache_saved)
 
     @property
     def elapsed_time(self) -> float | None:
@@ -130,10 +157,46 @@ class ResponseArea(Static):
         match = re.match(self._subtitle_regex, self.border_subtitle)
         if match:
             content_size = match['content_size']
+            cache_saved = match['cache_saved']
         else:
             content_size = '0'
+            cache_saved = None
 
-        self.border_subtitle = f'{content_size} bytes in {value} seconds'
+        self._set_subtitle(content_size, value, cache_saved)
+
+    @property
+    def cache_saved(self) -> str | None:
+        """
+        The formatted amount of bytes saved when the body came from the
+        cache, `None` when it was downloaded.
+        """
+        match = re.match(self._subtitle_regex, self.border_subtitle)
+        if match:
+            return match['cache_saved']
+        return None
+
+    @cache_saved.setter
+    def cache_saved(self, value: str | None) -> None:
+        match = re.match(self._subtitle_regex, self.border_subtitle)
+        if match:
+            content_size = match['content_size']
+            elapsed_time = match['elapsed_time']
+        else:
+            content_size = '0'
+            elapsed_time = '0'
+
+        self._set_subtitle(content_size, elapsed_time, value)
+
+    def _set_subtitle(
+        self,
+        content_size: int | str,
+        elapsed_time: float | str,
+        cache_saved: str | None,
+    ) -> None:
+        subtitle = f'{content_size} bytes in {elapsed_time} seconds'
+        if cache_saved is not None:
+            subtitle += f' (from cache, {cache_saved} saved)'
+        self.border_subtitle = subtitle
 
     @property
     def headers(self) -> dict[str, str]:
@@ -149,6 +212,60 @@ class ResponseArea(Static):
         for header_key, header_value in value.items():
             self.headers_data_table.add_row(header_key, header_value)
 
+    @property
+    def info(self) -> dict[str, str]:
+        info = {}
+        for row_key in self.info_data_table.rows:
+            cells = self.info_data_table.get_row(row_key)
+            info[cells[0]] = cells[1]
+        return info
+
+    @info.setter
+    def info(self, value: dict[str, str]) -> None:
+        self.info_data_table.clear()
+        for info_key, info_value in value.items():
+            self.info_data_table.add_row(info_key, info_value)
+
+    @property
+    def is_streaming_events(self) -> bool:
+        return self._is_streaming_events
+
+    @is_streaming_events.setter
+    def is_streaming_events(self, value: bool) -> None:
+        self._is_streaming_events = value
+        if value is True:
+            self.content_tabbed_content.show_tab('events-tab')
+            self.content_tabbed_content.active = 'events-tab'
+        elif value is False:
+            if self.content_tabbed_content.active == 'events-tab':
+                self.content_tabbed_content.active = 'headers-tab'
+            self.content_tabbed_content.hide_tab('events-tab')
+
+    def add_event(
+        self,
+        event: ServerSentEvent,
+        arrived_at: datetime,
+        since_previous_ms: float,
+    ) -> None:
+        if len(self._event_row_keys) >= EVENTS_BUFFER_SIZE:
+            self.events_data_table.remove_row(self._event_row_keys.popleft())
+
+        # Follow the new events, unless scrolled up to read older ones
+        follow = self.events_data_table.is_vertical_scroll_end
+        self._events_count += 1
+        self._event_row_keys.append(
+            self.events_data_table.add_row(
+                str(self._events_count),
+                arrived_at.strftime('%H:%M:%S.%f')[:-3],
+                f'{since_previous_ms:.1f}',
+                event.event,
+                event.id or '',
+                event.data.replace('\n', '\\n'),
+            )
+        )
+        if follow:
+            self.events_data_table.scroll_end(animate=False)
+
     @property
     def body_raw_language(self) -> BodyRawLanguage:
         return self.body_raw_language_select.value
@@ -183,6 +300,11 @@ class ResponseArea(Static):
         self.border_title = self.BORDER_TITLE
         self.border_subtitle = ''
         self.headers_data_table.clear()
+        self.info_data_table.clear()
+        self.events_data_table.clear()
+        self._event_row_keys.clear()
+        self._events_count = 0
+        self.is_streaming_events = False
         self.body_raw_language_select.value = BodyRawLanguage.PLAIN
         self.body_raw_editor.clear()
 
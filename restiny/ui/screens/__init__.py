@@ -1,27 +1,79 @@
 """
 This module exports screen classes used in the RESTiny interface.
+
+The screens are only imported on first access (PEP 562), so the app
+startup doesn't pay for screens (and their dependencies) never opened.
 """
 
-from restiny.ui.screens.environments_screen import EnvironmentsScreen
-from restiny.ui.screens.openapi_spec_import_screen import (
-    OpenapiSpecImportScreen,
-)
-from restiny.ui.screens.postman_collection_import_screen import (
-    PostmanCollectionImportScreen,
-)
-from restiny.ui.screens.postman_environment_import_screen import (
-    PostmanEnvironmentImportScreen,
-)
-from restiny.ui.screens.request_or_folder_screen import (
-    AddRequestOrFolderScreen,
-)
-from restiny.ui.screens.settings_screen import SettingsScreen
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from restiny.ui.screens.cassette_replay_screen import (
+        CassetteReplayScreen,
+    )
+    from restiny.ui.screens.cookies_screen import CookiesScreen
+    from restiny.ui.screens.environments_screen import EnvironmentsScreen
+    from restiny.ui.screens.memory_report_screen import MemoryReportScreen
+    from restiny.ui.screens.mock_server_screen import MockServerScreen
+    from restiny.ui.screens.openapi_spec_import_screen import (
+        OpenapiSpecImportScreen,
+    )
+    from restiny.ui.screens.postman_collection_import_screen import (
+        PostmanCollectionImportScreen,
+    )
+    from restiny.ui.screens.postman_environment_import_screen import (
+        PostmanEnvironmentImportScreen,
+    )
+    from restiny.ui.screens.profiler_report_screen import (
+        ProfilerReportScreen,
+    )
+    from restiny.ui.screens.request_or_folder_screen import (
+        AddRequestOrFolderScreen,
+    )
+    from restiny.ui.screens.settings_screen import SettingsScreen
+    from restiny.ui.screens.websocket_screen import WebSocketScreen
+
+_SCREEN_TO_MODULE = {
+    'CassetteReplayScreen': 'restiny.ui.screens.cassette_replay_screen',
+    'CookiesScreen': 'restiny.ui.screens.cookies_screen',
+    'EnvironmentsScreen': 'restiny.ui.screens.environments_screen',
+    'MockServerScreen': 'restiny.ui.screens.mock_server_screen',
+    'MemoryReportScreen': 'restiny.ui.screens.memory_report_screen',
+    'OpenapiSpecImportScreen': 'restiny.ui.screens.openapi_spec_import_screen',
+    'PostmanCollectionImportScreen': (
+        'restiny.ui.screens.postman_collection_import_screen'
+    ),
+    'PostmanEnvironmentImportScreen': (
+        'restiny.ui.screens.postman_environment_import_screen'
+    ),
+    'ProfilerReportScreen': 'restiny.ui.screens.profiler_report_screen',
+    'AddRequestOrFolderScreen': 'restiny.ui.screens.request_or_folder_screen',
+    'SettingsScreen': 'restiny.ui.screens.settings_screen',
+    'WebSocketScreen': 'restiny.ui.screens.websocket_screen',
+}
+
+
+def __getattr__(name: str):
+    if name not in _SCREEN_TO_MODULE:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    screen = getattr(import_module(_SCREEN_TO_MODULE[name]), name)
+    globals()[name] = screen
+    return screen
+
 
 __all__ = [
+    'CassetteReplayScreen',
+    'CookiesScreen',
     'EnvironmentsScreen',
+    'MemoryReportScreen',
+    'MockServerScreen',
     'OpenapiSpecImportScreen',
     'PostmanCollectionImportScreen',
     'PostmanEnvironmentImportScreen',
+    'ProfilerReportScreen',
     'AddRequestOrFolderScreen',
     'SettingsScreen',
+    'WebSocketScreen',
 ]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label
+
+from restiny.cassettes import Cassette
+from restiny.consts import CASSETTES_DIR
+from restiny.logger import get_logger
+from restiny.widgets import CustomInput, PathChooser
+
+if TYPE_CHECKING:
+    from restiny.ui.app import RESTinyApp
+
+
+logger = get_logger()
+
+
+class CassetteReplayScreen(ModalScreen):
+    """
+    Choose a cassette and the latency of its responses; dismissed with
+    `(cassette, latency_seconds)`, where a `None` latency is the recorded
+    one.
+    """
+
+    app: RESTinyApp
+
+    DEFAULT_CSS = """
+    CassetteReplayScreen {
+        align: center middle;
+    }
+
+    #modal-content {
+        width: 40%;
+        height: auto;
+        border: heavy $panel;
+        border-title-color: $text-muted;
+        background: $surface;
+    }
+    """
+
+    BINDINGS = [
+        Binding(
+            key='escape',
+            action='dismiss',
+            description='Quit the screen',
+            show=False,
+        ),
+    ]
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='modal-content'):
+            with Horizontal(classes='w-auto h-auto p-1'):
+                yield PathChooser.file(
+                    id='cassette-file', allowed_file_suffixes=['.jsonl']
+                )
+            with Horizontal(classes='w-auto h-auto px-1'):
+                yield Label('Latency (ms)', classes='pt-1')
+                yield CustomInput(
+                    placeholder='Recorded',
+                    select_on_focus=False,
+                    type='number',
+                    valid_empty=True,
+                    classes='w-1fr',
+                    id='latency',
+                )
+            with Horizontal(classes='w-auto h-auto'):
+                yield Button('Cancel', classes='w-1fr', id='cancel')
+                yield Button('Confirm', classes='w-1fr', id='confirm')
+
+    def on_mount(self) -> None:
+        self.modal_content = self.query_one('#modal-content', Vertical)
+
+        self.cassette_file_chooser = self.query_one(
+            '#cassette-file', PathChooser
+        )
+        self.latency_input = self.query_one('#latency', CustomInput)
+        self.cancel_button = self.query_one('#cancel', Button)
+        self.confirm_button = self.query_one('#confirm', Button)
+
+        self.modal_content.border_title = 'Replay cassette'
+
+        recorded_cassettes = sorted(CASSETTES_DIR.glob('*.jsonl'))
+        if recorded_cassettes:
+            self.cassette_file_chooser.path = recorded_cassettes[-1]
+
+    @on(Button.Pressed, '#cancel')
+    def _on_cancel(self) -> None:
+        self.dismiss(result=None)
+
+    @on(Button.Pressed, '#confirm')
+    def _on_confirm(self) -> None:
+        latency_seconds = None
+        if self.latency_input.value:
+            try:
+                latency_seconds = float(self.latency_input.value) / 1000
+            except ValueError:
+                self.notify('Invalid latency', severity='error')
+                return
+
+        cassette_file = self.cassette_file_chooser.path
+        if cassette_file is None:
+            self.notify('Choose a cassette file', severity='error')
+            return
+
+        try:
+            cassette = Cassette.load(cassette_file)
+        except Exception:
+            self.notify('Invalid cassette file', severity='error')
+            logger.exception('Failed to load the cassette')
+            return
+
+        self.dismiss(result=(cassette, latency_seconds))
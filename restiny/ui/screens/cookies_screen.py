@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable
+
+if TYPE_CHECKING:
+    from http.cookiejar import Cookie as JarCookie
+
+    import httpx
+
+    from restiny.ui.app import RESTinyApp
+
+
+class CookiesScreen(ModalScreen):
+    """
+    The cookies of an environment; deletions apply to its jar right away.
+    """
+
+    app: RESTinyApp
+
+    DEFAULT_CSS = """
+    CookiesScreen {
+        align: center middle;
+    }
+
+    #modal-content {
+        width: 90%;
+        height: 80%;
+        border: heavy $panel;
+        border-title-color: $text-muted;
+        border-subtitle-color: $text-muted;
+        background: $surface;
+    }
+    """
+    AUTO_FOCUS = '#cookies'
+
+    BINDINGS = [
+        Binding(
+            key='escape',
+            action='dismiss',
+            description='Quit the screen',
+            show=False,
+        ),
+        Binding(
+            key='delete',
+            action='delete_cookie',
+            description='Delete the cookie',
+            show=False,
+        ),
+    ]
+
+    def __init__(
+        self,
+        cookies: httpx.Cookies,
+        environment: str,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.cookies = cookies
+        self.environment = environment
+        self._row_key_to_jar_cookie: dict[object, JarCookie] = {}
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='modal-content'):
+            yield DataTable(
+                cursor_type='row', zebra_stripes=True, id='cookies'
+            )
+            with Horizontal(classes='w-auto h-auto mt-1'):
+                yield Button('Delete', classes='w-1fr', id='delete')
+                yield Button('Clear all', classes='w-1fr', id='clear')
+                yield Button('Close', classes='w-1fr', id='close')
+
+    def on_mount(self) -> None:
+        self.modal_content = self.query_one('#modal-content', Vertical)
+        self.cookies_table = self.query_one('#cookies', DataTable)
+        self.delete_button = self.query_one('#delete', Button)
+        self.clear_button = self.query_one('#clear', Button)
+        self.close_button = self.query_one('#close', Button)
+
+        self.modal_content.border_title = f'Cookies of {self.environment}'
+        self.cookies_table.add_columns(
+            'Domain', 'Path', 'Name', 'Value', 'Expires', 'Secure', 'HttpOnly'
+        )
+        self._populate()
+
+    def action_delete_cookie(self) -> None:
+        if self.cookies_table.row_count == 0:
+            return
+
+        row_key = self.cookies_table.coordinate_to_cell_key(
+            self.cookies_table.cursor_coordinate
+        ).row_key
+        jar_cookie = self._row_key_to_jar_cookie[row_key]
+        self.cookies.jar.clear(
+            domain=jar_cookie.domain,
+            path=jar_cookie.path,
+            name=jar_cookie.name,
+        )
+        self._populate()
+
+    def _populate(self) -> None:
+        self.cookies_table.clear()
+        self._row_key_to_jar_cookie.clear()
+
+        jar_cookies = sorted(
+            self.cookies.jar,
+            key=lambda jar_cookie: (
+                jar_cookie.domain,
+                jar_cookie.path,
+                jar_cookie.name,
+            ),
+        )
+        for jar_cookie in jar_cookies:
+            expires = 'Session'
+            if jar_cookie.expires is not None:
+                expires = datetime.fromtimestamp(jar_cookie.expires).strftime(
+                    '%Y-%m-%d %H:%M:%S'
+                )
+            row_key = self.cookies_table.add_row(
+                jar_cookie.domain,
+                jar_cookie.path,
+                jar_cookie.name,
+                jar_cookie.value or '',
+                expires,
+                'Yes' if jar_cookie.secure else 'No',
+                'Yes' if jar_cookie.has_nonstandard_attr('HttpOnly') else 'No',
+            )
+            self._row_key_to_jar_cookie[row_key] = jar_cookie
+
+        self.modal_content.border_subtitle = f'{len(jar_cookies)} cookies'
+        self.delete_button.disabled = not jar_cookies
+        self.clear_button.disabled = not jar_cookies
+
+    @on(Button.Pressed, '#delete')
+    def _on_delete(self) -> None:
+        self.action_delete_cookie()
+
+    @on(Button.Pressed, '#clear')
+    def _on_clear(self) -> None:
+        self.cookies.jar.clear()
+        self._populate()
+
+    @on(Button.Pressed, '#close')
+    def _on_close(self) -> None:
+        self.dismiss()
@@ -10,7 +10,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Label, ListItem, ListView, Rule
 
 from restiny.entities import Environment
-from restiny.widgets import DynamicFields, TextDynamicField
+from restiny.widgets import VariablesTable
 from restiny.widgets.custom_input import CustomInput
 
 if TYPE_CHECKING:
@@ -93,13 +93,7 @@ class EnvironmentsScreen(ModalScreen):
                             classes='w-1fr',
                             id='delete-environment',
                         )
-                    yield DynamicFields(
-                        fields=[
-                            TextDynamicField(enabled=False, key='', value='')
-                        ],
-                        classes='mt-1',
-                        id='variables',
-                    )
+                    yield VariablesTable(classes='mt-1', id='variables')
                     yield Label(
                         "[i]Tip: You can use [b]'{{var}}'[/] or [b]'${var}'[/] to reference variables.[/]",
                         classes='mt-1',
@@ -125,9 +119,7 @@ class EnvironmentsScreen(ModalScreen):
         self.delete_environment_button = self.query_one(
             '#delete-environment', Button
         )
-        self.variables_dynamic_fields = self.query_one(
-            '#variables', DynamicFields
-        )
+        self.variables_table = self.query_one('#variables', VariablesTable)
         self.close_button = self.query_one('#close', Button)
 
         self.modal_content.border_title = 'Environments'
@@ -158,26 +150,29 @@ class EnvironmentsScreen(ModalScreen):
 
     @on(ListView.Selected, '#environments-list')
     async def _on_select_environment(self) -> None:
+        if self.variables_table.is_dirty:
+            self.notify(
+                'Unsaved variable changes were discarded', severity='warning'
+            )
+
         self.environment_rename_input.value = self._selected_env_name
         is_global = self._selected_env_name == 'global'
         self.environment_rename_input.disabled = is_global
         self.delete_environment_button.disabled = is_global
 
-        for field in self.variables_dynamic_fields.fields:
-            self.variables_dynamic_fields.remove_field(field=field)
-
         environment = self.app.environments_repo.get_by_id(
             self._selected_env_id
         ).data
-        for variable in environment.variables:
-            await self.variables_dynamic_fields.add_field(
-                field=TextDynamicField(
-                    enabled=variable.enabled,
-                    key=variable.key,
-                    value=variable.value,
-                ),
-                before_last=True,
-            )
+        self.variables_table.set_variables(
+            [
+                {
+                    'enabled': variable.enabled,
+                    'key': variable.key,
+                    'value': variable.value,
+                }
+                for variable in environment.variables
+            ]
+        )
 
     @on(Button.Pressed, '#add-environment')
     @on(CustomInput.Submitted, '#environment-name')
@@ -211,17 +206,24 @@ class EnvironmentsScreen(ModalScreen):
             self.notify('Environment name is required', severity='error')
             return
 
+        if (
+            self.environment_rename_input.value == self._selected_env_name
+            and not self.variables_table.is_dirty
+        ):
+            self.notify('No changes to save', severity='information')
+            return
+
         update_resp = self.app.environments_repo.update(
             Environment(
                 id=self._selected_env_id,
                 name=self.environment_rename_input.value,
                 variables=[
                     Environment.Variable(
-                        enabled=variable.enabled,
-                        key=variable.key,
-                        value=variable.value,
+                        enabled=variable['enabled'],
+                        key=variable['key'],
+                        value=variable['value'],
                     )
-                    for variable in self.variables_dynamic_fields.filled_fields
+                    for variable in self.variables_table.variables
                 ],
             )
         )
@@ -235,6 +237,7 @@ class EnvironmentsScreen(ModalScreen):
         self.environments_list.children[self.environments_list.index].children[
             0
         ].update(update_resp.data.name)
+        self.variables_table.mark_saved()
         self.notify('Environment updated', severity='information')
 
     @on(Button.Pressed, '#delete-environment')
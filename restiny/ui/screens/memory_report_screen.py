@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Label
+
+from restiny.memory import get_memory_tracer
+from restiny.utils import format_bytes
+
+if TYPE_CHECKING:
+    from restiny.ui.app import RESTinyApp
+
+
+class MemoryReportScreen(ModalScreen):
+    app: RESTinyApp
+
+    DEFAULT_CSS = """
+    MemoryReportScreen {
+        align: center middle;
+    }
+
+    #modal-content {
+        width: 80%;
+        height: 80%;
+        border: heavy $panel;
+        border-title-color: $text-muted;
+        background: $surface;
+    }
+
+    #usage {
+        height: auto;
+    }
+
+    #allocations-hint {
+        height: auto;
+        color: $text-muted;
+    }
+    """
+    AUTO_FOCUS = '#refresh'
+
+    BINDINGS = [
+        Binding(
+            key='escape',
+            action='dismiss',
+            description='Quit the screen',
+            show=False,
+        ),
+    ]
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='modal-content'):
+            yield DataTable(show_header=False, cursor_type='none', id='usage')
+            yield Label(classes='px-1 mt-1', id='allocations-hint')
+            yield DataTable(
+                cursor_type='row', zebra_stripes=True, id='allocations'
+            )
+            with Horizontal(classes='w-auto h-auto'):
+                yield Button(label='Refresh', classes='w-1fr', id='refresh')
+                yield Button(label='Snapshot', classes='w-1fr', id='snapshot')
+                yield Button(
+                    label='Stop tracing', classes='w-1fr', id='stop-tracing'
+                )
+                yield Button(label='Close', classes='w-1fr', id='close')
+
+    def on_mount(self) -> None:
+        self.modal_content = self.query_one('#modal-content', Vertical)
+        self.usage_table = self.query_one('#usage', DataTable)
+        self.allocations_hint_label = self.query_one(
+            '#allocations-hint', Label
+        )
+        self.allocations_table = self.query_one('#allocations', DataTable)
+        self.refresh_button = self.query_one('#refresh', Button)
+        self.snapshot_button = self.query_one('#snapshot', Button)
+        self.stop_tracing_button = self.query_one('#stop-tracing', Button)
+        self.close_button = self.query_one('#close', Button)
+
+        self.modal_content.border_title = 'Memory usage'
+
+        self.usage_table.add_columns('Item', 'Value')
+        self.allocations_table.add_columns(
+            'Allocation site', 'Size', 'Size diff', 'Blocks', 'Blocks diff'
+        )
+        self._populate_usage()
+        self._sync_tracing()
+
+    def _populate_usage(self) -> None:
+        self.usage_table.clear()
+        for label, value in self.app.memory_usage():
+            self.usage_table.add_row(label, Text(value, justify='right'))
+
+    def _sync_tracing(self) -> None:
+        is_tracing = get_memory_tracer().is_tracing
+        self.stop_tracing_button.disabled = not is_tracing
+        if is_tracing:
+            self.allocations_hint_label.update(
+                'Tracing allocations; "Snapshot" shows the growth since '
+                'the previous snapshot'
+            )
+        else:
+            self.allocations_hint_label.update(
+                '"Snapshot" starts tracing allocations (slows the app down '
+                'until stopped)'
+            )
+
+    @on(Button.Pressed, '#refresh')
+    def _on_refresh(self, message: Button.Pressed) -> None:
+        self._populate_usage()
+
+    @on(Button.Pressed, '#snapshot')
+    def _on_snapshot(self, message: Button.Pressed) -> None:
+        memory_tracer = get_memory_tracer()
+        if not memory_tracer.is_tracing:
+            memory_tracer.start()
+            self.notify('Tracing started; first snapshot taken')
+            self._sync_tracing()
+            return
+
+        self.allocations_table.clear()
+        for allocation in memory_tracer.diff():
+            self.allocations_table.add_row(
+                allocation.site,
+                Text(format_bytes(allocation.size_bytes), justify='right'),
+                Text(
+                    f'{"+" if allocation.size_diff_bytes >= 0 else "-"}'
+                    f'{format_bytes(abs(allocation.size_diff_bytes))}',
+                    justify='right',
+                ),
+                Text(str(allocation.count), justify='right'),
+                Text(f'{allocation.count_diff:+}', justify='right'),
+            )
+        self._populate_usage()
+
+    @on(Button.Pressed, '#stop-tracing')
+    def _on_stop_tracing(self, message: Button.Pressed) -> None:
+        get_memory_tracer().stop()
+        self.allocations_table.clear()
+        self._sync_tracing()
+
+    @on(Button.Pressed, '#close')
+    def _on_close(self, message: Button.Pressed) -> None:
+        self.dismiss()
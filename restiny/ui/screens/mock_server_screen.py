@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label
+
+from restiny.cassettes import Cassette
+from restiny.logger import get_logger
+from restiny.mock_server import (
+    MockRoute,
+    MockServer,
+    routes_from_cassette,
+    routes_from_spec,
+)
+from restiny.openapi import InvalidSpecFileError, load_spec
+from restiny.widgets import CustomInput, PathChooser
+
+if TYPE_CHECKING:
+    from restiny.ui.app import RESTinyApp
+
+
+logger = get_logger()
+
+
+class MockServerScreen(ModalScreen):
+    """
+    Configure a mock server from an OpenAPI spec or a cassette; dismissed
+    with the `MockServer`, not started yet.
+    """
+
+    app: RESTinyApp
+
+    DEFAULT_CSS = """
+    MockServerScreen {
+        align: center middle;
+    }
+
+    #modal-content {
+        width: 40%;
+        height: auto;
+        border: heavy $panel;
+        border-title-color: $text-muted;
+        background: $surface;
+    }
+
+    #modal-content Label {
+        width: 16;
+    }
+    """
+
+    BINDINGS = [
+        Binding(
+            key='escape',
+            action='dismiss',
+            description='Quit the screen',
+            show=False,
+        ),
+    ]
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='modal-content'):
+            with Horizontal(classes='w-auto h-auto p-1'):
+                yield PathChooser.file(
+                    id='source-file',
+                    allowed_file_suffixes=['.json', '.yaml', '.yml', '.jsonl'],
+                )
+            with Horizontal(classes='w-auto h-auto px-1'):
+                yield Label('Port', classes='pt-1')
+                yield CustomInput(
+                    placeholder='Random',
+                    select_on_focus=False,
+                    type='integer',
+                    valid_empty=True,
+                    classes='w-1fr',
+                    id='port',
+                )
+            with Horizontal(classes='w-auto h-auto px-1'):
+                yield Label('Latency (ms)', classes='pt-1')
+                yield CustomInput(
+                    '0',
+                    placeholder='0',
+                    select_on_focus=False,
+                    type='number',
+                    classes='w-1fr',
+                    id='latency',
+                )
+            with Horizontal(classes='w-auto h-auto px-1'):
+                yield Label('Jitter (± ms)', classes='pt-1')
+                yield CustomInput(
+                    '0',
+                    placeholder='0',
+                    select_on_focus=False,
+                    type='number',
+                    classes='w-1fr',
+                    id='jitter',
+                )
+            with Horizontal(classes='w-auto h-auto px-1'):
+                yield Label('Error rate (%)', classes='pt-1')
+                yield CustomInput(
+                    '0',
+                    placeholder='0',
+                    select_on_focus=False,
+                    type='number',
+                    tooltip='Share of the requests answered with a 503',
+                    classes='w-1fr',
+                    id='error-rate',
+                )
+            with Horizontal(classes='w-auto h-auto'):
+                yield Button('Cancel', classes='w-1fr', id='cancel')
+                yield Button('Start', classes='w-1fr', id='start')
+
+    def on_mount(self) -> None:
+        self.modal_content = self.query_one('#modal-content', Vertical)
+
+        self.source_file_chooser = self.query_one('#source-file', PathChooser)
+        self.port_input = self.query_one('#port', CustomInput)
+        self.latency_input = self.query_one('#latency', CustomInput)
+        self.jitter_input = self.query_one('#jitter', CustomInput)
+        self.error_rate_input = self.query_one('#error-rate', CustomInput)
+        self.cancel_button = self.query_one('#cancel', Button)
+        self.start_button = self.query_one('#start', Button)
+
+        self.modal_content.border_title = 'Mock server'
+        self.modal_content.border_subtitle = (
+            'From an OpenAPI spec or a cassette (.jsonl)'
+        )
+
+    @on(Button.Pressed, '#cancel')
+    def _on_cancel(self) -> None:
+        self.dismiss(result=None)
+
+    @on(Button.Pressed, '#start')
+    async def _on_start(self) -> None:
+        source_file = self.source_file_chooser.path
+        if source_file is None:
+            self.notify(
+                'OpenAPI spec or cassette file is required', severity='error'
+            )
+            return
+
+        try:
+            port = int(self.port_input.value or 0)
+            latency_ms = float(self.latency_input.value or 0)
+            jitter_ms = float(self.jitter_input.value or 0)
+            error_rate = float(self.error_rate_input.value or 0) / 100
+        except ValueError:
+            self.notify('Invalid number', severity='error')
+            return
+        if not 0 <= port <= 65535:
+            self.notify(
+                'The port must be between 0 and 65535', severity='error'
+            )
+            return
+        if latency_ms < 0 or jitter_ms < 0:
+            self.notify(
+                'Latency and jitter cannot be negative', severity='error'
+            )
+            return
+        if not 0 <= error_rate <= 1:
+            self.notify(
+                'The error rate must be between 0 and 100', severity='error'
+            )
+            return
+
+        self.modal_content.loading = True
+        try:
+            # Parsing a big spec can take a while; keep the UI responsive
+            routes = await asyncio.to_thread(
+                self._load_routes, source_file=source_file
+            )
+        except InvalidSpecFileError:
+            self.notify('Invalid openapi spec file', severity='error')
+            return
+        except Exception:
+            self.notify('Invalid openapi spec or cassette', severity='error')
+            logger.exception('Failed to load the mock server routes')
+            return
+        finally:
+            self.modal_content.loading = False
+
+        self.dismiss(
+            result=MockServer(
+                routes=routes,
+                port=port,
+                latency_ms=latency_ms,
+                jitter_ms=jitter_ms,
+                error_rate=error_rate,
+            )
+        )
+
+    def _load_routes(self, source_file: Path) -> list[MockRoute]:
+        if source_file.suffix == '.jsonl':
+            return routes_from_cassette(cassette=Cassette.load(source_file))
+        return routes_from_spec(spec=load_spec(spec_file=source_file))
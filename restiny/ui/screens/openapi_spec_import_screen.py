@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-from datetime import UTC, date, datetime
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-import yaml
+from sqlalchemy.orm import Session
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Button
+from textual.widgets import Button, Select
 
 from restiny.entities import Folder, Request
 from restiny.enums import BodyMode, BodyRawLanguage, HTTPMethod
 from restiny.logger import get_logger
+from restiny.openapi import (
+    InvalidSpecFileError,
+    build_json_body_from_schema,
+    get_spec_version,
+    load_spec,
+    resolve_schema_ref,
+)
 from restiny.widgets import PathChooser
 
 if TYPE_CHECKING:
@@ -29,12 +38,15 @@ class _ImportFailedError(Exception):
     pass
 
 
-class _ImportInvalidFileError(Exception):
+class _ImportInvalidVersionError(Exception):
     pass
 
 
-class _ImportInvalidVersionError(Exception):
-    pass
+@dataclass
+class _SyncResult:
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
 
 
 class OpenapiSpecImportScreen(ModalScreen):
@@ -70,6 +82,17 @@ class OpenapiSpecImportScreen(ModalScreen):
                     id='open-api-spec-file',
                     allowed_file_suffixes=['.json', '.yaml', '.yml'],
                 )
+            with Horizontal(classes='w-auto h-auto px-1 pb-1'):
+                yield Select(
+                    [
+                        (folder.name, folder.id)
+                        for folder in self.app.folders_repo.get_roots().data
+                    ],
+                    prompt='Import into a new folder',
+                    allow_blank=True,
+                    tooltip='Sync the spec into an existing folder',
+                    id='sync-folder',
+                )
             with Horizontal(classes='w-auto h-auto'):
                 yield Button('Cancel', classes='w-1fr', id='cancel')
                 yield Button('Confirm', classes='w-1fr', id='confirm')
@@ -80,6 +103,7 @@ class OpenapiSpecImportScreen(ModalScreen):
         self.openapi_spec_file_chooser = self.query_one(
             '#open-api-spec-file', PathChooser
         )
+        self.sync_folder_select = self.query_one('#sync-folder', Select)
         self.cancel_button = self.query_one('#cancel', Button)
         self.confirm_button = self.query_one('#confirm', Button)
 
@@ -90,18 +114,20 @@ class OpenapiSpecImportScreen(ModalScreen):
         self.dismiss(result=False)
 
     @on(Button.Pressed, '#confirm')
-    def _on_confirm(self) -> None:
+    async def _on_confirm(self) -> None:
         if not self.openapi_spec_file_chooser.path:
             self.notify('Openapi spec file is required', severity='error')
             return
 
+        self.modal_content.loading = True
         try:
-            self._import()
-        except _ImportInvalidFileError:
+            sync_result = await self._import()
+        except InvalidSpecFileError:
             self.notify('Invalid openapi spec file', severity='error')
             return
         except _ImportInvalidVersionError:
-            self.notify("Only '2.0' and '3.0' is supported")
+            self.notify("Only '2.0' and '3.0' is supported", severity='error')
+            return
         except _ImportFailedError:
             self.notify('Failed to import the openapi spec', severity='error')
             return
@@ -112,436 +138,507 @@ class OpenapiSpecImportScreen(ModalScreen):
             )
             logger.exception('Failed to import the openapi spec')
             return
+        finally:
+            self.modal_content.loading = False
 
-        self.notify(message='Openapi spec imported', severity='information')
+        if sync_result is None:
+            self.notify(
+                message='Openapi spec imported', severity='information'
+            )
+        else:
+            self.notify(
+                message=(
+                    f'Openapi spec synced ({sync_result.added} added, '
+                    f'{sync_result.updated} updated, '
+                    f'{sync_result.removed} removed)'
+                ),
+                severity='information',
+            )
         self.dismiss(result=True)
 
-    def _import(self) -> None:
-        self.spec, spec_version = self._load_spec(
-            spec_file=self.openapi_spec_file_chooser.path
+    async def _import(self) -> _SyncResult | None:
+        # Parsing a big spec can take a while; keep the UI responsive
+        self.spec, spec_version = await asyncio.to_thread(
+            self._load_spec, spec_file=self.openapi_spec_file_chooser.path
         )
 
         if '2.0' in spec_version:
-            self._import_v2_0()
+            build_requests = self._build_requests_v2_0
         elif '3.0' in spec_version:
-            self._import_v3_0()
+            build_requests = self._build_requests_v3_0
         else:
             raise _ImportInvalidVersionError()
 
-    def _load_spec(self, spec_file: Path) -> tuple[dict, str]:
-        try:
-            raw_text = spec_file.read_text()
-        except OSError as exc:
-            raise _ImportInvalidFileError() from exc
-
-        if spec_file.suffix == '.json':
-            try:
-                spec = json.loads(raw_text)
-            except json.JSONDecodeError as error:
-                raise _ImportInvalidFileError() from error
-
-            if not isinstance(spec, dict):
-                raise _ImportInvalidFileError()
-        elif spec_file.suffix in ('.yaml', '.yml'):
-            try:
-                spec = yaml.load(raw_text)
-            except yaml.YAMLError as error:
-                raise _ImportInvalidFileError() from error
-
-            if not isinstance(spec, dict):
-                raise _ImportInvalidFileError()
-        else:
-            raise _ImportInvalidFileError()
+        sync_folder_id = self.sync_folder_select.value
+        with self.app.db_manager.session_scope() as session:
+            if sync_folder_id == Select.NULL:
+                # Create root folder
+                folder_resp = self.app.folders_repo.create(
+                    session=session,
+                    folder=Folder(
+                        parent_id=None, name=self.spec['info']['title']
+                    ),
+                )
+            else:
+                folder_resp = self.app.folders_repo.get_by_id(
+                    id=sync_folder_id, session=session
+                )
+            if not folder_resp.ok:
+                raise _ImportFailedError()
+            root_folder = folder_resp.data
 
-        spec_version = spec.get('swagger') or spec.get('openapi')
-        if not isinstance(spec_version, str):
-            raise _ImportInvalidVersionError()
+            tag_name_to_folder = self._ensure_tag_folders(
+                session=session, root_folder=root_folder
+            )
+            requests = build_requests(
+                root_folder=root_folder, tag_name_to_folder=tag_name_to_folder
+            )
 
-        return spec, spec_version
+            if sync_folder_id != Select.NULL:
+                return self._sync_requests(
+                    session=session, root_folder=root_folder, requests=requests
+                )
+
+            for request in requests:
+                create_req_resp = self.app.requests_repo.create(
+                    session=session, request=request
+                )
+                if not create_req_resp.ok:
+                    raise _ImportFailedError()
+
+    def _ensure_tag_folders(
+        self, session: Session, root_folder: Folder
+    ) -> dict[str, Folder]:
+        tag_name_to_folder: dict[str, Folder] = {
+            folder.name: folder
+            for folder in self.app.folders_repo.get_by_parent_id(
+                root_folder.id, session=session
+            ).data
+        }
+        for tag in self.spec['tags']:
+            if tag['name'] in tag_name_to_folder:
+                continue
 
-    def _import_v2_0(self) -> None:
-        with self.app.db_manager.session_scope() as session:
-            # Create root folder
             create_resp = self.app.folders_repo.create(
                 session=session,
-                folder=Folder(parent_id=None, name=self.spec['info']['title']),
+                folder=Folder(parent_id=root_folder.id, name=tag['name']),
             )
             if not create_resp.ok:
                 raise _ImportFailedError()
-            root_folder = create_resp.data
+            tag_name_to_folder[tag['name']] = create_resp.data
+
+        return tag_name_to_folder
+
+    def _sync_requests(
+        self, session: Session, root_folder: Folder, requests: list[Request]
+    ) -> _SyncResult:
+        """
+        Applies only the delta between the spec and the requests already in
+        `root_folder` (and its sub folders), matching them by fingerprint.
+        Requests created by the user (without fingerprint) are left alone.
+        """
+        folder_ids = [root_folder.id]
+        folder_ids_stack = [root_folder.id]
+        while folder_ids_stack:
+            sub_folders = self.app.folders_repo.get_by_parent_id(
+                folder_ids_stack.pop(), session=session
+            ).data
+            for sub_folder in sub_folders:
+                folder_ids.append(sub_folder.id)
+                folder_ids_stack.append(sub_folder.id)
+
+        existing_requests = self.app.requests_repo.get_by_folder_ids(
+            folder_ids=folder_ids, session=session
+        ).data
+        fingerprint_to_request: dict[str, Request] = {}
+        unfingerprinted_requests: dict[tuple[int, str, str], Request] = {}
+        for existing_request in existing_requests:
+            if existing_request.import_fingerprint:
+                fingerprint_to_request[existing_request.import_fingerprint] = (
+                    existing_request
+                )
+            else:
+                unfingerprinted_requests[
+                    (
+                        existing_request.folder_id,
+                        existing_request.name,
+                        existing_request.method,
+                    )
+                ] = existing_request
 
-            # Create sub folders
-            tag_name_to_folder: dict[str, Folder] = {}
-            for tag in self.spec['tags']:
-                create_resp = self.app.folders_repo.create(
+        result = _SyncResult()
+        for request in requests:
+            current_request = fingerprint_to_request.pop(
+                request.import_fingerprint, None
+            )
+            if current_request is None:
+                # Adopt requests imported before fingerprints existed
+                current_request = unfingerprinted_requests.pop(
+                    (request.folder_id, request.name, request.method), None
+                )
+
+            if current_request is None:
+                resp = self.app.requests_repo.create(
+                    session=session, request=request
+                )
+                result.added += 1
+            elif current_request.import_checksum != request.import_checksum:
+                resp = self.app.requests_repo.update(
                     session=session,
-                    folder=Folder(parent_id=root_folder.id, name=tag['name']),
+                    request=self._merge_request(
+                        current_request=current_request, request=request
+                    ),
                 )
-                if not create_resp.ok:
-                    raise _ImportFailedError()
-                folder = create_resp.data
-                tag_name_to_folder[tag['name']] = folder
-
-            # Create requests
-            scheme = 'http'
-            if 'https' in self.spec.get('schemes', []):
-                scheme = 'https'
-            host = self.spec.get('host', 'localhost')
-            base_path = self.spec.get('basePath', '')
-            base_url = f'{scheme}://{host}{base_path}'
-
-            for path, methods in self.spec['paths'].items():
-                url = base_url + path
-
-                for method, operation in methods.items():
-                    form_data_kind: (
-                        Literal['urlencoded', 'multipart'] | None
-                    ) = None
-                    if all(
-                        parameter.get('type') == 'string'
-                        for parameter in operation.get('parameters', [])
-                        if parameter.get('in') == 'formData'
-                    ):
-                        form_data_kind = 'urlencoded'
-                    elif any(
-                        parameter.get('type') == 'file'
-                        for parameter in operation.get('parameters', [])
-                        if parameter.get('in') == 'formData'
-                    ):
-                        form_data_kind = 'multipart'
-
-                    headers: list[Request.Header] = []
-                    params: list[Request.Param] = []
-                    form_data_fields: list[
-                        Request.MultipartFormBody.Field
-                        | Request.UrlEncodedFormBody.Field
-                    ] = []
-                    body_enabled = False
-                    body_mode = BodyMode.RAW
-                    body = None
-
-                    for parameter in operation.get('parameters', []):
-                        if parameter['in'] == 'header':
-                            headers.append(
-                                Request.Header(
+                result.updated += 1
+            else:
+                continue
+
+            if not resp.ok:
+                raise _ImportFailedError()
+
+        for stale_request in fingerprint_to_request.values():
+            delete_resp = self.app.requests_repo.delete_by_id(
+                id=stale_request.id, session=session
+            )
+            if not delete_resp.ok:
+                raise _ImportFailedError()
+            result.removed += 1
+
+        return result
+
+    def _merge_request(
+        self, current_request: Request, request: Request
+    ) -> Request:
+        """
+        Applies the spec changes of `request` over `current_request`, keeping
+        the headers and params values filled in by the user.
+        """
+        key_to_header = {
+            header.key: header for header in current_request.headers
+        }
+        key_to_param = {param.key: param for param in current_request.params}
+        return current_request.model_copy(
+            update=dict(
+                folder_id=request.folder_id,
+                name=request.name,
+                method=request.method,
+                url=request.url,
+                headers=[
+                    key_to_header.get(header.key, header)
+                    for header in request.headers
+                ],
+                params=[
+                    key_to_param.get(param.key, param)
+                    for param in request.params
+                ],
+                body_mode=request.body_mode,
+                body=request.body,
+                import_fingerprint=request.import_fingerprint,
+                import_checksum=request.import_checksum,
+            )
+        )
+
+    def _build_request(
+        self, path: str, method: str, operation: dict, **fields: Any
+    ) -> Request:
+        request = Request(
+            name=operation.get('operationId')
+            or operation.get('summary')
+            or path.lstrip('/'),
+            method=HTTPMethod(method.upper()),
+            **fields,
+        )
+        request.import_fingerprint = ' '.join(
+            (request.method, path, operation.get('operationId', ''))
+        )
+        request.import_checksum = hashlib.sha256(
+            request.model_dump_json(
+                include={
+                    'folder_id',
+                    'name',
+                    'method',
+                    'url',
+                    'headers',
+                    'params',
+                    'body_mode',
+                    'body',
+                }
+            ).encode()
+        ).hexdigest()
+        return request
+
+    def _load_spec(self, spec_file: Path) -> tuple[dict, str]:
+        spec = load_spec(spec_file=spec_file)
+
+        spec_version = get_spec_version(spec=spec)
+        if spec_version is None:
+            raise _ImportInvalidVersionError()
+
+        return spec, spec_version
+
+    def _build_requests_v2_0(
+        self, root_folder: Folder, tag_name_to_folder: dict[str, Folder]
+    ) -> list[Request]:
+        requests: list[Request] = []
+
+        scheme = 'http'
+        if 'https' in self.spec.get('schemes', []):
+            scheme = 'https'
+        host = self.spec.get('host', 'localhost')
+        base_path = self.spec.get('basePath', '')
+        base_url = f'{scheme}://{host}{base_path}'
+
+        for path, methods in self.spec['paths'].items():
+            url = base_url + path
+
+            for method, operation in methods.items():
+                form_data_kind: Literal['urlencoded', 'multipart'] | None = (
+                    None
+                )
+                if all(
+                    parameter.get('type') == 'string'
+                    for parameter in operation.get('parameters', [])
+                    if parameter.get('in') == 'formData'
+                ):
+                    form_data_kind = 'urlencoded'
+                elif any(
+                    parameter.get('type') == 'file'
+                    for parameter in operation.get('parameters', [])
+                    if parameter.get('in') == 'formData'
+                ):
+                    form_data_kind = 'multipart'
+
+                headers: list[Request.Header] = []
+                params: list[Request.Param] = []
+                form_data_fields: list[
+                    Request.MultipartFormBody.Field
+                    | Request.UrlEncodedFormBody.Field
+                ] = []
+                body_enabled = False
+                body_mode = BodyMode.RAW
+                body = None
+
+                for parameter in operation.get('parameters', []):
+                    if parameter['in'] == 'header':
+                        headers.append(
+                            Request.Header(
+                                enabled=False,
+                                key=parameter['name'],
+                                value='',
+                            )
+                        )
+                    elif parameter['in'] == 'query':
+                        params.append(
+                            Request.Param(
+                                enabled=False,
+                                key=parameter['name'],
+                                value='',
+                            )
+                        )
+                    elif parameter['in'] == 'formData':
+                        if form_data_kind == 'urlencoded':
+                            body_mode = BodyMode.FORM_URLENCODED
+                            form_data_fields.append(
+                                Request.UrlEncodedFormBody.Field(
                                     enabled=False,
                                     key=parameter['name'],
                                     value='',
                                 )
                             )
-                        elif parameter['in'] == 'query':
-                            params.append(
-                                Request.Param(
+                        elif form_data_kind == 'multipart':
+                            body_mode = BodyMode.FORM_MULTIPART
+                            form_data_fields.append(
+                                Request.MultipartFormBody.Field(
                                     enabled=False,
                                     key=parameter['name'],
-                                    value='',
+                                    value=''
+                                    if parameter['type'] == 'string'
+                                    else None,
+                                    value_kind='text'
+                                    if parameter['type'] == 'string'
+                                    else 'file',
                                 )
                             )
-                        elif parameter['in'] == 'formData':
-                            if form_data_kind == 'urlencoded':
-                                body_mode = BodyMode.FORM_URLENCODED
-                                form_data_fields.append(
-                                    Request.UrlEncodedFormBody.Field(
-                                        enabled=False,
-                                        key=parameter['name'],
-                                        value='',
-                                    )
-                                )
-                            elif form_data_kind == 'multipart':
-                                body_mode = BodyMode.FORM_MULTIPART
-                                form_data_fields.append(
-                                    Request.MultipartFormBody.Field(
-                                        enabled=False,
-                                        key=parameter['name'],
-                                        value=''
-                                        if parameter['type'] == 'string'
-                                        else None,
-                                        value_kind='text'
-                                        if parameter['type'] == 'string'
-                                        else 'file',
-                                    )
-                                )
-                        elif parameter['in'] == 'body':
-                            body_mode = BodyMode.RAW
-                            body = Request.RawBody(
-                                language=BodyRawLanguage.JSON,
-                                value=json.dumps(
-                                    self._build_json_body_from_schema(
-                                        schema=self._resolve_schema_ref(
-                                            schema=parameter['schema'],
-                                        ),
+                    elif parameter['in'] == 'body':
+                        body_mode = BodyMode.RAW
+                        body = Request.RawBody(
+                            language=BodyRawLanguage.JSON,
+                            value=json.dumps(
+                                build_json_body_from_schema(
+                                    spec=self.spec,
+                                    schema=resolve_schema_ref(
+                                        spec=self.spec,
+                                        schema=parameter['schema'],
                                     ),
-                                    indent=4,
                                 ),
-                            )
-
-                    if body_mode == BodyMode.FORM_URLENCODED:
-                        body = Request.UrlEncodedFormBody(
-                            fields=form_data_fields
-                        )
-                    elif body_mode == BodyMode.FORM_MULTIPART:
-                        body = Request.MultipartFormBody(
-                            fields=form_data_fields
+                                indent=4,
+                            ),
                         )
 
-                    folder_id = root_folder.id
-                    if operation.get('tags'):
-                        folder_id = tag_name_to_folder.get(
-                            operation['tags'][0], root_folder
-                        ).id
-                    create_req_resp = self.app.requests_repo.create(
-                        session=session,
-                        request=Request(
-                            folder_id=folder_id,
-                            name=operation.get('operationId')
-                            or operation.get('summary')
-                            or path.lstrip('/'),
-                            method=HTTPMethod(method.upper()),
-                            url=url,
-                            headers=headers,
-                            params=params,
-                            body_enabled=body_enabled,
-                            body_mode=body_mode,
-                            body=body,
-                        ),
+                if body_mode == BodyMode.FORM_URLENCODED:
+                    body = Request.UrlEncodedFormBody(fields=form_data_fields)
+                elif body_mode == BodyMode.FORM_MULTIPART:
+                    body = Request.MultipartFormBody(fields=form_data_fields)
+
+                folder_id = root_folder.id
+                if operation.get('tags'):
+                    folder_id = tag_name_to_folder.get(
+                        operation['tags'][0], root_folder
+                    ).id
+                requests.append(
+                    self._build_request(
+                        folder_id=folder_id,
+                        path=path,
+                        method=method,
+                        operation=operation,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        body_enabled=body_enabled,
+                        body_mode=body_mode,
+                        body=body,
                     )
-                    if not create_req_resp.ok:
-                        raise _ImportFailedError()
-
-    def _import_v3_0(self) -> None:
-        with self.app.db_manager.session_scope() as session:
-            # Create root folder
-            create_resp = self.app.folders_repo.create(
-                session=session,
-                folder=Folder(parent_id=None, name=self.spec['info']['title']),
-            )
-            if not create_resp.ok:
-                raise _ImportFailedError()
-            root_folder = create_resp.data
-
-            # Create sub folders
-            tag_name_to_folder: dict[str, Folder] = {}
-            for tag in self.spec['tags']:
-                create_resp = self.app.folders_repo.create(
-                    session=session,
-                    folder=Folder(parent_id=root_folder.id, name=tag['name']),
                 )
-                if not create_resp.ok:
-                    raise _ImportFailedError()
-                folder = create_resp.data
-                tag_name_to_folder[tag['name']] = folder
-
-            # Create requests
-            base_url = f'{self.spec["servers"][0]["url"]}'
-            if not base_url.startswith('http'):
-                base_url = '{{BASE_URL}}' + base_url
-
-            for path, methods in self.spec['paths'].items():
-                url = base_url + path
-
-                for method, operation in methods.items():
-                    headers: list[Request.Header] = []
-                    params: list[Request.Param] = []
-                    body_enabled = False
-                    body_mode = BodyMode.RAW
-                    body = None
-
-                    for parameter in operation.get('parameters', []):
-                        if parameter.get('in') == 'header':
-                            headers.append(
-                                Request.Header(
-                                    enabled=False,
-                                    key=parameter['name'],
-                                    value='',
-                                )
+
+        return requests
+
+    def _build_requests_v3_0(
+        self, root_folder: Folder, tag_name_to_folder: dict[str, Folder]
+    ) -> list[Request]:
+        requests: list[Request] = []
+
+        base_url = f'{self.spec["servers"][0]["url"]}'
+        if not base_url.startswith('http'):
+            base_url = '{{BASE_URL}}' + base_url
+
+        for path, methods in self.spec['paths'].items():
+            url = base_url + path
+
+            for method, operation in methods.items():
+                headers: list[Request.Header] = []
+                params: list[Request.Param] = []
+                body_enabled = False
+                body_mode = BodyMode.RAW
+                body = None
+
+                for parameter in operation.get('parameters', []):
+                    if parameter.get('in') == 'header':
+                        headers.append(
+                            Request.Header(
+                                enabled=False,
+                                key=parameter['name'],
+                                value='',
                             )
-                        elif parameter.get('in') == 'query':
-                            params.append(
-                                Request.Param(
-                                    enabled=False,
-                                    key=parameter['name'],
-                                    value='',
-                                )
+                        )
+                    elif parameter.get('in') == 'query':
+                        params.append(
+                            Request.Param(
+                                enabled=False,
+                                key=parameter['name'],
+                                value='',
                             )
+                        )
 
-                    request_body = operation.get('requestBody')
-                    if request_body:
-                        content = self._resolve_schema_ref(
-                            schema=request_body
-                        ).get('content', {})
-                        json_body = content.get('application/json')
-                        urlencoded_form_body = content.get(
-                            'application/x-www-form-urlencoded'
+                request_body = operation.get('requestBody')
+                if request_body:
+                    content = resolve_schema_ref(
+                        spec=self.spec, schema=request_body
+                    ).get('content', {})
+                    json_body = content.get('application/json')
+                    urlencoded_form_body = content.get(
+                        'application/x-www-form-urlencoded'
+                    )
+                    multipart_form_body = content.get('multipart/form-data')
+                    file_body = content.get('application/octet-stream')
+                    if json_body:
+                        body_schema = resolve_schema_ref(
+                            spec=self.spec, schema=json_body
                         )
-                        multipart_form_body = content.get(
-                            'multipart/form-data'
+                        body_schema = body_schema.get('schema', body_schema)
+                        body_schema = resolve_schema_ref(
+                            spec=self.spec, schema=body_schema
                         )
-                        file_body = content.get('application/octet-stream')
-                        if json_body:
-                            body_schema = self._resolve_schema_ref(
-                                schema=json_body
-                            )
-                            body_schema = body_schema.get(
-                                'schema', body_schema
-                            )
-                            body_schema = self._resolve_schema_ref(
-                                schema=body_schema
-                            )
 
-                            body_mode = BodyMode.RAW
-                            body = Request.RawBody(
-                                language=BodyRawLanguage.JSON,
-                                value=json.dumps(
-                                    self._build_json_body_from_schema(
-                                        schema=body_schema
-                                    ),
-                                    indent=4,
+                        body_mode = BodyMode.RAW
+                        body = Request.RawBody(
+                            language=BodyRawLanguage.JSON,
+                            value=json.dumps(
+                                build_json_body_from_schema(
+                                    spec=self.spec, schema=body_schema
                                 ),
-                            )
-                        elif urlencoded_form_body:
-                            body_schema = self._resolve_schema_ref(
-                                schema=urlencoded_form_body
-                            )
-                            body_schema = body_schema.get(
-                                'schema', body_schema
-                            )
-                            body_schema = self._resolve_schema_ref(
-                                schema=body_schema
-                            )
+                                indent=4,
+                            ),
+                        )
+                    elif urlencoded_form_body:
+                        body_schema = resolve_schema_ref(
+                            spec=self.spec, schema=urlencoded_form_body
+                        )
+                        body_schema = body_schema.get('schema', body_schema)
+                        body_schema = resolve_schema_ref(
+                            spec=self.spec, schema=body_schema
+                        )
 
-                            body_mode = BodyMode.FORM_URLENCODED
-                            body = Request.UrlEncodedFormBody(
-                                fields=[
-                                    Request.UrlEncodedFormBody.Field(
-                                        enabled=False,
-                                        key=prop_key,
-                                        value=str(prop.get('example', '')),
-                                    )
-                                    for prop_key, prop in body_schema[
-                                        'properties'
-                                    ].items()
-                                ]
-                            )
-                        elif multipart_form_body:
-                            body_schema = self._resolve_schema_ref(
-                                schema=multipart_form_body
-                            )
-                            body_schema = body_schema.get(
-                                'schema', body_schema
-                            )
-                            body_schema = self._resolve_schema_ref(
-                                schema=body_schema
-                            )
+                        body_mode = BodyMode.FORM_URLENCODED
+                        body = Request.UrlEncodedFormBody(
+                            fields=[
+                                Request.UrlEncodedFormBody.Field(
+                                    enabled=False,
+                                    key=prop_key,
+                                    value=str(prop.get('example', '')),
+                                )
+                                for prop_key, prop in body_schema[
+                                    'properties'
+                                ].items()
+                            ]
+                        )
+                    elif multipart_form_body:
+                        body_schema = resolve_schema_ref(
+                            spec=self.spec, schema=multipart_form_body
+                        )
+                        body_schema = body_schema.get('schema', body_schema)
+                        body_schema = resolve_schema_ref(
+                            spec=self.spec, schema=body_schema
+                        )
 
-                            body_mode = BodyMode.FORM_MULTIPART
-                            body = Request.MultipartFormBody(
-                                fields=[
-                                    Request.MultipartFormBody.Field(
-                                        enabled=False,
-                                        key=prop_key,
-                                        value=None
-                                        if prop.get('format') == 'binary'
-                                        else '',
-                                        value_kind='file'
-                                        if prop.get('format') == 'binary'
-                                        else 'text',
-                                    )
-                                    for prop_key, prop in body_schema[
-                                        'properties'
-                                    ].items()
-                                ]
-                            )
-                        elif file_body:
-                            body_mode = BodyMode.FILE
-
-                    folder_id = root_folder.id
-                    if operation.get('tags'):
-                        folder_id = tag_name_to_folder.get(
-                            operation['tags'][0], root_folder
-                        ).id
-                    create_req_resp = self.app.requests_repo.create(
-                        session=session,
-                        request=Request(
-                            folder_id=folder_id,
-                            name=operation.get('operationId')
-                            or operation.get('summary')
-                            or path.lstrip('/'),
-                            method=HTTPMethod(method.upper()),
-                            url=url,
-                            headers=headers,
-                            params=params,
-                            body_enabled=body_enabled,
-                            body_mode=body_mode,
-                            body=body,
-                        ),
+                        body_mode = BodyMode.FORM_MULTIPART
+                        body = Request.MultipartFormBody(
+                            fields=[
+                                Request.MultipartFormBody.Field(
+                                    enabled=False,
+                                    key=prop_key,
+                                    value=None
+                                    if prop.get('format') == 'binary'
+                                    else '',
+                                    value_kind='file'
+                                    if prop.get('format') == 'binary'
+                                    else 'text',
+                                )
+                                for prop_key, prop in body_schema[
+                                    'properties'
+                                ].items()
+                            ]
+                        )
+                    elif file_body:
+                        body_mode = BodyMode.FILE
+
+                folder_id = root_folder.id
+                if operation.get('tags'):
+                    folder_id = tag_name_to_folder.get(
+                        operation['tags'][0], root_folder
+                    ).id
+                requests.append(
+                    self._build_request(
+                        folder_id=folder_id,
+                        path=path,
+                        method=method,
+                        operation=operation,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        body_enabled=body_enabled,
+                        body_mode=body_mode,
+                        body=body,
                     )
-                    if not create_req_resp.ok:
-                        raise _ImportFailedError()
-
-    def _resolve_schema_ref(self, schema: dict) -> dict:
-        ref = schema.get('$ref')
-        if not ref:
-            return schema
-
-        # OpenAPI 2.0
-        if ref.startswith('#/definitions/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['definitions'][schema_name]
-        if ref.startswith('#/parameters/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['parameters'][schema_name]
-        if ref.startswith('#/responses/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['responses'][schema_name]
-
-        # OpenAPI 3.0
-        if ref.startswith('#/components/schemas/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['components']['schemas'][schema_name]
-        if ref.startswith('#/components/parameters/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['components']['parameters'][schema_name]
-        if ref.startswith('#/components/responses/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['components']['responses'][schema_name]
-        if ref.startswith('#/components/requestBodies/'):
-            schema_name = ref.rsplit('/', 1)[-1]
-            return self.spec['components']['requestBodies'][schema_name]
-
-        return schema
-
-    def _build_json_body_from_schema(self, schema: dict) -> Any:
-        schema = self._resolve_schema_ref(schema=schema)
-
-        if 'example' in schema:
-            return schema['example']
-        if 'default' in schema:
-            return schema['default']
-
-        schema_type = schema.get('type')
-        if schema_type == 'object':
-            props = schema.get('properties', {})
-            obj = {}
-            for prop_name, prop in props.items():
-                obj[prop_name] = self._build_json_body_from_schema(schema=prop)
-            return obj
-        elif schema_type == 'array':
-            items = schema.get('items', {})
-            return [self._build_json_body_from_schema(schema=items)]
-        elif schema_type == 'integer':
-            return 0
-        elif schema_type == 'number':
-            return 0.0
-        elif schema_type == 'boolean':
-            return False
-        elif schema_type == 'string':
-            fmt = schema.get('format')
-            if fmt == 'date-time':
-                return datetime.now(UTC).isoformat()
-            elif fmt == 'date':
-                return date.today().isoformat()
-            elif fmt == 'uuid':
-                return '00000000-0000-0000-0000-000000000000'
-            return ''
-
-        return {}
+                )
+
+        return requests
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Label, TabbedContent, TabPane
+
+if TYPE_CHECKING:
+    from restiny.profiler import ProfileResult
+    from restiny.ui.app import RESTinyApp
+
+
+class ProfilerReportScreen(ModalScreen):
+    app: RESTinyApp
+
+    DEFAULT_CSS = """
+    ProfilerReportScreen {
+        align: center middle;
+    }
+
+    #modal-content {
+        width: 80%;
+        height: 80%;
+        border: heavy $panel;
+        border-title-color: $text-muted;
+        background: $surface;
+    }
+
+    #files {
+        height: auto;
+        color: $text-muted;
+    }
+    """
+    AUTO_FOCUS = '#handlers'
+
+    BINDINGS = [
+        Binding(
+            key='escape',
+            action='dismiss',
+            description='Quit the screen',
+            show=False,
+        ),
+    ]
+
+    def __init__(self, result: ProfileResult, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._result = result
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='modal-content'):
+            yield Label(
+                f'pstats: {self._result.pstats_file}\n'
+                f'collapsed stacks: {self._result.folded_file}\n'
+                f'handlers: {self._result.handlers_file}'
+                + (
+                    f'\nsql: {self._result.sql_file}'
+                    if self._result.sql_file
+                    else ''
+                ),
+                classes='px-1',
+                id='files',
+            )
+            with TabbedContent():
+                with TabPane('Handlers'):
+                    yield DataTable(
+                        cursor_type='row', zebra_stripes=True, id='handlers'
+                    )
+                with TabPane('SQL'):
+                    yield DataTable(
+                        cursor_type='row', zebra_stripes=True, id='statements'
+                    )
+            with Horizontal(classes='w-auto h-auto'):
+                yield Button(label='Close', classes='w-1fr', id='close')
+
+    def on_mount(self) -> None:
+        self.modal_content = self.query_one('#modal-content', Vertical)
+        self.handlers_table = self.query_one('#handlers', DataTable)
+        self.statements_table = self.query_one('#statements', DataTable)
+        self.close_button = self.query_one('#close', Button)
+
+        self.modal_content.border_title = 'Profiler report'
+
+        self.handlers_table.add_columns(
+            'Handler',
+            'Calls',
+            'Total (ms)',
+            'Mean (ms)',
+            'Max (ms)',
+            'Queries',
+        )
+        for timing in self._result.handler_timings:
+            self.handlers_table.add_row(
+                timing.name,
+                Text(str(timing.calls), justify='right'),
+                Text(f'{timing.total_ms:.1f}', justify='right'),
+                Text(f'{timing.mean_ms:.1f}', justify='right'),
+                Text(f'{timing.max_ms:.1f}', justify='right'),
+                Text(str(timing.queries), justify='right'),
+            )
+
+        self.statements_table.add_columns(
+            'Count', 'Total (ms)', 'Mean (ms)', 'Max (ms)', 'Statement'
+        )
+        for stats in self._result.statements:
+            self.statements_table.add_row(
+                Text(str(stats.count), justify='right'),
+                Text(f'{stats.total_ms:.1f}', justify='right'),
+                Text(f'{stats.mean_ms:.1f}', justify='right'),
+                Text(f'{stats.max_ms:.1f}', justify='right'),
+                ' '.join(stats.statement.split()),
+            )
+
+    @on(Button.Pressed, '#close')
+    def _on_close(self, message: Button.Pressed) -> None:
+        self.dismiss()
@@ -10,6 +10,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Label, Select, TextArea
 
 from restiny.entities import Settings
+from restiny.widgets import CustomInput
 
 if TYPE_CHECKING:
     from restiny.ui.app import RESTinyApp
@@ -70,6 +71,38 @@ class SettingsScreen(ModalScreen):
                     allow_blank=False,
                     id='editor-indent',
                 )
+            with Horizontal(classes='w-auto h-auto mt-1 px-1'):
+                yield Label('max requests per host', classes='mt-1')
+                yield CustomInput(
+                    str(settings.host_max_in_flight),
+                    placeholder='6',
+                    select_on_focus=False,
+                    type='integer',
+                    tooltip='Requests in flight at once to the same host',
+                    classes='w-1fr',
+                    id='host-max-in-flight',
+                )
+            with Horizontal(classes='w-auto h-auto mt-1 px-1'):
+                yield Label('requests per second per host', classes='mt-1')
+                yield CustomInput(
+                    str(settings.host_rate_limit),
+                    placeholder='0',
+                    select_on_focus=False,
+                    type='number',
+                    tooltip='0 is unlimited; halved for a while on a 429',
+                    classes='w-1fr',
+                    id='host-rate-limit',
+                )
+                yield Label('burst', classes='mt-1')
+                yield CustomInput(
+                    str(settings.host_rate_burst),
+                    placeholder='1',
+                    select_on_focus=False,
+                    type='integer',
+                    tooltip='Requests sent at once before the rate applies',
+                    classes='w-1fr',
+                    id='host-rate-burst',
+                )
             with Horizontal(classes='w-auto h-auto mt-1'):
                 yield Button(label='Cancel', classes='w-1fr', id='cancel')
                 yield Button(label='Confirm', classes='w-1fr', id='confirm')
@@ -79,6 +112,15 @@ class SettingsScreen(ModalScreen):
         self.theme_select = self.query_one('#theme', Select)
         self.editor_theme_select = self.query_one('#editor-theme', Select)
         self.editor_indent_select = self.query_one('#editor-indent', Select)
+        self.host_max_in_flight_input = self.query_one(
+            '#host-max-in-flight', CustomInput
+        )
+        self.host_rate_limit_input = self.query_one(
+            '#host-rate-limit', CustomInput
+        )
+        self.host_rate_burst_input = self.query_one(
+            '#host-rate-burst', CustomInput
+        )
         self.cancel_button = self.query_one('#cancel', Button)
         self.confirm_button = self.query_one('#confirm', Button)
 
@@ -90,11 +132,33 @@ class SettingsScreen(ModalScreen):
 
     @on(Button.Pressed, '#confirm')
     def _on_confirm(self, message: Button.Pressed) -> None:
+        try:
+            host_max_in_flight = int(self.host_max_in_flight_input.value)
+            host_rate_limit = float(self.host_rate_limit_input.value or 0)
+            host_rate_burst = int(self.host_rate_burst_input.value)
+        except ValueError:
+            self.notify('Invalid number', severity='error')
+            return
+        if host_max_in_flight < 1 or host_rate_burst < 1:
+            self.notify(
+                'Max requests per host and burst must be at least 1',
+                severity='error',
+            )
+            return
+        if host_rate_limit < 0:
+            self.notify(
+                'Requests per second cannot be negative', severity='error'
+            )
+            return
+
         self.app.settings_repo.set(
             Settings(
                 theme=self.theme_select.value,
                 editor_theme=self.editor_theme_select.value,
                 editor_indent=self.editor_indent_select.value,
+                host_max_in_flight=host_max_in_flight,
+                host_rate_limit=host_rate_limit,
+                host_rate_burst=host_rate_burst,
             )
         )
         self.dismiss(result=True)
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, DataTable, Input, Label
+from textual.worker import Worker
+
+from restiny.entities import Request
+from restiny.utils import format_bytes
+from restiny.websocket import (
+    MESSAGES_BUFFER_SIZE,
+    WebSocketMessage,
+    WebSocketSession,
+)
+from restiny.widgets import CustomInput
+
+if TYPE_CHECKING:
+    import httpx
+
+    from restiny.ui.app import RESTinyApp
+
+
+class WebSocketScreen(ModalScreen):
+    app: RESTinyApp
+
+    DEFAULT_CSS = """
+    WebSocketScreen {
+        align: center middle;
+    }
+
+    #modal-content {
+        width: 90%;
+        height: 90%;
+        border: heavy $panel;
+        border-title-color: $text-muted;
+        border-subtitle-color: $text-muted;
+        background: $surface;
+    }
+
+    #stats {
+        height: auto;
+        color: $text-muted;
+    }
+    """
+    AUTO_FOCUS = '#message'
+
+    BINDINGS = [
+        Binding(
+            key='escape',
+            action='close',
+            description='Quit the screen',
+            show=False,
+        ),
+    ]
+
+    def __init__(
+        self,
+        request: Request,
+        cookies: httpx.Cookies | None = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._session = WebSocketSession(
+            request=request, on_message=self._add_message, cookies=cookies
+        )
+        self._message_row_keys = deque()
+        self._replay_worker = None
+
+        # The raw body is the script of the replay, one message per line
+        self._replay_messages = []
+        if isinstance(request.body, Request.RawBody):
+            self._replay_messages = [
+                line for line in request.body.value.splitlines() if line
+            ]
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id='modal-content'):
+            yield Label(classes='px-1', id='stats')
+            yield DataTable(
+                cursor_type='row', zebra_stripes=True, id='messages'
+            )
+            with Horizontal(classes='h-auto mt-1'):
+                yield CustomInput(
+                    placeholder='Message',
+                    select_on_focus=False,
+                    classes='w-5fr',
+                    id='message',
+                )
+                yield Button(label='Send', classes='w-1fr', id='send')
+            with Horizontal(classes='h-auto'):
+                yield Label('Replay the body at', classes='pt-1 ml-1')
+                yield CustomInput(
+                    '10',
+                    placeholder='10',
+                    select_on_focus=False,
+                    type='number',
+                    classes='w-1fr',
+                    id='replay-rate',
+                )
+                yield Label('messages/s', classes='pt-1')
+                yield Button(
+                    label=f'Replay ({len(self._replay_messages)} messages)',
+                    tooltip='The body (raw) has one message per line',
+                    classes='w-1fr',
+                    id='replay',
+                )
+                yield Button(
+                    label='Stop replay', classes='w-1fr', id='stop-replay'
+                )
+            with Horizontal(classes='w-auto h-auto'):
+                yield Button(label='Connect', classes='w-1fr', id='connect')
+                yield Button(
+                    label='Disconnect', classes='w-1fr', id='disconnect'
+                )
+                yield Button(label='Close', classes='w-1fr', id='close')
+
+    def on_mount(self) -> None:
+        self.modal_content = self.query_one('#modal-content', Vertical)
+        self.stats_label = self.query_one('#stats', Label)
+        self.messages_table = self.query_one('#messages', DataTable)
+        self.message_input = self.query_one('#message', CustomInput)
+        self.send_button = self.query_one('#send', Button)
+        self.replay_rate_input = self.query_one('#replay-rate', CustomInput)
+        self.replay_button = self.query_one('#replay', Button)
+        self.stop_replay_button = self.query_one('#stop-replay', Button)
+        self.connect_button = self.query_one('#connect', Button)
+        self.disconnect_button = self.query_one('#disconnect', Button)
+        self.close_button = self.query_one('#close', Button)
+
+        self.modal_content.border_title = (
+            f'WebSocket {self._session.request.url}'
+        )
+        self.messages_table.add_columns(
+            '#', 'Time', 'Direction', 'Size', 'RTT (ms)', 'Data'
+        )
+
+        self.set_interval(0.5, self._update_stats)
+        self._connect()
+
+    async def action_close(self) -> None:
+        await self._session.close()
+        self.dismiss()
+
+    def _connect(self) -> None:
+        self.modal_content.border_subtitle = 'Connecting...'
+        self.connect_button.disabled = True
+        self.run_worker(self._run_session(), group='session')
+
+    async def _run_session(self) -> None:
+        import httpx
+        from websockets.exceptions import WebSocketException
+
+        try:
+            await self._session.connect()
+        # `httpx.RequestError` from the auth flow, e.g. a failed OAuth2 token
+        # request
+        except (
+            WebSocketException,
+            httpx.RequestError,
+            OSError,
+            TimeoutError,
+        ) as error:
+            self._notify_error(error)
+            self._sync_controls()
+            return
+
+        self._sync_controls()
+        try:
+            await self._session.receive_forever()
+        finally:
+            self._stop_replay()
+            self._sync_controls()
+
+    def _notify_error(self, error: Exception) -> None:
+        error_name = type(error).__name__
+        error_message = str(error)
+        if error_message:
+            self.notify(f'{error_name}: {error_message}', severity='error')
+        else:
+            self.notify(f'{error_name}', severity='error')
+
+    def _sync_controls(self) -> None:
+        is_connected = self._session.is_connected
+        is_replaying = bool(
+            self._replay_worker and self._replay_worker.is_running
+        )
+        self.modal_content.border_subtitle = (
+            'Connected' if is_connected else 'Disconnected'
+        )
+        self.connect_button.disabled = is_connected
+        self.disconnect_button.disabled = not is_connected
+        self.send_button.disabled = not is_connected
+        self.replay_button.disabled = (
+            not is_connected or is_replaying or not self._replay_messages
+        )
+        self.stop_replay_button.disabled = not is_replaying
+
+    def _update_stats(self) -> None:
+        stats = self._session.stats
+        rtt = 'RTT -'
+        if stats.last_rtt_ms is not None:
+            rtt = (
+                f'RTT last {stats.last_rtt_ms:.1f} ms, '
+                f'mean {stats.mean_rtt_ms:.1f} ms'
+            )
+        self.stats_label.update(
+            f'Sent {stats.sent} ({format_bytes(stats.sent_bytes)}, '
+            f'{stats.sent_per_second:.1f}/s) | '
+            f'Received {stats.received} '
+            f'({format_bytes(stats.received_bytes)}, '
+            f'{stats.received_per_second:.1f}/s) | {rtt}'
+        )
+
+    def _add_message(self, message: WebSocketMessage) -> None:
+        if len(self._message_row_keys) >= MESSAGES_BUFFER_SIZE:
+            self.messages_table.remove_row(self._message_row_keys.popleft())
+
+        if isinstance(message.data, bytes):
+            data = f'[{len(message.data)} bytes of binary data]'
+        else:
+            data = message.data.replace('\n', '\\n')
+
+        # Follow the new messages, unless scrolled up to read older ones
+        follow = self.messages_table.is_vertical_scroll_end
+        self._message_row_keys.append(
+            self.messages_table.add_row(
+                Text(
+                    str(
+                        self._session.stats.sent + self._session.stats.received
+                    ),
+                    justify='right',
+                ),
+                message.at.strftime('%H:%M:%S.%f')[:-3],
+                '↑ sent' if message.direction == 'sent' else '↓ received',
+                Text(format_bytes(message.size), justify='right'),
+                Text(
+                    '' if message.rtt_ms is None else f'{message.rtt_ms:.1f}',
+                    justify='right',
+                ),
+                data,
+            )
+        )
+        if follow:
+            self.messages_table.scroll_end(animate=False)
+
+    async def _send(self) -> None:
+        from websockets.exceptions import ConnectionClosed
+
+        message = self.message_input.value
+        if not message or not self._session.is_connected:
+            return
+
+        try:
+            await self._session.send(message)
+        except ConnectionClosed as error:
+            self._notify_error(error)
+            return
+        self.message_input.value = ''
+
+    def _stop_replay(self) -> None:
+        if self._replay_worker and self._replay_worker.is_running:
+            self._replay_worker.cancel()
+
+    async def _replay(self, rate: float) -> None:
+        from websockets.exceptions import ConnectionClosed
+
+        try:
+            await self._session.replay(
+                messages=self._replay_messages, rate=rate
+            )
+        except ConnectionClosed as error:
+            self._notify_error(error)
+
+    def on_worker_state_changed(self, message: Worker.StateChanged) -> None:
+        self._sync_controls()
+
+    @on(Button.Pressed, '#send')
+    @on(Input.Submitted, '#message')
+    async def _on_send(
+        self, message: Button.Pressed | Input.Submitted
+    ) -> None:
+        await self._send()
+
+    @on(Button.Pressed, '#replay')
+    def _on_replay(self, message: Button.Pressed) -> None:
+        try:
+            rate = float(self.replay_rate_input.value)
+        except ValueError:
+            rate = 0
+        if rate <= 0:
+            self.notify('The replay rate must be above 0', severity='error')
+            return
+
+        self._replay_worker = self.run_worker(
+            self._replay(rate=rate), group='replay'
+        )
+
+    @on(Button.Pressed, '#stop-replay')
+    def _on_stop_replay(self, message: Button.Pressed) -> None:
+        self._stop_replay()
+
+    @on(Button.Pressed, '#connect')
+    def _on_connect(self, message: Button.Pressed) -> None:
+        self._connect()
+
+    @on(Button.Pressed, '#disconnect')
+    async def _on_disconnect(self, message: Button.Pressed) -> None:
+        self._stop_replay()
+        await self._session.close()
+        self._sync_controls()
+
+    @on(Button.Pressed, '#close')
+    async def _on_close(self, message: Button.Pressed) -> None:
+        await self.action_close()
@@ -2,8 +2,6 @@ import shlex
 from collections.abc import Iterable
 from pathlib import Path
 
-import httpx
-
 
 def build_curl_cmd(
     method: str,
@@ -20,6 +18,8 @@ def build_curl_cmd(
     auth_api_key_param: tuple[str, str] | None = None,
     auth_digest: tuple[str, str] | None = None,
 ) -> str:
+    import httpx
+
     cmd_parts = ['curl']
 
     # Method
@@ -147,6 +147,11 @@ def shorten_string(value: str, max_lenght: int, elipsis: str = '..') -> str:
     return value[: max_lenght - len(elipsis)] + elipsis
 
 
+def is_websocket_url(url: str) -> bool:
+    scheme, _, _ = url.partition('://')
+    return scheme.strip().lower() in ('ws', 'wss')
+
+
 def is_textual_mimetype(mimetype: str) -> bool:
     mimetype = mimetype.lower()
 
@@ -166,3 +171,16 @@ def is_textual_mimetype(mimetype: str) -> bool:
         return True
 
     return False
+
+
+def format_bytes(size: int | float) -> str:
+    """
+    Returns the size in a human readable unit (e.g. `1.5 MB`).
+    """
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return (
+                f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+            )
+        size /= 1024
+    return f'{size:.1f} GB'
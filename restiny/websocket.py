@@ -0,0 +1,280 @@
+"""
+WebSocket sessions, with a bounded log of the messages, round-trip times of
+request/reply exchanges and message rates.
+
+Requires the optional `websockets` package
+(`pip install restiny[websocket]`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import ssl
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import httpx
+
+    from restiny.entities import Request
+
+# Messages kept in the log; the oldest ones are dropped as new ones arrive
+MESSAGES_BUFFER_SIZE = 1000
+
+# Window of the messages per second counters
+RATE_WINDOW_SECONDS = 1.0
+
+
+def is_websocket_available() -> bool:
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class WebSocketMessage:
+    direction: Literal['sent', 'received']
+    data: str | bytes
+    at: datetime
+    rtt_ms: float | None = None
+
+    @property
+    def size(self) -> int:
+        if isinstance(self.data, bytes):
+            return len(self.data)
+        return len(self.data.encode())
+
+
+@dataclass
+class WebSocketStats:
+    sent: int = 0
+    received: int = 0
+    sent_bytes: int = 0
+    received_bytes: int = 0
+    rtts_ms: deque[float] = field(
+        default_factory=lambda: deque(maxlen=MESSAGES_BUFFER_SIZE)
+    )
+    _sent_times: deque[float] = field(
+        default_factory=deque, init=False, repr=False
+    )
+    _received_times: deque[float] = field(
+        default_factory=deque, init=False, repr=False
+    )
+
+    @property
+    def sent_per_second(self) -> float:
+        return self._rate(self._sent_times)
+
+    @property
+    def received_per_second(self) -> float:
+        return self._rate(self._received_times)
+
+    @property
+    def last_rtt_ms(self) -> float | None:
+        return self.rtts_ms[-1] if self.rtts_ms else None
+
+    @property
+    def mean_rtt_ms(self) -> float | None:
+        if not self.rtts_ms:
+            return None
+        return sum(self.rtts_ms) / len(self.rtts_ms)
+
+    def record_sent(self, message: WebSocketMessage) -> None:
+        self.sent += 1
+        self.sent_bytes += message.size
+        self._sent_times.append(time.perf_counter())
+
+    def record_received(self, message: WebSocketMessage) -> None:
+        self.received += 1
+        self.received_bytes += message.size
+        self._received_times.append(time.perf_counter())
+        if message.rtt_ms is not None:
+            self.rtts_ms.append(message.rtt_ms)
+
+    def _rate(self, times: deque[float]) -> float:
+        window_start = time.perf_counter() - RATE_WINDOW_SECONDS
+        while times and times[0] < window_start:
+            times.popleft()
+        return len(times) / RATE_WINDOW_SECONDS
+
+
+def _correlation_id(data: str | bytes) -> str | int | None:
+    """
+    The `id` of a JSON object message (as in JSON-RPC), to pair replies
+    with their requests.
+    """
+    try:
+        message = json.loads(data)
+    except ValueError:
+        return None
+    if isinstance(message, dict) and isinstance(message.get('id'), str | int):
+        return message['id']
+    return None
+
+
+class WebSocketSession:
+    """
+    A connection to a WebSocket endpoint.
+
+    Each received message is paired with a sent one to measure the round
+    trip: the sent message with the same JSON `id`, or else the oldest
+    unanswered one.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        on_message: Callable[[WebSocketMessage], None],
+        cookies: httpx.Cookies | None = None,
+    ) -> None:
+        self.request = request
+        self.on_message = on_message
+        self.cookies = cookies
+        self.messages: deque[WebSocketMessage] = deque(
+            maxlen=MESSAGES_BUFFER_SIZE
+        )
+        self.stats = WebSocketStats()
+        self._connection = None
+        self._pending_by_id: dict[str | int, float] = {}
+        self._pending: deque[float] = deque(maxlen=MESSAGES_BUFFER_SIZE)
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connection is not None
+
+    async def connect(self) -> None:
+        from websockets.asyncio.client import connect
+
+        # The URL, headers and auth are built like the ones of an HTTP send
+        httpx_request = self.request.model_copy(
+            update=dict(body_enabled=False)
+        ).to_httpx_req(cookies=self.cookies)
+        auth = self.request.to_httpx_auth()
+        if auth is not None:
+            await self._authorize(auth=auth, httpx_request=httpx_request)
+
+        ssl_context = None
+        if httpx_request.url.scheme == 'wss':
+            ssl_context = ssl.create_default_context()
+            if not self.request.options.verify_ssl:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+
+        self._connection = await connect(
+            str(httpx_request.url),
+            additional_headers=[
+                (key, value)
+                for key, value in httpx_request.headers.multi_items()
+                if key.lower() not in ('host', 'content-length')
+            ],
+            open_timeout=self.request.options.timeout,
+            ssl=ssl_context,
+        )
+
+    async def _authorize(
+        self, auth: httpx.Auth, httpx_request: httpx.Request
+    ) -> None:
+        """
+        Runs the auth flow up to the request itself; the requests it needs
+        before (e.g. an OAuth2 token request) are sent with the HTTP client.
+        """
+        from restiny.http_client import get_http_client
+
+        http_client = get_http_client(
+            http2=False,
+            verify_ssl=self.request.options.verify_ssl,
+            cookies=self.cookies,
+        )
+        auth_flow = auth.async_auth_flow(httpx_request)
+        try:
+            flow_request = await anext(auth_flow)
+            while flow_request is not httpx_request:
+                flow_response = await http_client.send(
+                    flow_request, follow_redirects=False
+                )
+                await flow_response.aread()
+                flow_request = await auth_flow.asend(flow_response)
+        finally:
+            await auth_flow.aclose()
+
+    async def receive_forever(self) -> None:
+        """
+        Receive messages until the connection is closed.
+        """
+        from websockets.exceptions import ConnectionClosed
+
+        try:
+            async for data in self._connection:
+                self._log_received(data)
+        except ConnectionClosed:
+            pass
+        finally:
+            self._connection = None
+
+    async def send(self, data: str) -> None:
+        await self._connection.send(data)
+
+        now = time.perf_counter()
+        correlation_id = _correlation_id(data)
+        if correlation_id is not None:
+            self._pending_by_id[correlation_id] = now
+            # Drop the oldest ones that never got a reply
+            while len(self._pending_by_id) > MESSAGES_BUFFER_SIZE:
+                del self._pending_by_id[next(iter(self._pending_by_id))]
+        else:
+            self._pending.append(now)
+
+        message = WebSocketMessage(
+            direction='sent', data=data, at=datetime.now()
+        )
+        self.stats.record_sent(message)
+        self._log(message)
+
+    async def replay(self, messages: list[str], rate: float) -> None:
+        """
+        Send `messages` in order at `rate` messages per second.
+        """
+        interval = 1 / rate
+        # Scheduled against the previous send time rather than sleeping a
+        # whole interval after each send, so slow sends don't add up as
+        # drift; when running late, the schedule restarts from now instead
+        # of bursting to catch up
+        next_send_at = time.perf_counter()
+        for message in messages:
+            await asyncio.sleep(max(next_send_at - time.perf_counter(), 0))
+            await self.send(message)
+            next_send_at = max(next_send_at + interval, time.perf_counter())
+
+    async def close(self) -> None:
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    def _log_received(self, data: str | bytes) -> None:
+        now = time.perf_counter()
+        sent_at = None
+        correlation_id = _correlation_id(data)
+        if correlation_id is not None:
+            sent_at = self._pending_by_id.pop(correlation_id, None)
+        if sent_at is None and self._pending:
+            sent_at = self._pending.popleft()
+
+        message = WebSocketMessage(
+            direction='received',
+            data=data,
+            at=datetime.now(),
+            rtt_ms=None if sent_at is None else (now - sent_at) * 1000,
+        )
+        self.stats.record_received(message)
+        self._log(message)
+
+    def _log(self, message: WebSocketMessage) -> None:
+        self.messages.append(message)
+        self.on_message(message)
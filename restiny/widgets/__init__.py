@@ -14,6 +14,7 @@ from restiny.widgets.dynamic_fields import (
 )
 from restiny.widgets.password_input import PasswordInput
 from restiny.widgets.path_chooser import PathChooser
+from restiny.widgets.variables_table import VariablesTable
 
 __all__ = [
     'TextDynamicField',
@@ -26,4 +27,5 @@ __all__ = [
     'CustomInput',
     'CollectionsTree',
     'ConfirmPrompt',
+    'VariablesTable',
 ]
@@ -3,14 +3,30 @@ from textual.widgets.tree import TreeNode
 
 from restiny.enums import HTTPMethod
 
+METHOD_TO_COLOR = {
+    HTTPMethod.GET: '#00cc66',  # green
+    HTTPMethod.POST: '#ffcc00',  # yellow
+    HTTPMethod.PUT: '#3388ff',  # blue
+    HTTPMethod.PATCH: '#00b3b3',  # teal
+    HTTPMethod.DELETE: '#ff3333',  # red
+    HTTPMethod.HEAD: '#808080',  # gray
+    HTTPMethod.OPTIONS: '#cc66ff',  # magenta
+    HTTPMethod.CONNECT: '#ff9966',  # orange
+    HTTPMethod.TRACE: '#6666ff',  # violet
+    'WS': '#ff66b3',  # pink
+}
+
 
 class CollectionsTree(Tree):
     show_root = False
     guide_depth = 3
 
     def on_mount(self) -> None:
-        self.node_by_id: dict[int | None, TreeNode] = {}
-        self.node_by_id[None] = self.root
+        # Folders and requests live in different tables, so their ids can
+        # collide and must be indexed separately.
+        self.folder_node_by_id: dict[int | None, TreeNode] = {}
+        self.request_node_by_id: dict[int, TreeNode] = {}
+        self.folder_node_by_id[None] = self.root
         self.root.data = {'name': '/', 'id': None}
 
     @property
@@ -31,45 +47,95 @@ class CollectionsTree(Tree):
             return self.cursor_node.parent
 
     def add_folder(
-        self, parent_node: TreeNode | None, name: str, id: int
+        self,
+        parent_node: TreeNode | None,
+        name: str,
+        id: int,
+        before: TreeNode | None = None,
     ) -> TreeNode:
         parent_node = parent_node or self.root
 
-        node = parent_node.add(label=name)
+        node = parent_node.add(label=name, before=before)
         node.data = {
             'name': name,
             'id': id,
         }
-        self.node_by_id[id] = node
+        self.folder_node_by_id[id] = node
         return node
 
     def add_request(
-        self, parent_node: TreeNode | None, method: str, name: str, id: int
+        self,
+        parent_node: TreeNode | None,
+        method: str,
+        name: str,
+        id: int,
+        before: TreeNode | None = None,
     ) -> TreeNode:
         parent_node = parent_node or self.root
 
-        method_to_color = {
-            HTTPMethod.GET: '#00cc66',  # green
-            HTTPMethod.POST: '#ffcc00',  # yellow
-            HTTPMethod.PUT: '#3388ff',  # blue
-            HTTPMethod.PATCH: '#00b3b3',  # teal
-            HTTPMethod.DELETE: '#ff3333',  # red
-            HTTPMethod.HEAD: '#808080',  # gray
-            HTTPMethod.OPTIONS: '#cc66ff',  # magenta
-            HTTPMethod.CONNECT: '#ff9966',  # orange
-            HTTPMethod.TRACE: '#6666ff',  # violet
-        }
         node = parent_node.add_leaf(
-            label=f'[{method_to_color[method]}]{method}[/] {name}'
+            label=self._request_label(method=method, name=name), before=before
         )
         node.data = {
             'method': method,
             'name': name,
             'id': id,
         }
-        self.node_by_id[id] = node
+        self.request_node_by_id[id] = node
+        return node
+
+    def add_load_more(self, parent_node: TreeNode) -> TreeNode:
+        node = parent_node.add_leaf(label='[dim i]Load more...[/]')
+        node.data = {
+            'id': None,
+            'load_more': True,
+        }
         return node
 
+    def is_load_more(self, node: TreeNode) -> bool:
+        return bool(node.data and node.data.get('load_more'))
+
+    def release_children(self, node: TreeNode) -> None:
+        for child_node in list(node.children):
+            self.remove(child_node)
+
+    def expanded_folder_ids(self, node: TreeNode) -> set[int]:
+        """
+        Ids of the expanded folders under the node, at any depth.
+        """
+        folder_ids = set()
+        for child_node in node.children:
+            if child_node.allow_expand and child_node.is_expanded:
+                folder_ids.add(child_node.data['id'])
+                folder_ids |= self.expanded_folder_ids(child_node)
+        return folder_ids
+
+    def update_folder(self, node: TreeNode, name: str) -> None:
+        if node.data['name'] == name:
+            return
+
+        node.data['name'] = name
+        node.set_label(name)
+
+    def update_request(self, node: TreeNode, method: str, name: str) -> None:
+        if node.data['method'] == method and node.data['name'] == name:
+            return
+
+        node.data['method'] = method
+        node.data['name'] = name
+        node.set_label(self._request_label(method=method, name=name))
+
     def remove(self, node: TreeNode) -> None:
-        del self.node_by_id[node.data['id']]
+        self._forget(node)
         node.remove()
+
+    def _forget(self, node: TreeNode) -> None:
+        if node.allow_expand:
+            self.folder_node_by_id.pop(node.data['id'], None)
+            for child_node in node.children:
+                self._forget(child_node)
+        elif not self.is_load_more(node):
+            self.request_node_by_id.pop(node.data['id'], None)
+
+    def _request_label(self, method: str, name: str) -> str:
+        return f'[{METHOD_TO_COLOR[method]}]{method}[/] {name}'
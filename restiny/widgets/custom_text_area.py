@@ -1,4 +1,3 @@
-import pyperclip
 from textual.binding import Binding
 from textual.events import Key, Paste
 from textual.widgets import TextArea
@@ -213,6 +212,9 @@ class CustomTextArea(TextArea, inherit_bindings=True):
         """
         if self.read_only:
             return
+
+        import pyperclip
+
         await super()._on_paste(event=Paste(text=pyperclip.paste()))
 
     # TODO: Refactor
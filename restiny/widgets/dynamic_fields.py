@@ -12,11 +12,14 @@ from textual.widget import Widget
 from textual.widgets import (
     Button,
     ContentSwitcher,
+    Input,
     RadioButton,
     RadioSet,
     Switch,
 )
+from textual.worker import Worker
 
+from restiny.profiler import timed
 from restiny.widgets import CustomInput
 from restiny.widgets.path_chooser import PathChooser
 
@@ -57,6 +60,14 @@ class DynamicField(Widget):
     @abstractmethod
     def is_filled(self) -> bool: ...
 
+    @abstractmethod
+    def fill(
+        self, enabled: bool, key: str, value: str | Path | None, **kwargs
+    ) -> None:
+        """
+        Set all the values of the (already mounted) field at once.
+        """
+
     class Enabled(Message):
         """
         Sent when the user enables the field.
@@ -206,6 +217,11 @@ class TextDynamicField(DynamicField):
     def is_empty(self) -> bool:
         return not self.is_filled
 
+    def fill(self, enabled: bool, key: str, value: str) -> None:
+        self.enabled = enabled
+        self.key = key
+        self.value = value
+
     @on(Switch.Changed, '#enabled')
     def on_enabled_or_disabled(self, message: Switch.Changed) -> None:
         if message.value is True:
@@ -392,6 +408,23 @@ class TextOrFileDynamicField(DynamicField):
     def is_empty(self) -> bool:
         return not self.is_filled
 
+    def fill(
+        self,
+        enabled: bool,
+        key: str,
+        value: str | Path | None,
+        value_kind: _ValueKind = _ValueKind.TEXT,
+    ) -> None:
+        self.enabled = enabled
+        self.key = key
+        self.value_kind = value_kind
+        if value_kind == _ValueKind.TEXT:
+            self.value_text_input.value = value
+            self.value_file_input.path = None
+        elif value_kind == _ValueKind.FILE:
+            self.value_text_input.value = ''
+            self.value_file_input.path = value
+
     @on(RadioSet.Changed, '#value-kind')
     def on_value_kind_changed(self, message: RadioSet.Changed) -> None:
         self.value_kind = _ValueKind(message.pressed.label)
@@ -467,6 +500,9 @@ class DynamicFields(Widget):
     ) -> None:
         super().__init__(*args, **kwargs)
         self._fields = fields
+        self._field_class = type(fields[-1])
+        self._pending_values: list[dict] | None = None
+        self._set_values_worker: Worker | None = None
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(can_focus=False):
@@ -477,9 +513,13 @@ class DynamicFields(Widget):
 
     @property
     def fields(self) -> list[DynamicField]:
-        return list(
-            field for field in self.query(DynamicField) if field.is_mounted
-        )
+        # Walks the container children instead of querying the DOM, as this
+        # is called for every field change
+        return [
+            field
+            for field in self.fields_container.children
+            if isinstance(field, DynamicField) and field.is_mounted
+        ]
 
     @property
     def empty_fields(self) -> list[DynamicField]:
@@ -497,6 +537,60 @@ class DynamicFields(Widget):
         else:
             await self.fields_container.mount(field)
 
+    @timed
+    async def set_values(self, values: list[dict]) -> None:
+        """
+        Replace the values of all the fields (plus the trailing empty one).
+
+        The fields already mounted are reused and the missing ones are
+        mounted in a single batch, so a single layout pass happens.
+        """
+        values = [*values, {'enabled': False, 'key': '', 'value': ''}]
+        fields = self.fields
+
+        with self.app.batch_update():
+            # The fields are filled programmatically, so their changes must
+            # not add/remove fields as when the user types
+            with self.prevent(
+                Input.Changed,
+                Switch.Changed,
+                RadioSet.Changed,
+                PathChooser.Changed,
+            ):
+                for field, value in zip(fields, values, strict=False):
+                    field.fill(**value)
+
+            if len(fields) > len(values):
+                await self.fields_container.remove_children(
+                    fields[len(values) :]
+                )
+            if len(values) > len(fields):
+                await self.fields_container.mount_all(
+                    [
+                        self._field_class(**value)
+                        for value in values[len(fields) :]
+                    ]
+                )
+
+    def queue_values(self, values: list[dict]) -> None:
+        """
+        Like `set_values`, but without waiting; values queued while a
+        previous set is running are coalesced and only the last is applied.
+        """
+        self._pending_values = values
+        if (
+            self._set_values_worker is None
+            or self._set_values_worker.is_finished
+        ):
+            self._set_values_worker = self.run_worker(
+                self._set_pending_values()
+            )
+
+    async def _set_pending_values(self) -> None:
+        while self._pending_values is not None:
+            values, self._pending_values = self._pending_values, None
+            await self.set_values(values)
+
     def remove_field(
         self, field: DynamicField, focus_neighbor: bool = False
     ) -> None:
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from itertools import count
+
+from rich.text import Text
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Horizontal
+from textual.message import Message
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.widgets import Button, DataTable, Input, Switch
+
+from restiny.widgets.custom_input import CustomInput
+
+
+class VariablesTable(Widget):
+    """
+    Table-style editor of key/value variables.
+
+    Only the rows visible in the table are rendered, so it scales to
+    thousands of variables; the highlighted row is edited in the inputs
+    below the table.
+    """
+
+    DEFAULT_CSS = """
+    VariablesTable {
+        width: auto;
+        height: 1fr;
+    }
+
+    VariablesTable > DataTable {
+        height: 1fr;
+        margin-top: 1;
+    }
+
+    VariablesTable > #editor {
+        height: auto;
+        layout: grid;
+        grid-size: 5 1;
+        grid-columns: auto 1fr 2fr auto auto; /* Set 1:2 ratio between Inputs */
+    }
+    """
+
+    class Changed(Message):
+        """
+        Sent when the user adds, edits or removes a variable.
+        """
+
+        def __init__(self, variables_table: VariablesTable) -> None:
+            super().__init__()
+            self.variables_table = variables_table
+
+        @property
+        def control(self) -> VariablesTable:
+            return self.variables_table
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._row_keys = count()
+        self._variable_by_row_key: dict[str, dict[str, str | bool]] = {}
+        self._saved_variable_by_row_key: dict[str, dict[str, str | bool]] = {}
+        self._filter_timer: Timer | None = None
+
+    def compose(self) -> ComposeResult:
+        yield CustomInput(
+            placeholder='Filter variables...',
+            select_on_focus=False,
+            id='filter',
+        )
+        yield DataTable(cursor_type='row', zebra_stripes=True, id='table')
+        with Horizontal(id='editor'):
+            yield Switch(tooltip='Use this variable?', id='enabled')
+            yield CustomInput(
+                placeholder='Key', select_on_focus=False, id='key'
+            )
+            yield CustomInput(
+                placeholder='Value', select_on_focus=False, id='value'
+            )
+            yield Button(label='➕', tooltip='Add variable', id='add')
+            yield Button(label='➖', tooltip='Remove variable', id='remove')
+
+    def on_mount(self) -> None:
+        self.filter_input = self.query_one('#filter', CustomInput)
+        self.table = self.query_one('#table', DataTable)
+        self.enabled_switch = self.query_one('#enabled', Switch)
+        self.key_input = self.query_one('#key', CustomInput)
+        self.value_input = self.query_one('#value', CustomInput)
+        self.add_button = self.query_one('#add', Button)
+        self.remove_button = self.query_one('#remove', Button)
+
+        self.table.add_column('', width=1, key='changed')
+        self.table.add_column('On', width=2, key='enabled')
+        self.table.add_column('Key', key='key')
+        self.table.add_column('Value', key='value')
+        self._sync_editor()
+
+    @property
+    def variables(self) -> list[dict[str, str | bool]]:
+        return [
+            dict(variable)
+            for variable in self._variable_by_row_key.values()
+            if variable['key'] or variable['value']
+        ]
+
+    @property
+    def is_dirty(self) -> bool:
+        current = [
+            (row_key, variable)
+            for row_key, variable in self._variable_by_row_key.items()
+            if variable['key'] or variable['value']
+        ]
+        return current != list(self._saved_variable_by_row_key.items())
+
+    def set_variables(self, variables: list[dict[str, str | bool]]) -> None:
+        self._variable_by_row_key = {
+            str(next(self._row_keys)): dict(variable) for variable in variables
+        }
+        self.mark_saved()
+
+    def mark_saved(self) -> None:
+        """
+        Take the current variables as the saved ones (i.e. not changed).
+        """
+        self._saved_variable_by_row_key = {
+            row_key: dict(variable)
+            for row_key, variable in self._variable_by_row_key.items()
+            if variable['key'] or variable['value']
+        }
+        self._variable_by_row_key = {
+            row_key: variable
+            for row_key, variable in self._variable_by_row_key.items()
+            if variable['key'] or variable['value']
+        }
+        self._populate_table()
+
+    @property
+    def _selected_row_key(self) -> str | None:
+        if not self.table.is_valid_coordinate(self.table.cursor_coordinate):
+            return None
+
+        row_key, _ = self.table.coordinate_to_cell_key(
+            self.table.cursor_coordinate
+        )
+        return row_key.value
+
+    def _matches_filter(self, variable: dict[str, str | bool]) -> bool:
+        needle = self.filter_input.value.lower()
+        return (
+            needle in variable['key'].lower()
+            or needle in variable['value'].lower()
+        )
+
+    def _row_cells(self, row_key: str) -> tuple[Text, Text, Text, Text]:
+        variable = self._variable_by_row_key[row_key]
+        changed = variable != self._saved_variable_by_row_key.get(row_key)
+        return (
+            Text('●' if changed else '', style='bold yellow'),
+            Text('✓' if variable['enabled'] else ''),
+            Text(variable['key']),
+            Text(variable['value']),
+        )
+
+    def _populate_table(self, select_row_key: str | None = None) -> None:
+        self.table.clear()
+        for row_key, variable in self._variable_by_row_key.items():
+            if self._matches_filter(variable):
+                self.table.add_row(*self._row_cells(row_key), key=row_key)
+
+        if select_row_key is not None and select_row_key in self.table.rows:
+            self.table.move_cursor(
+                row=self.table.get_row_index(select_row_key)
+            )
+        self._sync_editor()
+
+    def _sync_editor(self) -> None:
+        row_key = self._selected_row_key
+        with self.prevent(Input.Changed, Switch.Changed):
+            if row_key is None:
+                self.enabled_switch.value = False
+                self.key_input.value = ''
+                self.value_input.value = ''
+            else:
+                variable = self._variable_by_row_key[row_key]
+                self.enabled_switch.value = variable['enabled']
+                self.key_input.value = variable['key']
+                self.value_input.value = variable['value']
+
+        is_row_selected = row_key is not None
+        self.enabled_switch.disabled = not is_row_selected
+        self.key_input.disabled = not is_row_selected
+        self.value_input.disabled = not is_row_selected
+        self.remove_button.disabled = not is_row_selected
+
+    @on(Input.Changed, '#filter')
+    def _on_filter_changed(self, message: Input.Changed) -> None:
+        # Rebuilding the table takes a while for thousands of variables, so
+        # it only happens once the user pauses typing
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            delay=0.2,
+            callback=lambda: self._populate_table(
+                select_row_key=self._selected_row_key
+            ),
+        )
+
+    @on(DataTable.RowHighlighted, '#table')
+    def _on_row_highlighted(self, message: DataTable.RowHighlighted) -> None:
+        self._sync_editor()
+
+    @on(DataTable.RowSelected, '#table')
+    def _on_row_selected(self, message: DataTable.RowSelected) -> None:
+        self.key_input.focus()
+
+    @on(Switch.Changed, '#enabled')
+    @on(Input.Changed, '#key')
+    @on(Input.Changed, '#value')
+    def _on_editor_changed(
+        self, message: Switch.Changed | Input.Changed
+    ) -> None:
+        row_key = self._selected_row_key
+        if row_key is None:
+            return
+
+        variable = self._variable_by_row_key[row_key]
+        variable['enabled'] = self.enabled_switch.value
+        variable['key'] = self.key_input.value
+        variable['value'] = self.value_input.value
+
+        for column_key, cell in zip(
+            ('changed', 'enabled', 'key', 'value'),
+            self._row_cells(row_key),
+            strict=True,
+        ):
+            self.table.update_cell(row_key, column_key, cell)
+        self.post_message(message=self.Changed(variables_table=self))
+
+    @on(Button.Pressed, '#add')
+    def _on_add(self, message: Button.Pressed) -> None:
+        row_key = str(next(self._row_keys))
+        self._variable_by_row_key[row_key] = {
+            'enabled': True,
+            'key': '',
+            'value': '',
+        }
+        # An empty variable never matches a filter, so clear it to show it
+        with self.prevent(Input.Changed):
+            self.filter_input.value = ''
+        self._populate_table(select_row_key=row_key)
+        self.key_input.focus()
+
+    @on(Button.Pressed, '#remove')
+    def _on_remove(self, message: Button.Pressed) -> None:
+        row_key = self._selected_row_key
+        if row_key is None:
+            return
+
+        del self._variable_by_row_key[row_key]
+        self.table.remove_row(row_key)
+        self._sync_editor()
+        self.post_message(message=self.Changed(variables_table=self))